@@ -39,9 +39,8 @@ def main():
     """
     game = Controller()
 
-    while game.run():
-        game = Controller()  # reinitialize controller
-        logger.info("Restarting game...")  # run returns true if player wants to restart
+    while game.run():  # run returns true if player wants to restart
+        game.restart()
 
     logger.info("Game ended")
 
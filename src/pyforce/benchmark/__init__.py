@@ -0,0 +1,7 @@
+"""
+A submodule containing reproducible stress scenarios and the benchmark runner.
+"""
+
+from .scenarios import SCENARIOS, Scenario
+
+__all__ = ["SCENARIOS", "Scenario"]
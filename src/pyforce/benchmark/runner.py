@@ -0,0 +1,258 @@
+"""
+This module contains the benchmark runner which measures Model.update and View.render on stress scenarios.
+"""
+
+import argparse
+import copy
+import dataclasses
+import datetime
+import json
+import os
+import platform
+import posixpath
+import sys
+import time
+
+import pygame
+import pymunk
+from loguru import logger
+
+from pyforce.constants import Difficulty, Direction, GameState
+from pyforce.controller.scripted_input import ScriptedInput
+from pyforce.model import Model
+from pyforce.profiling import FrameProfiler
+from pyforce.structures import PlayerStats
+
+from .scenarios import SCENARIOS, Scenario
+
+PERCENTILES = (50, 90, 99)
+
+
+def run_scenario(scenario: Scenario, settings: dict, render: bool = True) -> dict:
+    """
+    Runs a single scenario and measures the duration of every frame.
+
+    :param scenario: The Scenario to run.
+    :param settings: Dictionary containing game settings.
+    :param render: Whether to render every frame with the View.
+    :return: A dictionary with frame time statistics of the scenario.
+    """
+    logger.info(f"Running scenario {scenario.name}...")
+
+    settings = _prepare_settings(scenario, settings)
+
+    profiler = FrameProfiler(scenario.frames)
+    player_stats = PlayerStats(difficulty=Difficulty.NORMAL, username="benchmark")
+
+    view = None
+    if render:
+        # imported here, so model-only runs don't need pygame_menu and pyscroll
+        from pyforce.view import View
+
+        view = View(settings, profiler)
+
+    model = Model(settings, player_stats, profiler, scenario.seed)
+    model.apply_difficulty(Difficulty.NORMAL)
+    _prepare_model(model, scenario)
+
+    input_source = ScriptedInput(list(scenario.inputs))
+    update_times = []
+    render_times = []
+
+    for frame in range(scenario.warmup + scenario.frames):
+        if frame == scenario.warmup:
+            profiler.reset()
+
+        mouse_pos = input_source.handle(model)
+        if scenario.particles_per_frame > 0:
+            model.effects.add_particles(
+                scenario.particles_per_frame,
+                model.entities.player.get_position(),
+                Direction.RIGHT,
+                "player",
+            )
+
+        start = time.perf_counter()
+        model.update(mouse_pos)
+        updated = time.perf_counter()
+
+        if view is not None:
+            info = model.get_render_info()
+            info.game_state = GameState.PLAYING
+            info.player_stats = player_stats
+            view.render(info)
+        rendered = time.perf_counter()
+
+        if frame >= scenario.warmup:
+            update_times.append(updated - start)
+            render_times.append(rendered - updated)
+
+    result = {
+        "name": scenario.name,
+        "map": scenario.map_name,
+        "spatial_hash": scenario.spatial_hash,
+        "enemies": len(model.entities.enemies),
+        "bullets": len(model.entities.bullets_dict),
+        "particles": len(model.effects.particles),
+        "frames": scenario.frames,
+        "update": _summarize(update_times),
+        "stages": profiler.averages(),
+    }
+    if view is not None:
+        result["render"] = _summarize(render_times)
+        # the dummy video driver can't create a second scaled window on top of this one
+        pygame.display.quit()
+    return result
+
+
+def run_benchmark(
+    scenarios: list[Scenario], settings: dict, render: bool = True
+) -> dict:
+    """
+    Runs all given scenarios one after another.
+
+    :param scenarios: A list of Scenario instances.
+    :param settings: Dictionary containing game settings.
+    :param render: Whether to render every frame with the View.
+    :return: A dictionary with environment information and the results of all scenarios.
+    """
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "pymunk": pymunk.version,
+        "render": render,
+        "scenarios": [
+            run_scenario(scenario, settings, render) for scenario in scenarios
+        ],
+    }
+
+
+def _prepare_settings(scenario: Scenario, settings: dict) -> dict:
+    """
+    Creates a copy of the settings adjusted for the scenario.
+
+    :param scenario: The Scenario to run.
+    :param settings: Dictionary containing game settings.
+    :return: The adjusted copy of the settings.
+    """
+    settings = copy.deepcopy(settings)
+    map_dir = posixpath.dirname(settings["map"]["map_path"])
+    settings["map"]["map_path"] = posixpath.join(map_dir, scenario.map_name)
+
+    # the player must survive the whole run, the overlay would be measured too
+    settings["debug"]["player_immortal"] = True
+    settings["debug"]["show_fps"] = False
+    settings["physics"]["spatial_hash"]["enabled"] = scenario.spatial_hash
+    return settings
+
+
+def _prepare_model(model: Model, scenario: Scenario):
+    """
+    Spawns the scenario's enemies and equips the player's weapon.
+
+    :param model: The Model instance.
+    :param scenario: The Scenario to run.
+    :return: None
+    """
+    for _ in range(scenario.enemies):
+        model.entities.spawn_random_enemy()
+
+    player = model.entities.player
+    if scenario.gun not in player.guns_available:
+        player.guns_available.append(scenario.gun)
+    player.gun_held = scenario.gun
+
+
+def _summarize(durations: list[float]) -> dict:
+    """
+    Calculates frame time statistics.
+
+    :param durations: A list of frame durations in seconds.
+    :return: A dictionary with mean, percentiles and max, in milliseconds.
+    """
+    ordered = sorted(duration * 1000 for duration in durations)
+    summary = {"mean": sum(ordered) / len(ordered)}
+    for percentile in PERCENTILES:
+        # nearest-rank percentile
+        index = max(0, -(-percentile * len(ordered) // 100) - 1)
+        summary[f"p{percentile}"] = ordered[index]
+    summary["max"] = ordered[-1]
+    return summary
+
+
+def _load_settings(path: str | None) -> dict:
+    """
+    Loads the settings. Defaults to the settings shipped with the package,
+    so results don't depend on local changes.
+
+    :param path: Path to a settings file, or None.
+    :return: Dictionary containing game settings.
+    """
+    if path is None:
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        path = os.path.join(script_dir, "settings", "settings.json")
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _parse_args(argv):
+    """
+    Parses the command line arguments of the benchmark runner.
+
+    :param argv: A list of arguments, without the program name.
+    :return: An argparse.Namespace instance.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark pyforce scenarios.")
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        default=list(SCENARIOS),
+        choices=list(SCENARIOS),
+        help="scenarios to run, all by default",
+    )
+    parser.add_argument("--frames", type=int, default=None, help="measured frames")
+    parser.add_argument(
+        "--no-render", action="store_true", help="measure Model.update only"
+    )
+    parser.add_argument("--output", default=None, help="JSON file for the results")
+    parser.add_argument("--settings", default=None, help="path to the settings file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Command line entry point of the benchmark runner.
+
+    :param argv: A list of arguments, defaults to sys.argv.
+    :return: None
+    """
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    # render off-screen, the display would limit the frame rate
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    settings = _load_settings(args.settings)
+    scenarios = [SCENARIOS[name] for name in args.scenario]
+    if args.frames is not None:
+        scenarios = [
+            dataclasses.replace(scenario, frames=args.frames) for scenario in scenarios
+        ]
+
+    results = run_benchmark(scenarios, settings, render=not args.no_render)
+
+    output = json.dumps(results, indent=4)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+This module defines the reproducible stress scenarios used by the benchmark runner.
+"""
+
+from dataclasses import dataclass, field, replace
+
+from pyforce.structures import FrameInput
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    The Scenario dataclass describes one benchmark workload.
+
+    Attributes:
+        name (str): Unique name of the scenario.
+        map_name (str): File name of the TMX map in the maps directory.
+        enemies (int): Number of extra enemies spawned with EntityManager.spawn_random_enemy.
+        gun (str): Name of the weapon held by the player.
+        particles_per_frame (int): Number of particles added with EffectsManager.add_particles every frame.
+        inputs (tuple[FrameInput, ...]): The looping input script of the player.
+        frames (int): Number of measured frames.
+        warmup (int): Number of frames run before measuring.
+        seed (int): Seed for the random number generator.
+        spatial_hash (bool): Whether the physics space uses the spatial hash broadphase.
+    """
+
+    name: str
+    map_name: str = "map3.tmx"
+    enemies: int = 0
+    gun: str = "base"
+    particles_per_frame: int = 0
+    inputs: tuple[FrameInput, ...] = field(default_factory=tuple)
+    frames: int = 600
+    warmup: int = 60
+    seed: int = 0
+    spatial_hash: bool = False
+
+
+# run right and left across the level while shooting to the right
+PATROL_AND_SHOOT = tuple(
+    [FrameInput(frozenset({"move_right", "shoot"}), (900, 300))] * 120
+    + [FrameInput(frozenset({"move_left", "shoot"}), (900, 300))] * 120
+)
+
+BASE_SCENARIOS = [
+    Scenario("map1-idle", map_name="map.tmx"),
+    Scenario("map2-idle", map_name="map2.tmx"),
+    Scenario("map3-idle", map_name="map3.tmx"),
+    Scenario("enemies-10", enemies=10),
+    Scenario("enemies-25", enemies=25),
+    Scenario("enemies-50", enemies=50),
+    Scenario("enemies-100", enemies=100),
+    Scenario("shotgun", enemies=10, gun="shotgun", inputs=PATROL_AND_SHOOT),
+    Scenario("particles", particles_per_frame=300),
+    Scenario(
+        "combined",
+        enemies=50,
+        gun="shotgun",
+        particles_per_frame=300,
+        inputs=PATROL_AND_SHOOT,
+    ),
+]
+
+# the same physics-heavy workloads with the spatial hash broadphase, to find where it pays off
+SPATIAL_HASH_SCENARIOS = [
+    replace(scenario, name=f"{scenario.name}-hash", spatial_hash=True)
+    for scenario in BASE_SCENARIOS
+    if scenario.name
+    in ["map3-idle", "enemies-10", "enemies-25", "enemies-50", "enemies-100", "shotgun"]
+]
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in BASE_SCENARIOS + SPATIAL_HASH_SCENARIOS
+}
@@ -3,16 +3,21 @@ A submodule used for storing enum/constants used by other modules.
 """
 
 from .direction import Direction
-from .enemy_enum import EnemyAction, EnemyName
+from .enemy_enum import ActivityTier, EnemyAction, EnemyName
 from .game_state import GameMode, GameState, Difficulty
+from .navigation_enum import NavLinkType
 from .state_name import StateName
+from .weapon_enum import AmmoMode
 
 __all__ = [
+    "ActivityTier",
+    "AmmoMode",
     "Direction",
     "EnemyAction",
     "EnemyName",
     "GameMode",
     "GameState",
     "Difficulty",
+    "NavLinkType",
     "StateName",
 ]
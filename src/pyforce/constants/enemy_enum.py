@@ -33,6 +33,21 @@ class EnemyAction(Enum):
     DEATH = "death"
 
 
+class ActivityTier(Enum):
+    """
+    Enum representing how much simulation an enemy gets, based on its distance from the player.
+
+    Attributes:
+        ACTIVE (str): Near or on screen, full AI every step.
+        DORMANT (str): Off screen, AI decisions only every few steps.
+        ASLEEP (str): Far away, no AI and the physics body is put to sleep.
+    """
+
+    ACTIVE = "active"
+    DORMANT = "dormant"
+    ASLEEP = "asleep"
+
+
 def get_enemy_name(name) -> EnemyName:
     """
     Converts a string to its corresponding EnemyName enum value.
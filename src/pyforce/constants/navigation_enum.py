@@ -0,0 +1,20 @@
+"""
+This module defines the enums used by the enemies' navigation graph.
+"""
+
+from enum import Enum
+
+
+class NavLinkType(Enum):
+    """
+    Enum representing the ways an enemy can get from one platform to another.
+
+    Attributes:
+        WALK (str): The platforms touch, the enemy walks over.
+        JUMP (str): The enemy jumps from the takeoff point.
+        DROP (str): The enemy walks off the edge and falls down.
+    """
+
+    WALK = "walk"
+    JUMP = "jump"
+    DROP = "drop"
@@ -0,0 +1,21 @@
+"""
+This module defines the enums used by weapons and their ammunition.
+"""
+
+from enum import Enum
+
+
+class AmmoMode(Enum):
+    """
+    Enum representing how the bullets of an ammunition move and hit.
+
+    Attributes:
+        PHYSICS (str): Bullets are rigid bodies in the physics simulation, hits come from collision callbacks.
+        SWEPT (str): Bullets have no body in the simulation, every step a segment query covers
+            the distance they travel.
+        HITSCAN (str): A single segment query up to the weapon's reach resolves the shot when it is fired.
+    """
+
+    PHYSICS = "physics"
+    SWEPT = "swept"
+    HITSCAN = "hitscan"
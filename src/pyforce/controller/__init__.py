@@ -3,5 +3,7 @@ This module initializes the game_state package and exports the Controller class.
 """
 
 from .controller import Controller
+from .headless_controller import HeadlessController
+from .scripted_input import ScriptedInput
 
-__all__ = ["Controller"]
+__all__ = ["Controller", "HeadlessController", "ScriptedInput"]
@@ -0,0 +1,207 @@
+"""
+This module contains the batch runner which plays many headless games in parallel processes.
+"""
+
+import argparse
+import copy
+import itertools
+import json
+import posixpath
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from loguru import logger
+
+from pyforce.constants import Difficulty, GameMode
+from pyforce.structures import BatchGame
+
+from .headless_controller import HeadlessController
+from .json_manager import JSONManager
+from .scripted_input import ScriptedInput
+
+
+def run_game(game: BatchGame, settings: dict) -> dict:
+    """
+    Plays a single headless game. Runs inside a worker process.
+
+    :param game: The BatchGame describing the game.
+    :param settings: Dictionary containing game settings.
+    :return: A record in the format written by JSONManager.append_record, extended with timing stats.
+    """
+    settings = copy.deepcopy(settings)
+    map_dir = posixpath.dirname(settings["map"]["map_path"])
+    settings["map"]["map_path"] = posixpath.join(map_dir, game.map_name)
+
+    start = time.perf_counter()
+    controller = HeadlessController(
+        settings,
+        game_mode=game.game_mode,
+        difficulty=game.difficulty,
+        input_source=ScriptedInput(list(game.inputs)),
+        username=f"batch-{game.seed}",
+        seed=game.seed,
+    )
+    setup_time = time.perf_counter() - start
+
+    stats = controller.run(game.max_frames)
+    wall_time = time.perf_counter() - start - setup_time
+    simulated_time = stats.time_elapsed / 1000
+
+    record = JSONManager.stats_to_record(stats)
+    record.update(
+        {
+            "seed": game.seed,
+            "map": game.map_name,
+            "frames": controller.frames,
+            "player_alive": controller.model.entities.player is not None,
+            "setup_time": setup_time,
+            "wall_time": wall_time,
+            "speedup": simulated_time / wall_time if wall_time > 0 else None,
+        }
+    )
+    return record
+
+
+def run_batch(
+    games: list[BatchGame], settings: dict, workers: int | None = None
+) -> list[dict]:
+    """
+    Plays all given games across a process pool.
+
+    :param games: A list of BatchGame instances.
+    :param settings: Dictionary containing game settings.
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+    :return: A list of records, in the same order as the games.
+    """
+    logger.info(f"Running {len(games)} headless games...")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        records = list(pool.map(run_game, games, itertools.repeat(settings)))
+
+    logger.info(f"Batch of {len(games)} games finished")
+    return records
+
+
+def create_games(
+    count: int,
+    seed: int,
+    difficulties: list[Difficulty],
+    game_modes: list[GameMode],
+    map_names: list[str],
+    max_frames: int | None,
+) -> list[BatchGame]:
+    """
+    Creates game configurations cycling through every combination of mode, difficulty and map.
+
+    :param count: Number of games to create.
+    :param seed: Seed of the first game, each next game gets the next integer.
+    :param difficulties: Difficulties to cycle through.
+    :param game_modes: Game modes to cycle through.
+    :param map_names: Map file names to cycle through.
+    :param max_frames: Frame limit of each game.
+    :return: A list of BatchGame instances.
+    """
+    combinations = list(itertools.product(game_modes, difficulties, map_names))
+
+    games = []
+    for i in range(count):
+        game_mode, difficulty, map_name = combinations[i % len(combinations)]
+        games.append(
+            BatchGame(
+                seed=seed + i,
+                difficulty=difficulty,
+                game_mode=game_mode,
+                map_name=map_name,
+                max_frames=max_frames,
+            )
+        )
+    return games
+
+
+def _init_worker():
+    """
+    Limits the logging of worker processes to warnings, so games don't flood the output.
+
+    :return: None
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+
+def _parse_args(argv):
+    """
+    Parses the command line arguments of the batch runner.
+
+    :param argv: A list of arguments, without the program name.
+    :return: An argparse.Namespace instance.
+    """
+    parser = argparse.ArgumentParser(description="Run many headless pyforce games.")
+    parser.add_argument("--games", type=int, default=8, help="number of games")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument(
+        "--difficulty",
+        nargs="+",
+        default=[Difficulty.NORMAL.value],
+        choices=[d.value for d in Difficulty],
+    )
+    parser.add_argument(
+        "--mode",
+        nargs="+",
+        default=[GameMode.INFINITE.value],
+        choices=[m.value for m in GameMode],
+    )
+    parser.add_argument("--maps", nargs="+", default=["map3.tmx"])
+    parser.add_argument(
+        "--max-frames", type=int, default=10000, help="frame limit of a game"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=None, help="JSON lines file for records")
+    parser.add_argument("--settings", default=None, help="path to the settings file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Command line entry point of the batch runner.
+
+    :param argv: A list of arguments, defaults to sys.argv.
+    :return: None
+    """
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    json_manager = JSONManager()
+    if args.settings is not None:
+        json_manager.path = args.settings
+        json_manager.load()
+    settings = json_manager.settings
+    games = create_games(
+        count=args.games,
+        seed=args.seed,
+        difficulties=[Difficulty(d) for d in args.difficulty],
+        game_modes=[GameMode(m) for m in args.mode],
+        map_names=args.maps,
+        max_frames=args.max_frames,
+    )
+
+    start = time.perf_counter()
+    records = run_batch(games, settings, args.workers)
+    total_time = time.perf_counter() - start
+
+    lines = [json.dumps(record) for record in records]
+    if args.output is not None:
+        with open(args.output, "a") as f:
+            f.write("\n".join(lines) + "\n")
+        logger.info(f"Records saved to {args.output}")
+    else:
+        print("\n".join(lines))
+
+    simulated = sum(record["time_elapsed"] for record in records)
+    logger.info(
+        f"Simulated {simulated:.1f}s of gameplay in {total_time:.1f}s "
+        f"({simulated / total_time:.1f}x real time)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,21 @@
 This module contains the Controller class which is the main entry point for the game logic.
 """
 
+import os
+
 import pygame
 
 from pyforce.model import Model
 from pyforce.view import View
 
-from pyforce.structures import PlayerStats
+from pyforce.structures import PlayerStats, FrameInput, Replay
 from pyforce.constants import GameState, GameMode
+from pyforce.profiling import FrameProfiler
 
 from .input_handler import InputHandler
 from .json_manager import JSONManager
+from .fixed_step_clock import FixedStepClock
+from .replay import save_replay, replay_path
 
 from loguru import logger
 
@@ -25,9 +30,12 @@ class Controller:
         settings (dict): Dictionary containing game settings.
         view (View): Handles game rendering.
         model (Model): Manages game data and logic.
-        fps (pygame.time.Clock): Controls the game's frame rate.
+        fps (pygame.time.Clock): Controls the game's render rate (settings["fps"]).
+        clock (FixedStepClock): Schedules model steps at the physics rate (settings["physics"]["time_step"]).
+        profiler (FrameProfiler): Times model and render stages, shared by the model and the view.
         input_handler (InputHandler): Processes user input.
         game_state (GameState): Current state of the game.
+        recorded_inputs (list[FrameInput] | None): Input of every model step, None if recording is off.
         running (bool): Flag to keep the game loop running.
     """
 
@@ -43,18 +51,51 @@ class Controller:
         self.settings = self.json_manager.settings
         self.player_stats = PlayerStats()
 
-        self.view = View(self.settings)
-        self.model = Model(self.settings, self.player_stats)
+        self.profiler = FrameProfiler(
+            self.settings["debug"]["profiler"]["buffer_size"],
+            enabled=self.settings["debug"]["show_fps"],
+        )
+        self.view = View(self.settings, self.profiler)
+        self.model = Model(self.settings, self.player_stats, self.profiler)
 
         self.fps = pygame.time.Clock()
+        self._start_game()
+
+    def restart(self):
+        """
+        Prepares a new game without reloading anything: the window, sprites, map and
+        static collision geometry are kept, only the game state is created again.
+
+        :return: None
+        """
+        logger.info("Restarting game...")
+
+        self.player_stats = PlayerStats()
+        self.model.reset(self.player_stats)
+        self.view.reset()
+        self.profiler.reset()
+        self._start_game()
+
+    def _start_game(self):
+        """
+        Resets the per-game state of the controller.
+
+        :return: None
+        """
+        self.clock = FixedStepClock(
+            self.settings["physics"]["time_step"],
+            self.settings["physics"]["max_steps_per_frame"],
+        )
         self.input_handler = InputHandler(self)
         self.game_state = GameState.MENU
+        self.recorded_inputs = [] if self.settings["replay"]["record"] else None
 
         self.running = False
 
     def run(self):
         """
         Starts and manages the main game loop.
+        The model is stepped at a fixed rate, independent of the render rate.
 
         :return: None
         """
@@ -63,21 +104,46 @@ class Controller:
         while self.running and not self.model.game_ended(self.player_stats.game_mode):
             self._update_player_stats()
 
-            self.view.render(self._prepare_render_info())
-
             if self.game_state == GameState.PLAYING:
                 # only update the model if the game is running
-                self.model.update(pygame.mouse.get_pos())
+                self._step_model(self.clock.advance())
+            else:
+                self.clock.hold()
+
+            if self.model.game_ended(self.player_stats.game_mode):
+                break
+
+            self.view.render(self._prepare_render_info())
 
             if self.game_state in [GameState.MENU, GameState.PAUSE]:
                 self.input_handler.handle_menu_clicks(self.view.ui)
 
-            self.input_handler.handle()
+            self.input_handler.handle_events()
 
             self.fps.tick(self.settings["fps"])
+            self.profiler.frame()
 
+        self._save_replay()
         return self._should_restart()
 
+    def _step_model(self, steps: int):
+        """
+        Runs the given number of fixed model steps, reading held keys before each one.
+
+        :param steps: The number of model steps to run.
+        :return: None
+        """
+        for _ in range(steps):
+            actions = self.input_handler.handle_keys()
+            if self.game_state != GameState.PLAYING:
+                return
+            mouse_pos = pygame.mouse.get_pos()
+            if self.recorded_inputs is not None:
+                self.recorded_inputs.append(FrameInput(actions, mouse_pos))
+            self.model.update(mouse_pos)
+            if self.model.game_ended(self.player_stats.game_mode):
+                return
+
     def _should_restart(self):
         """
         Determines if the game should restart based on user input after the game ends.
@@ -94,6 +160,28 @@ class Controller:
         self.view.ui.start_restart_mainloop()
         return self.view.ui.restart
 
+    def _save_replay(self):
+        """
+        Saves the recorded input together with the model's seed, if recording is on.
+
+        :return: None
+        """
+        if not self.recorded_inputs:
+            return
+
+        replay = Replay(
+            seed=self.model.seed,
+            difficulty=self.player_stats.difficulty,
+            game_mode=self.player_stats.game_mode,
+            map_name=os.path.basename(self.settings["map"]["map_path"]),
+            frames=self.recorded_inputs,
+        )
+        save_replay(
+            replay_path(self.settings),
+            replay,
+            self.settings["replay"]["keyframe_interval"],
+        )
+
     def _save_score(self):
         """
         Helper method to ask whether to save and save the player's score if applicable.
@@ -113,6 +201,7 @@ class Controller:
         info = self.model.get_render_info()
         info.game_state = self.game_state
         info.player_stats = self.player_stats
+        info.alpha = self.clock.alpha()
         return info
 
     def _can_save_score(self):
@@ -0,0 +1,99 @@
+"""
+This module contains the FixedStepClock class which decouples model updates from the render rate.
+"""
+
+import time
+
+
+class FixedStepClock:
+    """
+    The FixedStepClock class accumulates real elapsed time and converts it into a number
+    of fixed-length model steps, so the simulation speed does not depend on the frame rate.
+
+    Attributes:
+        time_step (float): Duration of a single model step, in seconds.
+        max_steps (int): Maximum number of steps run in one frame, prevents the spiral of death.
+        accumulator (float): Real time not yet consumed by model steps, in seconds.
+        last_time (float): Timestamp of the previous call to advance.
+        step_rate (float): Measured model steps per second.
+        render_rate (float): Measured rendered frames per second.
+    """
+
+    def __init__(self, time_step: float, max_steps: int):
+        """
+        Initializes the FixedStepClock.
+
+        :param time_step: Duration of a single model step, in seconds.
+        :param max_steps: Maximum number of catch-up steps per frame.
+        :return: None
+        """
+        self.time_step = time_step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+
+        self.step_rate = 0.0
+        self.render_rate = 0.0
+        self._window_start = self.last_time
+        self._window_steps = 0
+        self._window_frames = 0
+
+    def advance(self) -> int:
+        """
+        Adds the real time elapsed since the previous call and returns how many
+        model steps are due. Time beyond max_steps is dropped.
+
+        :return: The number of model steps to run this frame.
+        """
+        now = time.perf_counter()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator // self.time_step)
+        if steps > self.max_steps:
+            # we can't keep up, drop the backlog instead of falling further behind
+            steps = self.max_steps
+            self.accumulator %= self.time_step
+        else:
+            self.accumulator -= steps * self.time_step
+
+        self._measure(now, steps)
+        return steps
+
+    def hold(self):
+        """
+        Consumes the elapsed time without producing steps, used while the game is paused or in a menu.
+
+        :return: None
+        """
+        now = time.perf_counter()
+        self.accumulator = 0.0
+        self.last_time = now
+        self._measure(now, 0)
+
+    def alpha(self) -> float:
+        """
+        Returns how far real time is between the last model step and the next one.
+
+        :return: A value in the range <0, 1).
+        """
+        return self.accumulator / self.time_step
+
+    def _measure(self, now, steps):
+        """
+        Counts steps and frames and refreshes the measured rates once per second.
+
+        :param now: The current timestamp.
+        :param steps: The number of steps run this frame.
+        :return: None
+        """
+        self._window_steps += steps
+        self._window_frames += 1
+
+        elapsed = now - self._window_start
+        if elapsed >= 1:
+            self.step_rate = self._window_steps / elapsed
+            self.render_rate = self._window_frames / elapsed
+            self._window_start = now
+            self._window_steps = 0
+            self._window_frames = 0
@@ -0,0 +1,99 @@
+"""
+This module contains the HeadlessController class which runs the game logic without a display.
+"""
+
+from loguru import logger
+
+from pyforce.constants import Difficulty, GameMode
+from pyforce.model import Model
+from pyforce.structures import PlayerStats
+
+from .json_manager import JSONManager
+from .scripted_input import ScriptedInput
+
+
+class HeadlessController:
+    """
+    The HeadlessController class steps the Model as fast as possible, without a View,
+    a window or a frame rate limit. Input comes from a ScriptedInput instead of the keyboard.
+
+    Attributes:
+        settings (dict): Dictionary containing game settings.
+        player_stats (PlayerStats): Statistics of the simulated game.
+        model (Model): Manages game data and logic.
+        input_source (ScriptedInput): Provides the input for every frame.
+        frames (int): Number of model updates performed so far.
+    """
+
+    def __init__(
+        self,
+        settings: dict | None = None,
+        game_mode: GameMode = GameMode.INFINITE,
+        difficulty: Difficulty = Difficulty.NORMAL,
+        input_source: ScriptedInput | None = None,
+        username: str = "headless",
+        seed: int | None = None,
+    ):
+        """
+        Initializes the HeadlessController with a model ready to be stepped.
+
+        :param settings: Dictionary containing game settings. Loaded from the settings file if None.
+        :param game_mode: The GameMode to simulate.
+        :param difficulty: The Difficulty to apply.
+        :param input_source: The ScriptedInput to read input from. No input if None.
+        :param username: The username stored in the resulting PlayerStats.
+        :param seed: Seed of the model's random number generator, a random one is picked if None.
+        :return: None
+        """
+        logger.info("Initializing headless controller...")
+
+        if settings is None:
+            settings = JSONManager().settings
+        self.settings = settings
+
+        self.player_stats = PlayerStats(
+            difficulty=difficulty, game_mode=game_mode, username=username
+        )
+        self.model = Model(self.settings, self.player_stats, seed=seed)
+        self.model.apply_difficulty(difficulty)
+
+        self.input_source = (
+            input_source if input_source is not None else ScriptedInput()
+        )
+        self.frames = 0
+
+    def step(self):
+        """
+        Performs a single frame: applies scripted input and updates the model.
+
+        :return: None
+        """
+        mouse_pos = self.input_source.handle(self.model)
+        self.model.update(mouse_pos)
+        self.frames += 1
+
+    def run(self, max_frames: int | None = None) -> PlayerStats:
+        """
+        Steps the model until the game ends or the frame limit is reached.
+
+        :param max_frames: Maximum number of frames to simulate. Unlimited if None.
+        :return: The PlayerStats of the simulated game.
+        """
+        while not self.model.game_ended(self.player_stats.game_mode):
+            if max_frames is not None and self.frames >= max_frames:
+                break
+            self.step()
+
+        self._update_player_stats()
+        logger.info(f"Headless game finished after {self.frames} frames")
+        return self.player_stats
+
+    def _update_player_stats(self):
+        """
+        Updates the player's statistics using simulated, not wall-clock, time.
+
+        :return: None
+        """
+        time_step = self.settings["physics"]["time_step"]
+        self.player_stats.time_elapsed = self.frames * time_step * 1000
+        self.player_stats.killed_enemies = self.model.entities.enemies_killed
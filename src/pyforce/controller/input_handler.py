@@ -4,7 +4,7 @@ This module contains the InputHandler class which manages user inputs.
 
 import weakref
 import pygame
-from pyforce.constants import GameState, Difficulty, Direction
+from pyforce.constants import GameState, Difficulty
 
 
 class InputHandler:
@@ -13,6 +13,7 @@ class InputHandler:
 
     Attributes:
         controller (Controller): The main controller instance.
+        pending_actions (set[str]): Actions triggered by key presses, applied on the next model step.
     """
 
     def __init__(self, controller):
@@ -24,6 +25,7 @@ class InputHandler:
         """
         self.controller = weakref.proxy(controller)
         self.mouse_map = {"mouse_left": 0, "mouse_middle": 1, "mouse_right": 2}
+        self.pending_actions: set[str] = set()
 
     def handle(self):
         """
@@ -47,30 +49,32 @@ class InputHandler:
                 pygame.quit()
             if event.type == pygame.KEYDOWN:
                 if event.key in self._get_key_list("switch_weapon"):
-                    self.controller.model.player_switch_weapon()
+                    # applied with the held keys, so every model step sees its input at once
+                    self.pending_actions.add("switch_weapon")
 
-    def handle_keys(self):
+    def handle_keys(self) -> frozenset[str]:
         """
         Handles keyboard and mouse button presses for player movement and shooting.
 
-        :return: None
+        :return: The actions applied to the model, empty if the game got paused.
         """
         keys = pygame.key.get_pressed()
         mouse = pygame.mouse.get_pressed()
         key_bindings = self.controller.settings["key_bindings"]
 
-        if self._check_binds(keys, mouse, key_bindings["move_left"]):
-            self.controller.model.move_player(Direction.LEFT)
-        if self._check_binds(keys, mouse, key_bindings["move_right"]):
-            self.controller.model.move_player(Direction.RIGHT)
-        if self._check_binds(keys, mouse, key_bindings["jump"]):
-            self.controller.model.move_player(Direction.UP)
         if self._check_binds(keys, mouse, key_bindings["pause"]):
             self.controller.game_state = GameState.PAUSE
-        if self._check_binds(keys, mouse, key_bindings["shoot"]):
-            self.controller.model.player_shoot()
-        if self._check_binds(keys, mouse, key_bindings["pickup"]):
-            self.controller.model.player_pickup()
+            return frozenset()
+
+        actions = set(self.pending_actions)
+        self.pending_actions.clear()
+        for action in ["move_left", "move_right", "jump", "shoot", "pickup"]:
+            if self._check_binds(keys, mouse, key_bindings[action]):
+                actions.add(action)
+
+        applied = frozenset(actions)
+        self.controller.model.apply_actions(applied)
+        return applied
 
     def _get_key_list(self, action: str):
         """
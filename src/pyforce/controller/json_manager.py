@@ -3,9 +3,17 @@ This module contains the JSONManager class which handles loading and saving sett
 """
 
 import json
+import os
 from loguru import logger
 from pyforce.structures import PlayerStats
 
+# the settings shipped with the game, every key the game reads has a default here
+DEFAULTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "settings",
+    "settings.json",
+)
+
 
 class JSONManager:
     """
@@ -38,14 +46,18 @@ class JSONManager:
 
     def load(self):
         """
-        Loads settings from the JSON file specified by self.path.
+        Loads settings from the JSON file specified by self.path. The loaded values are merged
+        over the packaged defaults, so files saved by older versions get the keys added since.
 
         :return: None
         """
         try:
             with open(self.path, "r") as f:
-                self.settings = json.load(f)
-                logger.info(f"Settings successfully loaded from {self.path}")
+                loaded = json.load(f)
+            with open(DEFAULTS_PATH, "r") as f:
+                defaults = json.load(f)
+            self.settings = _merge_settings(defaults, loaded)
+            logger.info(f"Settings successfully loaded from {self.path}")
 
         except FileNotFoundError:
             logger.warning("Settings file not found.")
@@ -85,7 +97,7 @@ class JSONManager:
         path = self.settings["records_path"]
         try:
             with open(path, "a") as f:
-                record = self._create_dict(stats)
+                record = self.stats_to_record(stats)
                 f.write(json.dumps(record) + "\n")
 
             logger.info(f"Record saved to {path}")
@@ -96,9 +108,9 @@ class JSONManager:
             logger.error(f"Failed to append record: {e}")
 
     @staticmethod
-    def _create_dict(stats: PlayerStats):
+    def stats_to_record(stats: PlayerStats):
         """
-        Creates a dictionary representation of the player's statistics.
+        Creates the record of a game, as appended to the records file.
 
         :param stats: The PlayerStats instance to convert.
         :return: A dictionary containing player statistics.
@@ -114,3 +126,21 @@ class JSONManager:
             "game_mode": stats.game_mode.value if stats.game_mode is not None else None,
         }
         return record
+
+
+def _merge_settings(defaults: dict, loaded: dict) -> dict:
+    """
+    Merges loaded settings over the defaults. Nested dictionaries are merged key by key,
+    any other loaded value replaces the default.
+
+    :param defaults: The packaged default settings.
+    :param loaded: The settings loaded from the user's file.
+    :return: A new dictionary with the merged settings.
+    """
+    merged = dict(defaults)
+    for key, value in loaded.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_settings(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
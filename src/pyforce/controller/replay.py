@@ -0,0 +1,346 @@
+"""
+This module contains the replay file format and the replay player which runs recorded games headless.
+
+A replay file is a header, a keyframe index and a body of input runs, all little-endian:
+
+    header:  magic (4s), version (B), seed (Q), frame count (I), keyframe interval (H), keyframe count (I)
+    strings: difficulty, game mode and map name, each as length (B) + UTF-8 bytes
+    index:   byte offset (I) into the body of every keyframe, keyframe k is frame k * interval
+    body:    runs of identical frames as action bitmask (B), mouse x (h), mouse y (h), length (H)
+
+A run never crosses a keyframe, so decoding can start at any keyframe without reading the frames before it.
+"""
+
+import argparse
+import copy
+import datetime
+import json
+import os
+import posixpath
+import struct
+import sys
+import time
+
+from loguru import logger
+
+from pyforce.constants import Difficulty, GameMode
+from pyforce.structures import FrameInput, Replay
+
+from .headless_controller import HeadlessController
+from .json_manager import JSONManager
+from .scripted_input import ScriptedInput
+
+MAGIC = b"PFRP"
+VERSION = 1
+
+# bit i of the action bitmask is set when ACTIONS[i] is active
+ACTIONS = ("move_left", "move_right", "jump", "shoot", "pickup", "switch_weapon")
+
+HEADER = struct.Struct("<4sBQIHI")
+OFFSET = struct.Struct("<I")
+RUN = struct.Struct("<BhhH")
+MAX_RUN = 0xFFFF
+MOUSE_LIMIT = 0x7FFF
+
+
+def encode_replay(replay: Replay, keyframe_interval: int) -> bytes:
+    """
+    Encodes a replay into the binary replay format.
+
+    :param replay: The Replay to encode.
+    :param keyframe_interval: Number of frames between two keyframes.
+    :return: The encoded replay.
+    """
+    body = bytearray()
+    offsets = []
+    run = None  # [mask, x, y, length]
+
+    for frame, frame_input in enumerate(replay.frames):
+        mask = _encode_actions(frame_input.actions)
+        x, y = (_clamp_mouse(value) for value in frame_input.mouse_pos)
+
+        keyframe = frame % keyframe_interval == 0
+        if (
+            run is None
+            or keyframe
+            or run[3] == MAX_RUN
+            or (run[0], run[1], run[2]) != (mask, x, y)
+        ):
+            if run is not None:
+                body += RUN.pack(*run)
+            if keyframe:
+                offsets.append(len(body))
+            run = [mask, x, y, 0]
+        run[3] += 1
+
+    if run is not None:
+        body += RUN.pack(*run)
+
+    data = bytearray(
+        HEADER.pack(
+            MAGIC,
+            VERSION,
+            replay.seed,
+            len(replay.frames),
+            keyframe_interval,
+            len(offsets),
+        )
+    )
+    for text in [replay.difficulty.value, replay.game_mode.value, replay.map_name]:
+        encoded = text.encode("utf-8")
+        data += struct.pack("<B", len(encoded)) + encoded
+    for offset in offsets:
+        data += OFFSET.pack(offset)
+
+    return bytes(data + body)
+
+
+class ReplayReader:
+    """
+    The ReplayReader class decodes replays in the binary replay format.
+    The keyframe index allows reading the frames from any point without decoding the ones before it.
+
+    Attributes:
+        seed (int): Seed of the model's random number generator.
+        difficulty (Difficulty): The difficulty the game was played on.
+        game_mode (GameMode): The game mode the game was played in.
+        map_name (str): File name of the TMX map.
+        frame_count (int): Number of recorded frames.
+        keyframe_interval (int): Number of frames between two keyframes.
+        offsets (list[int]): Offset of every keyframe, relative to the start of the body.
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Parses the header and the keyframe index of an encoded replay.
+
+        :param data: The encoded replay.
+        :return: None
+        """
+        magic, version, seed, frame_count, interval, keyframes = HEADER.unpack_from(
+            data
+        )
+        if magic != MAGIC:
+            raise ValueError("Not a pyforce replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        self.seed = seed
+        self.frame_count = frame_count
+        self.keyframe_interval = interval
+
+        position = HEADER.size
+        texts = []
+        for _ in range(3):
+            length = data[position]
+            texts.append(data[position + 1 : position + 1 + length].decode("utf-8"))
+            position += 1 + length
+        self.difficulty = Difficulty(texts[0])
+        self.game_mode = GameMode(texts[1])
+        self.map_name = texts[2]
+
+        self.offsets = [
+            OFFSET.unpack_from(data, position + i * OFFSET.size)[0]
+            for i in range(keyframes)
+        ]
+        self._body = memoryview(data)[position + keyframes * OFFSET.size :]
+
+    @classmethod
+    def from_file(cls, path: str):
+        """
+        Reads a replay file.
+
+        :param path: Path to the replay file.
+        :return: A ReplayReader instance.
+        """
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def frames(self, start: int = 0):
+        """
+        Yields the recorded frames, starting at the given frame.
+
+        :param start: Index of the first frame to yield.
+        :return: A generator of FrameInput instances.
+        """
+        if start >= self.frame_count:
+            return
+
+        keyframe = min(start // self.keyframe_interval, len(self.offsets) - 1)
+        frame = keyframe * self.keyframe_interval
+        position = self.offsets[keyframe]
+
+        while frame < self.frame_count:
+            mask, x, y, length = RUN.unpack_from(self._body, position)
+            position += RUN.size
+
+            if frame + length > start:
+                frame_input = FrameInput(_decode_actions(mask), (x, y))
+                for _ in range(max(frame, start), frame + length):
+                    yield frame_input
+            frame += length
+
+    def to_replay(self) -> Replay:
+        """
+        Decodes the whole replay.
+
+        :return: A Replay instance.
+        """
+        return Replay(
+            seed=self.seed,
+            difficulty=self.difficulty,
+            game_mode=self.game_mode,
+            map_name=self.map_name,
+            frames=list(self.frames()),
+        )
+
+
+def save_replay(path: str, replay: Replay, keyframe_interval: int):
+    """
+    Writes a replay file, creating its directory if needed.
+
+    :param path: Path to the replay file.
+    :param replay: The Replay to save.
+    :param keyframe_interval: Number of frames between two keyframes.
+    :return: None
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "wb") as f:
+        f.write(encode_replay(replay, keyframe_interval))
+    logger.info(f"Replay of {len(replay.frames)} frames saved to {path}")
+
+
+def load_replay(path: str) -> Replay:
+    """
+    Reads a whole replay file.
+
+    :param path: Path to the replay file.
+    :return: A Replay instance.
+    """
+    return ReplayReader.from_file(path).to_replay()
+
+
+def replay_path(settings: dict) -> str:
+    """
+    Creates the path of a new replay file in the replay directory.
+
+    :param settings: Dictionary containing game settings.
+    :return: The path of the replay file.
+    """
+    name = datetime.datetime.now().strftime("%Y-%m-%d_replay-%H-%M-%S.pfr")
+    return os.path.join(settings["replay"]["directory"], name)
+
+
+def play_replay(replay: Replay, settings: dict) -> dict:
+    """
+    Plays a replay through the headless model as fast as possible.
+
+    :param replay: The Replay to play.
+    :param settings: Dictionary containing game settings.
+    :return: A record in the format written by JSONManager.append_record, extended with timing stats.
+    """
+    settings = copy.deepcopy(settings)
+    map_dir = posixpath.dirname(settings["map"]["map_path"])
+    settings["map"]["map_path"] = posixpath.join(map_dir, replay.map_name)
+
+    controller = HeadlessController(
+        settings,
+        game_mode=replay.game_mode,
+        difficulty=replay.difficulty,
+        input_source=ScriptedInput(replay.frames, loop=False),
+        username=f"replay-{replay.seed}",
+        seed=replay.seed,
+    )
+
+    start = time.perf_counter()
+    stats = controller.run(len(replay.frames))
+    wall_time = time.perf_counter() - start
+
+    record = JSONManager.stats_to_record(stats)
+    record.update(
+        {
+            "seed": replay.seed,
+            "map": replay.map_name,
+            "frames": controller.frames,
+            "player_alive": controller.model.entities.player is not None,
+            "wall_time": wall_time,
+            "ms_per_frame": wall_time * 1000 / max(1, controller.frames),
+        }
+    )
+    return record
+
+
+def _encode_actions(actions) -> int:
+    """
+    Converts action names to the action bitmask.
+
+    :param actions: A collection of action names.
+    :return: The action bitmask.
+    """
+    mask = 0
+    for action in actions:
+        mask |= 1 << ACTIONS.index(action)
+    return mask
+
+
+def _decode_actions(mask: int) -> frozenset[str]:
+    """
+    Converts the action bitmask to action names.
+
+    :param mask: The action bitmask.
+    :return: A frozenset of action names.
+    """
+    return frozenset(action for i, action in enumerate(ACTIONS) if mask & (1 << i))
+
+
+def _clamp_mouse(value: int) -> int:
+    """
+    Clamps a mouse coordinate to the range stored in the replay format.
+
+    :param value: A mouse coordinate.
+    :return: The clamped coordinate.
+    """
+    return max(-MOUSE_LIMIT, min(MOUSE_LIMIT, int(value)))
+
+
+def _parse_args(argv):
+    """
+    Parses the command line arguments of the replay player.
+
+    :param argv: A list of arguments, without the program name.
+    :return: An argparse.Namespace instance.
+    """
+    parser = argparse.ArgumentParser(description="Play pyforce replays headless.")
+    parser.add_argument("replays", nargs="+", help="replay files to play")
+    parser.add_argument("--settings", default=None, help="path to the settings file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Command line entry point of the replay player.
+
+    :param argv: A list of arguments, defaults to sys.argv.
+    :return: None
+    """
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    json_manager = JSONManager()
+    if args.settings is not None:
+        json_manager.path = args.settings
+        json_manager.load()
+
+    for path in args.replays:
+        record = play_replay(load_replay(path), json_manager.settings)
+        record["replay"] = path
+        print(json.dumps(record))
+
+
+if __name__ == "__main__":
+    main()
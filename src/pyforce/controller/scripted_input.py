@@ -0,0 +1,66 @@
+"""
+This module contains the ScriptedInput class which feeds a predefined input script to the model.
+"""
+
+from pyforce.structures import FrameInput
+
+
+class ScriptedInput:
+    """
+    The ScriptedInput class stands in for InputHandler when the game runs without a display.
+    Every frame it takes the next FrameInput from the script and applies its actions to the model.
+
+    Attributes:
+        frames (list[FrameInput]): The input script, one entry per frame.
+        loop (bool): Whether the script starts over after its last frame.
+        default (FrameInput): The input used once a non-looping script is exhausted.
+        frame (int): Index of the next frame to be played.
+    """
+
+    def __init__(
+        self,
+        frames: list[FrameInput] | None = None,
+        loop: bool = True,
+        default: FrameInput | None = None,
+    ):
+        """
+        Initializes the ScriptedInput with a list of frame inputs.
+
+        :param frames: The input script. An empty script means no input at all.
+        :param loop: Whether to repeat the script after the last frame.
+        :param default: Input used after a non-looping script runs out.
+        :return: None
+        """
+        self.frames = frames if frames is not None else []
+        self.loop = loop
+        self.default = default if default is not None else FrameInput()
+        self.frame = 0
+
+    def next_frame(self) -> FrameInput:
+        """
+        Retrieves the input for the current frame and advances the script.
+
+        :return: A FrameInput instance.
+        """
+        if not self.frames:
+            frame_input = self.default
+        elif self.frame < len(self.frames):
+            frame_input = self.frames[self.frame]
+        elif self.loop:
+            frame_input = self.frames[self.frame % len(self.frames)]
+        else:
+            frame_input = self.default
+
+        self.frame += 1
+        return frame_input
+
+    def handle(self, model) -> tuple[int, int]:
+        """
+        Applies the next frame's actions to the model, the way InputHandler does with real keys.
+
+        :param model: The Model instance to drive.
+        :return: The mouse position to pass to Model.update.
+        """
+        frame_input = self.next_frame()
+        model.apply_actions(frame_input.actions)
+        return frame_input.mouse_pos
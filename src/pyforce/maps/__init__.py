@@ -0,0 +1,17 @@
+"""
+A submodule used for loading TMX maps shared by the physics engine and the renderer.
+"""
+
+from .collision_cache import load_collision_rects
+from .map_assets import get_map_path, load_map, load_map_images
+from .platform_edges import PlatformEdges
+from .rect_merge import merge_rects
+
+__all__ = [
+    "PlatformEdges",
+    "get_map_path",
+    "load_collision_rects",
+    "load_map",
+    "load_map_images",
+    "merge_rects",
+]
@@ -0,0 +1,229 @@
+"""
+This module contains the collision geometry cache which lets the physics engine start without parsing the TMX map.
+
+The cache file is stored next to the map (map3.tmx -> map3.collisions), all little-endian:
+
+    header: magic (4s), version (B), SHA-256 of the TMX file (32s), type count (B), rect count (I)
+    layer:  name of the object layer as length (B) + UTF-8 bytes
+    types:  every object type as length (B) + UTF-8 bytes, an empty string stands for None
+    rects:  x (d), y (d), width (d), height (d), index into the types (B)
+
+Collision types and filters are not stored, they are looked up in the settings by object type
+when the shapes are built, so changing the settings doesn't invalidate the cache.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from xml.etree import ElementTree
+
+from loguru import logger
+
+from pyforce.structures import CollisionRect
+
+from .map_assets import get_map_path, load_map
+
+MAGIC = b"PFCC"
+VERSION = 1
+
+HEADER = struct.Struct("<4sB32sBI")
+RECT = struct.Struct("<ddddB")
+
+# object children which make it something other than a rectangle
+SHAPE_TAGS = {"ellipse", "point", "polygon", "polyline", "text"}
+
+
+def load_collision_rects(settings: dict) -> list[CollisionRect]:
+    """
+    Returns the rectangles of the map's collision object layer. They are read from the cache
+    when it matches the map file, otherwise extracted from the map and written to the cache.
+
+    :param settings: Dictionary containing game settings.
+    :return: A list of CollisionRect instances.
+    """
+    map_path = get_map_path(settings)
+    layer_name = settings["map"]["object_layer_name"]
+
+    if not settings["map"]["collision_cache"]:
+        return _extract_with_pytmx(settings, layer_name)
+
+    with open(map_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).digest()
+
+    cache_path = get_cache_path(map_path)
+    rects = _read_cache(cache_path, digest, layer_name)
+    if rects is not None:
+        return rects
+
+    logger.info(f"Building collision cache {cache_path}...")
+    rects = _extract_rects(settings, map_path, layer_name)
+    _write_cache(cache_path, digest, layer_name, rects)
+    return rects
+
+
+def get_cache_path(map_path: str) -> str:
+    """
+    Creates the path of the cache file belonging to a map.
+
+    :param map_path: Path of the TMX file.
+    :return: Path of the cache file.
+    """
+    return os.path.splitext(map_path)[0] + ".collisions"
+
+
+def _read_cache(
+    cache_path: str, digest: bytes, layer_name: str
+) -> list[CollisionRect] | None:
+    """
+    Reads the cache file through a memory map.
+
+    :param cache_path: Path of the cache file.
+    :param digest: SHA-256 of the current TMX file.
+    :param layer_name: Name of the collision object layer.
+    :return: A list of CollisionRect instances, or None if the cache is missing or stale.
+    """
+    try:
+        with (
+            open(cache_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            magic, version, cached_digest, type_count, rect_count = HEADER.unpack_from(
+                data
+            )
+            if magic != MAGIC or version != VERSION or cached_digest != digest:
+                return None
+
+            position = HEADER.size
+            texts = []
+            for _ in range(type_count + 1):
+                length = data[position]
+                texts.append(data[position + 1 : position + 1 + length].decode("utf-8"))
+                position += 1 + length
+
+            if texts[0] != layer_name:
+                return None
+            types = [text or None for text in texts[1:]]
+
+            end = position + rect_count * RECT.size
+            return [
+                CollisionRect(x, y, width, height, types[type_index])
+                for x, y, width, height, type_index in RECT.iter_unpack(
+                    data[position:end]
+                )
+            ]
+    except (OSError, ValueError, struct.error, IndexError):
+        # missing, empty or truncated file
+        return None
+
+
+def _write_cache(
+    cache_path: str, digest: bytes, layer_name: str, rects: list[CollisionRect]
+):
+    """
+    Writes the cache file. A read-only map directory only costs the cache, not the game.
+
+    :param cache_path: Path of the cache file.
+    :param digest: SHA-256 of the TMX file.
+    :param layer_name: Name of the collision object layer.
+    :param rects: The rectangles to store.
+    :return: None
+    """
+    types = list(dict.fromkeys(rect.type or "" for rect in rects))
+
+    data = bytearray(HEADER.pack(MAGIC, VERSION, digest, len(types), len(rects)))
+    for text in [layer_name] + types:
+        encoded = text.encode("utf-8")
+        data += struct.pack("<B", len(encoded)) + encoded
+    for rect in rects:
+        data += RECT.pack(
+            rect.x, rect.y, rect.width, rect.height, types.index(rect.type or "")
+        )
+
+    try:
+        # write and rename, so a crash can't leave a truncated cache behind
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write collision cache: {e}")
+
+
+def _extract_rects(
+    settings: dict, map_path: str, layer_name: str
+) -> list[CollisionRect]:
+    """
+    Extracts the collision rectangles with the streaming extractor, falling back to pytmx
+    for objects it doesn't understand.
+
+    :param settings: Dictionary containing game settings.
+    :param map_path: Path of the TMX file.
+    :param layer_name: Name of the collision object layer.
+    :return: A list of CollisionRect instances.
+    """
+    try:
+        return _stream_rects(map_path, layer_name)
+    except ValueError as e:
+        logger.info(f"Streaming extraction not possible ({e}), parsing the map")
+        return _extract_with_pytmx(settings, layer_name)
+
+
+def _stream_rects(map_path: str, layer_name: str) -> list[CollisionRect]:
+    """
+    Reads the objects of a single object layer without parsing the rest of the map.
+    Parsing stops at the end of the layer.
+
+    :param map_path: Path of the TMX file.
+    :param layer_name: Name of the collision object layer.
+    :return: A list of CollisionRect instances.
+    """
+    rects: list[CollisionRect] = []
+    in_layer = False
+
+    for event, element in ElementTree.iterparse(map_path, events=("start", "end")):
+        if element.tag == "objectgroup":
+            if event == "start" and element.get("name") == layer_name:
+                in_layer = True
+            elif event == "end" and in_layer:
+                return rects
+        elif event == "end" and in_layer and element.tag == "object":
+            # these need the tilesets or templates, which only pytmx resolves
+            for attribute in ["template", "gid"]:
+                if element.get(attribute) is not None:
+                    raise ValueError(f"object with {attribute}")
+            if float(element.get("rotation", 0)) != 0:
+                raise ValueError("rotated object")
+            for child in element:
+                if child.tag in SHAPE_TAGS:
+                    raise ValueError(f"object with {child.tag}")
+
+            rects.append(
+                CollisionRect(
+                    x=float(element.get("x", 0)),
+                    y=float(element.get("y", 0)),
+                    width=float(element.get("width", 0)),
+                    height=float(element.get("height", 0)),
+                    type=element.get("type", element.get("class")),
+                )
+            )
+        elif event == "end" and not in_layer:
+            # nothing outside the layer is needed, keep the memory flat
+            element.clear()
+
+    raise ValueError(f"no object layer named {layer_name}")
+
+
+def _extract_with_pytmx(settings: dict, layer_name: str) -> list[CollisionRect]:
+    """
+    Extracts the collision rectangles from the fully parsed map.
+
+    :param settings: Dictionary containing game settings.
+    :param layer_name: Name of the collision object layer.
+    :return: A list of CollisionRect instances.
+    """
+    object_layer = load_map(settings).get_layer_by_name(layer_name)
+    return [
+        CollisionRect(obj.x, obj.y, obj.width, obj.height, obj.type)
+        for obj in object_layer
+    ]
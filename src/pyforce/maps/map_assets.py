@@ -0,0 +1,66 @@
+"""
+This module parses every TMX map only once per process and hands the same TiledMap
+to the physics engine (object layers) and to the renderer (tile layers).
+"""
+
+import os
+
+import pytmx
+from loguru import logger
+from pytmx.util_pygame import pygame_image_loader
+
+# parsed maps by absolute path
+_maps: dict[str, pytmx.TiledMap] = {}
+# paths of maps whose tile images were loaded with pygame
+_images_loaded: set[str] = set()
+
+
+def get_map_path(settings: dict) -> str:
+    """
+    Resolves settings["map"]["map_path"] relative to the package directory.
+
+    :param settings: Dictionary containing game settings.
+    :return: The absolute path of the TMX file.
+    """
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.path.join(script_dir, settings["map"]["map_path"])
+
+    if os.name == "nt":
+        path = path.replace("/", "\\")
+    return path
+
+
+def load_map(settings: dict) -> pytmx.TiledMap:
+    """
+    Returns the parsed map. The file is parsed on the first call only, without loading
+    any images, so it works without a display.
+
+    :param settings: Dictionary containing game settings.
+    :return: A pytmx.TiledMap instance.
+    """
+    path = get_map_path(settings)
+
+    tmx_data = _maps.get(path)
+    if tmx_data is None:
+        logger.info(f"Parsing map {path}...")
+        tmx_data = pytmx.TiledMap(path)
+        _maps[path] = tmx_data
+    return tmx_data
+
+
+def load_map_images(settings: dict) -> pytmx.TiledMap:
+    """
+    Returns the parsed map with its tile images loaded as pygame surfaces, as
+    pytmx.util_pygame.load_pygame would. Only the images are loaded, the XML is not parsed again.
+
+    :param settings: Dictionary containing game settings.
+    :return: A pytmx.TiledMap instance.
+    """
+    path = get_map_path(settings)
+    tmx_data = load_map(settings)
+
+    if path not in _images_loaded:
+        tmx_data.image_loader = pygame_image_loader
+        tmx_data.reload_images()
+        _images_loaded.add(path)
+    return tmx_data
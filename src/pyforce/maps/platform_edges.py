@@ -0,0 +1,101 @@
+"""
+This module contains the PlatformEdges class, an index of the static map geometry's edges
+which answers segment queries against the map without asking the physics engine.
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class PlatformEdges:
+    """
+    The PlatformEdges class stores the edges of axis-aligned boxes sorted by their position,
+    so the edges a segment can cross are found by bisection. A segment starting outside
+    every box hits one exactly if it crosses one of their edges.
+
+    Attributes:
+        heights (list[float]): Sorted Y coordinates of the horizontal edges.
+        horizontal (list[tuple[list[float], list[float]]]): For every height, the sorted starts and
+            the ends of the non-overlapping edges at that height.
+        columns (list[float]): Sorted X coordinates of the vertical edges.
+        vertical (list[tuple[list[float], list[float]]]): For every column, the sorted starts and
+            the ends of the non-overlapping edges at that X coordinate.
+    """
+
+    def __init__(self, boxes: list[tuple[float, float, float, float]]):
+        """
+        Builds the edge index.
+
+        :param boxes: A list of (left, top, right, bottom) tuples.
+        :return: None
+        """
+        horizontal: dict[float, list[tuple[float, float]]] = {}
+        vertical: dict[float, list[tuple[float, float]]] = {}
+        for left, top, right, bottom in boxes:
+            for y in (top, bottom):
+                horizontal.setdefault(y, []).append((left, right))
+            for x in (left, right):
+                vertical.setdefault(x, []).append((top, bottom))
+
+        self.heights = sorted(horizontal)
+        self.horizontal = [_merge(horizontal[y]) for y in self.heights]
+        self.columns = sorted(vertical)
+        self.vertical = [_merge(vertical[x]) for x in self.columns]
+
+    def intersects(self, start, end) -> bool:
+        """
+        Checks if a segment crosses any edge.
+
+        :param start: The (x, y) start point of the segment.
+        :param end: The (x, y) end point of the segment.
+        :return: True if the segment hits a box, False otherwise.
+        """
+        x0, y0 = start
+        x1, y1 = end
+        return _crosses(self.heights, self.horizontal, y0, y1, x0, x1) or _crosses(
+            self.columns, self.vertical, x0, x1, y0, y1
+        )
+
+
+def _crosses(positions, edges, a0, a1, b0, b1) -> bool:
+    """
+    Checks if a segment crosses any edge perpendicular to the A axis.
+
+    :param positions: Sorted A coordinates of the edges.
+    :param edges: The (starts, ends) lists of the edges at every position.
+    :param a0: A coordinate of the segment's start.
+    :param a1: A coordinate of the segment's end.
+    :param b0: B coordinate of the segment's start.
+    :param b1: B coordinate of the segment's end.
+    :return: True if an edge is crossed, False otherwise.
+    """
+    low, high = min(a0, a1), max(a0, a1)
+    for i in range(bisect_left(positions, low), bisect_right(positions, high)):
+        if a0 == a1:
+            # the segment runs along the edges
+            b_low, b_high = min(b0, b1), max(b0, b1)
+        else:
+            b_low = b_high = b0 + (b1 - b0) * (positions[i] - a0) / (a1 - a0)
+
+        starts, ends = edges[i]
+        index = bisect_right(starts, b_high) - 1
+        if index >= 0 and ends[index] >= b_low:
+            return True
+    return False
+
+
+def _merge(intervals: list[tuple[float, float]]) -> tuple[list[float], list[float]]:
+    """
+    Merges overlapping intervals.
+
+    :param intervals: A list of (start, end) tuples.
+    :return: The sorted starts and the ends of the merged intervals.
+    """
+    starts: list[float] = []
+    ends: list[float] = []
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
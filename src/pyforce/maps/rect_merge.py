@@ -0,0 +1,63 @@
+"""
+This module contains the preprocessing pass which merges touching collision rectangles into fewer, larger ones.
+"""
+
+import dataclasses
+import itertools
+
+from pyforce.structures import CollisionRect
+
+# Tiled stores fractional coordinates (e.g., 24.3333), edges closer than this are touching
+EPSILON = 1e-3
+
+
+def merge_rects(rects: list[CollisionRect]) -> list[CollisionRect]:
+    """
+    Merges rectangles of the same type whose union is again a rectangle: rows with the same
+    top and height that touch or overlap horizontally, and columns with the same left edge and width
+    that touch or overlap vertically. Both passes repeat until nothing changes.
+
+    :param rects: The rectangles to merge.
+    :return: A list of merged CollisionRect instances.
+    """
+    count = None
+    while count != len(rects):
+        count = len(rects)
+        rects = _merge_pass(rects, horizontal=True)
+        rects = _merge_pass(rects, horizontal=False)
+    return rects
+
+
+def _merge_pass(rects: list[CollisionRect], horizontal: bool) -> list[CollisionRect]:
+    """
+    Merges neighbouring rectangles along one axis. Rectangles are grouped by type and their extent
+    on the other axis, then swept in order along the merge axis.
+
+    :param rects: The rectangles to merge.
+    :param horizontal: Whether to merge along the X axis, otherwise along the Y axis.
+    :return: A list of CollisionRect instances.
+    """
+    start, size = ("x", "width") if horizontal else ("y", "height")
+
+    def line(rect):
+        # rectangles on the same line can merge along the axis
+        if horizontal:
+            return rect.type or "", round(rect.y, 3), round(rect.height, 3)
+        return rect.type or "", round(rect.x, 3), round(rect.width, 3)
+
+    merged: list[CollisionRect] = []
+    for _, group in itertools.groupby(sorted(rects, key=line), key=line):
+        current, *rest = sorted(group, key=lambda rect: getattr(rect, start))
+        for rect in rest:
+            current_end = getattr(current, start) + getattr(current, size)
+            if getattr(rect, start) <= current_end + EPSILON:
+                end = max(current_end, getattr(rect, start) + getattr(rect, size))
+                current = dataclasses.replace(
+                    current, **{size: end - getattr(current, start)}
+                )
+            else:
+                merged.append(current)
+                current = rect
+        merged.append(current)
+
+    return merged
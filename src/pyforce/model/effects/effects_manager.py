@@ -1,4 +1,3 @@
-import random
 from math import radians, cos, sin
 
 from pymunk import Vec2d
@@ -8,8 +7,9 @@ from pyforce.model.effects.particle import Particle
 
 
 class EffectsManager:
-    def __init__(self, settings: dict):
+    def __init__(self, settings: dict, rng):
         self.settings = settings
+        self.rng = rng
         self.particles: list[Particle] = []
 
     def update(self, dt):
@@ -43,25 +43,33 @@ class EffectsManager:
 
         for i in range(qty):
             # get an angle to randomize particle position
-            angle = radians(random.randint(0, 360))
+            angle = radians(self.rng.randint(0, 360))
             x = int(spawn_offset * cos(angle))
             y = int(spawn_offset * sin(angle))
 
             vel = Vec2d(
-                random.randint(speed_min, speed_max)
+                self.rng.randint(speed_min, speed_max)
                 * (-1 if direction == Direction.LEFT else 1),
-                random.randint(speed_min, speed_max)
-                * random.uniform(y_vel_min, y_vel_max)
+                self.rng.randint(speed_min, speed_max)
+                * self.rng.uniform(y_vel_min, y_vel_max)
                 * y_vel_multiplier,
             )
 
-            size = random.randint(size_min, size_max)
+            size = self.rng.randint(size_min, size_max)
             p = Particle(position + Vec2d(x, y), vel, size, color, lifetime, gravity)
             self.particles.append(p)
 
-    def get_effects(self):
+    def get_effects(self, particles=None):
+        if particles is None:
+            particles = self.particles
         effects = []
-        for p in self.particles:
-            effect = Effect(pos=p.pos, size=p.size, color=p.color, opacity=p.opacity())
+        for p in particles:
+            effect = Effect(
+                pos=p.pos,
+                size=p.size,
+                color=p.color,
+                opacity=p.opacity(),
+                previous_pos=p.previous_pos,
+            )
             effects.append(effect)
         return effects
@@ -4,6 +4,7 @@ from pymunk import Vec2d
 class Particle:
     def __init__(self, pos: Vec2d, vel: Vec2d, size, color, lifetime, gravity):
         self.pos = pos
+        self.previous_pos = pos
         self.size = size
 
         self.vel = vel
@@ -15,6 +16,7 @@ class Particle:
 
     def update(self, dt):
         self.age += dt
+        self.previous_pos = self.pos
         self.pos += self.vel * dt + self.gravity * dt * dt / 2
 
     def is_alive(self):
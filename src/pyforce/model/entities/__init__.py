@@ -1,8 +1,9 @@
 """
-This module initializes the entities package and exports the EntityManager class.
+This module initializes the entities package and exports the EntityManager and EntityRegistry classes.
 """
 
 from .entity_manager import EntityManager
+from .entity_registry import EntityRegistry
 from .player import Player
 
-__all__ = ["EntityManager", "Player"]
+__all__ = ["EntityManager", "EntityRegistry", "Player"]
@@ -2,26 +2,20 @@
 This module provides utility functions for creating and managing entity physics components.
 """
 
-import weakref
-
 from pymunk import Body, Vec2d, Poly, ShapeFilter
 from pygame import Rect
 
 
-def prepare_collision_box(name, settings, entity, pos=None, ent_id=None):
+def prepare_collision_box(name, settings, ent_id, pos=None):
     """
     Creates and configures the physics components (body, shape, and feet) for an entity.
 
     :param name: The name/type of the entity.
     :param settings: Dictionary containing game settings.
-    :param entity: The entity instance to associate with the physics shapes.
+    :param ent_id: ID of the entity in the EntityRegistry, stored on the physics shapes.
     :param pos: Optional initial position. If None, uses default from settings.
-    :param ent_id: Optional unique identifier for the entity.
     :return: A tuple containing (body, shape, feet).
     """
-    if ent_id is None:  # if id is not given, it's a player
-        ent_id = getattr(settings["player_info"], "id", 1)
-
     if name == "player":
         ent_settings = settings["player_info"]
     else:
@@ -34,24 +28,9 @@ def prepare_collision_box(name, settings, entity, pos=None, ent_id=None):
     shape = _create_shape(body, ent_settings, settings, name, ent_id)
     feet = _create_feet(body, ent_settings, settings, name, ent_id)
 
-    _add_ents_to_shapes(shape, feet, entity)
-
     return body, shape, feet
 
 
-def _add_ents_to_shapes(shape, feet, entity):
-    """
-    Associates the entity instance with its physics shapes.
-
-    :param shape: The main physics shape.
-    :param feet: The feet physics shape.
-    :param entity: The entity instance.
-    :return: None
-    """
-    shape.entity = weakref.proxy(entity)
-    feet.entity = weakref.proxy(entity)
-
-
 def _create_body(mass, moment, ent_settings, pos=None):
     """
     Creates a pymunk Body for an entity.
@@ -102,7 +81,7 @@ def _create_shape(body, ent_settings, settings, name, ent_id):
 
     shape.friction = ent_settings["friction"]
     shape.collision_type = _get_collision_type(name, settings)
-    shape.id = ent_id  # used to tell if it's a player or enemy
+    shape.id = ent_id  # used to find the entity hit by a bullet
 
     shape.filter = _get_collision_filter(name, settings)
 
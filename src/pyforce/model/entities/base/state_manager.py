@@ -19,6 +19,7 @@ class StateManager:
         name (str): The name identifier of the entity.
         movement (float): Horizontal movement speed of the entity.
         state (State): The internal State instance tracking animation and physics.
+        sprite_index (int): Frame of the current animation, advanced once per model step.
     """
 
     def __init__(self, entity):
@@ -39,6 +40,23 @@ class StateManager:
             ]
 
         self.state = State(StateName.IDLE, self.entity.get_position(), self)
+        self.sprite_index = 0
+
+    def advance_animation(self):
+        """
+        Advances the animation of the current state by one model step. The attack animation
+        also decides when an attack lands, so it runs for every entity, rendered or not.
+
+        :return: None
+        """
+        self.sprite_index = self.state.get_sprite_index(
+            self.entity.get_position(),
+            self.entity.get_sprite_qty(self.state.get_state_str()),
+            self.entity.settings["sprites"]["cycle_lengths"][self.name].get(
+                self.state.get_state_str(), None
+            ),
+            self.entity.shape.body.velocity,
+        )
 
     def get_where(self) -> Where:
         """
@@ -50,14 +68,7 @@ class StateManager:
         where = Where(
             position=self.entity.get_position(),
             name=getattr(self.entity.name, "value", "player"),
-            sprite_index=self.state.get_sprite_index(
-                self.entity.get_position(),
-                self.entity.get_sprite_qty(self.state.get_state_str()),
-                self.entity.settings["sprites"]["cycle_lengths"][self.name].get(
-                    self.state.get_state_str(), None
-                ),
-                self.entity.shape.body.velocity,
-            ),
+            sprite_index=self.sprite_index,
             state=self.state.get_state(),
             inversion=True if self.state.is_inverted() else False,
             arm_deg=getattr(self.entity, "arm_deg", None),
@@ -66,6 +77,7 @@ class StateManager:
             is_dead=True if self.state.get_state() == StateName.DEATH else False,
             health_percent=self.entity.health / self.entity.max_health,
             guns_available=getattr(self.entity, "guns_available", None),
+            previous_position=self.entity.previous_position,
         )
 
         return where
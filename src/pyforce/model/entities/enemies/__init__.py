@@ -1,4 +1,6 @@
+from .ai_scheduler import AIScheduler
 from .enemy import Enemy
 from .patrol_path import PatrolPath
+from .patrol_path_index import PatrolPathIndex
 
-__all__ = ["Enemy", "PatrolPath"]
+__all__ = ["AIScheduler", "Enemy", "PatrolPath", "PatrolPathIndex"]
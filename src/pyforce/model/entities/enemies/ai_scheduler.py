@@ -0,0 +1,90 @@
+"""
+This module contains the AIScheduler class which spreads the decisions of enemies across model steps.
+"""
+
+import heapq
+
+from pyforce.constants import ActivityTier, EnemyAction
+
+
+class AIScheduler:
+    """
+    The AIScheduler class picks the enemies which make a new decision (line of sight, gap checks,
+    patrol re-evaluation) in the current step. Urgent enemies decide every step, the others share
+    a fixed budget of decisions per step and take turns, the longest waiting first.
+    Enemies not picked keep following their last decision.
+
+    Attributes:
+        settings (dict): Dictionary containing game settings.
+    """
+
+    def __init__(self, settings: dict):
+        """
+        Initializes the AIScheduler with the game settings.
+
+        :param settings: Dictionary containing game settings.
+        :return: None
+        """
+        self.settings = settings
+
+    def select(self, enemies, player, steps: int) -> list:
+        """
+        Picks the enemies which decide in this step and marks them as decided.
+
+        :param enemies: The enemies which aren't asleep.
+        :param player: The player entity.
+        :param steps: Number of the current model step.
+        :return: A list of Enemy instances.
+        """
+        settings = self.settings["ai_scheduler"]
+
+        selected = []
+        waiting = []
+        for enemy in enemies:
+            if settings["enabled"] and self._is_urgent(enemy, player):
+                selected.append(enemy)
+            elif steps - enemy.decision_step >= self._get_interval(enemy):
+                waiting.append(enemy)
+
+        if settings["enabled"]:
+            waiting = heapq.nsmallest(
+                settings["decision_budget"],
+                waiting,
+                key=lambda enemy: (enemy.decision_step, enemy.ent_id),
+            )
+        selected.extend(waiting)
+
+        for enemy in selected:
+            enemy.decision_step = steps
+        return selected
+
+    def _is_urgent(self, enemy, player) -> bool:
+        """
+        Checks if an enemy must decide in this step: it is fighting the player, close to them,
+        or about to walk off the end of its patrol path.
+
+        :param enemy: The enemy entity.
+        :param player: The player entity.
+        :return: True if the enemy can't wait for its turn, False otherwise.
+        """
+        if enemy.get_current_action() in [EnemyAction.AGGRO, EnemyAction.ATTACK]:
+            return True
+
+        distance = self.settings["ai_scheduler"]["priority_distance"]
+        if (enemy.get_position() - player.get_position()).length <= distance:
+            return True
+
+        return enemy.is_patrolling() and enemy.patrol_path.is_at_end(
+            enemy.get_position().x, enemy.get_movement_direction()
+        )
+
+    def _get_interval(self, enemy) -> int:
+        """
+        Retrieves the minimum number of steps between two decisions of an enemy.
+
+        :param enemy: The enemy entity.
+        :return: The number of steps.
+        """
+        if enemy.activity == ActivityTier.DORMANT:
+            return self.settings["activity"]["dormant_interval"]
+        return 1
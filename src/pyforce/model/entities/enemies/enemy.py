@@ -5,8 +5,16 @@ This module contains the Enemy class, which represents an enemy entity in the ga
 import weakref
 from pyforce.model.entities.base import StateManager, prepare_collision_box
 from loguru import logger
-from pyforce.constants import EnemyName, StateName, EnemyAction, Direction
+from pyforce.constants import (
+    ActivityTier,
+    EnemyName,
+    StateName,
+    EnemyAction,
+    Direction,
+)
 from pyforce.model.entities.enemies.patrol_path import PatrolPath
+from pyforce.model.entities.enemies.patrol_path_index import PatrolPathIndex
+from pyforce.structures import LineOfSight, NavLink
 
 
 class Enemy:
@@ -23,10 +31,16 @@ class Enemy:
         body (pymunk.Body): Physics body of the enemy.
         shape (pymunk.Poly): Physics shape of the enemy.
         feet (pymunk.Shape): Physics shape for the enemy's feet (collision detection with ground).
+        previous_position (Vec2d): Position before the last model step, used for render interpolation.
         state_manager (StateManager): Manages the animation and movement state of the enemy.
         patrol_path (PatrolPath): The current patrol path the enemy is on, if any.
         aggro (bool): Whether the enemy is currently aggressive towards the player.
         current_action (EnemyAction): The current high-level action of the enemy.
+        activity (ActivityTier): How much simulation the enemy currently gets.
+        wake_timer (int): Steps the enemy is kept active regardless of distance, e.g., after being hit.
+        decision_step (int): The model step of the enemy's last decision.
+        line_of_sight (LineOfSight): The enemy's last line-of-sight raycast, if any.
+        route_link (NavLink): The link of the navigation graph the enemy is following, if any.
     """
 
     def __init__(self, name: EnemyName, settings: dict, pos, ent_id, entity_manager):
@@ -36,7 +50,7 @@ class Enemy:
         :param name: The name/type of the enemy.
         :param settings: Dictionary containing game settings.
         :param pos: Initial position of the enemy.
-        :param ent_id: Unique identifier for the entity.
+        :param ent_id: ID of the enemy in the EntityRegistry.
         :param entity_manager: The EntityManager instance.
         :return: None
         """
@@ -48,9 +62,10 @@ class Enemy:
         self.entity_manager = weakref.proxy(entity_manager)
 
         self.body, self.shape, self.feet = prepare_collision_box(
-            name.value, settings, self, pos=pos, ent_id=ent_id
+            name.value, settings, ent_id, pos=pos
         )
         self.ent_id: int = ent_id
+        self.previous_position = self.body.position
 
         self.state_manager: StateManager = StateManager(self)
 
@@ -60,6 +75,12 @@ class Enemy:
         # action is not state
         self.current_action: EnemyAction | None = None
 
+        self.activity: ActivityTier = ActivityTier.ACTIVE
+        self.wake_timer: int = 0
+        self.decision_step: int = 0
+        self.line_of_sight: LineOfSight | None = None
+        self.route_link: NavLink | None = None
+
     def __eq__(self, other):
         """
         Checks equality between two Enemy instances based on their unique ID.
@@ -119,11 +140,11 @@ class Enemy:
 
     def get_id(self):
         """
-        Retrieves the unique identifier of the enemy from its physics body.
+        Retrieves the unique identifier of the enemy, its ID in the EntityRegistry.
 
         :return: The entity's ID.
         """
-        return self.body.id
+        return self.ent_id
 
     def get_sprite_qty(self, state):
         """
@@ -182,11 +203,11 @@ class Enemy:
         """
         return self.current_action
 
-    def update_patrol_state(self, patrol_paths) -> bool:
+    def update_patrol_state(self, patrol_paths: PatrolPathIndex) -> bool:
         """
         Updates the enemy's patrol state, including path finding and bouncing at ends.
 
-        :param patrol_paths: A list of available patrol paths.
+        :param patrol_paths: The PatrolPathIndex of the available patrol paths.
         :return: True if the enemy is on a patrol path, False otherwise.
         """
         if self.patrol_path is not None and not self._is_still_on_path():
@@ -241,7 +262,20 @@ class Enemy:
         """
         return self.patrol_path.is_at_end(
             self.shape.body.position.x, self.get_movement_direction()
-        ) or self.patrol_path.collides_with_another(self)
+        ) or self.patrol_path.collides_with_another(self, self._get_neighbours())
+
+    def _get_neighbours(self):
+        """
+        Finds the enemies whose bounding box overlaps this enemy's one.
+
+        :return: A list of Enemy instances, or None if the spatial index is disabled.
+        """
+        if not self.settings["spatial_index"]["enabled"]:
+            return None
+        bb = self.shape.bb
+        return self.entity_manager.model.spatial_index.query_rect(
+            "enemy", bb.left, bb.bottom, bb.right, bb.top
+        )
 
     def _set_patrol_path(self, path):
         """
@@ -263,13 +297,10 @@ class Enemy:
         """
         Identifies if the enemy's current position coincides with any given patrol path.
 
-        :param patrol_paths: A list of PatrolPath instances.
+        :param patrol_paths: The PatrolPathIndex of the available patrol paths.
         :return: The PatrolPath if found, None otherwise.
         """
-        for path in patrol_paths:
-            if path.is_in(self.shape.body.position.x, self._get_y_range()):
-                return path
-        return None
+        return patrol_paths.find(self.shape.body.position.x, self._get_y_range())
 
     def _get_y_range(self):
         """
@@ -359,6 +390,17 @@ class Enemy:
 
         self.health -= damage
 
+    def wake(self, steps: int = 0):
+        """
+        Wakes the enemy's physics body and keeps the enemy active for a number of steps.
+
+        :param steps: Number of steps the enemy stays active regardless of its distance.
+        :return: None
+        """
+        self.wake_timer = max(self.wake_timer, steps)
+        if self.body.is_sleeping:
+            self.body.activate()
+
     def kill(self):
         """
         Removes the enemy from the game world.
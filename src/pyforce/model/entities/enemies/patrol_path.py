@@ -2,7 +2,6 @@
 This module contains the PatrolPath class which defines horizontal paths for enemy patrolling.
 """
 from __future__ import annotations
-import random
 from typing import TYPE_CHECKING
 
 from pyforce.constants import Direction
@@ -80,9 +79,11 @@ class PatrolPath:
         """
         self.enemies.discard(enemy)
 
-    def collides_with_another(self, entity):
+    def collides_with_another(self, entity, candidates=None):
         bb1 = entity.shape.bb
-        ents = [ent for ent in self.enemies if ent != entity]
+        if candidates is None:
+            candidates = self.enemies
+        ents = [ent for ent in candidates if ent != entity and ent in self.enemies]
         for ent in ents:
             bb2 = ent.shape.bb
             if bb1.intersects(bb2):
@@ -95,5 +96,5 @@ class PatrolPath:
                 continue
         return False
 
-    def get_random_x(self):
-        return random.randint(self.start[0] + self.offset, self.end[0] - self.offset)
+    def get_random_x(self, rng):
+        return rng.randint(self.start[0] + self.offset, self.end[0] - self.offset)
@@ -0,0 +1,60 @@
+"""
+This module contains the PatrolPathIndex class which finds the patrol path at a position without checking every path.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from pyforce.model.entities.enemies.patrol_path import PatrolPath
+
+
+class PatrolPathIndex:
+    """
+    The PatrolPathIndex class buckets patrol paths by height and sorts every bucket by the paths' starts,
+    so a lookup bisects the heights and then the x-intervals of each matching height.
+
+    Attributes:
+        heights (list[int]): Sorted heights of the patrol paths.
+        buckets (list[tuple[list, list, list[PatrolPath]]]): For every height, the sorted starts,
+            the running maximum of the ends and the paths in the same order.
+    """
+
+    def __init__(self, patrol_paths: list[PatrolPath]):
+        """
+        Builds the index.
+
+        :param patrol_paths: A list of PatrolPath instances.
+        :return: None
+        """
+        paths_by_height: dict[int, list[PatrolPath]] = {}
+        for path in patrol_paths:
+            paths_by_height.setdefault(path.height, []).append(path)
+
+        self.heights = sorted(paths_by_height)
+        self.buckets = []
+        for height in self.heights:
+            paths = sorted(paths_by_height[height], key=lambda path: path.start[0])
+            starts = [path.start[0] for path in paths]
+            # overlapping paths are found by walking back while an earlier path can still reach x
+            max_ends = list(accumulate((path.end[0] for path in paths), max))
+            self.buckets.append((starts, max_ends, paths))
+
+    def find(self, x, y_range: tuple[int, int]) -> PatrolPath | None:
+        """
+        Finds a patrol path containing a position, with the same bounds as PatrolPath.is_in.
+
+        :param x: The X coordinate to check.
+        :param y_range: The entity's vertical extent, as passed to PatrolPath.is_in.
+        :return: The PatrolPath if found, None otherwise.
+        """
+        low, high = min(y_range), max(y_range)
+        for i in range(
+            bisect_left(self.heights, low), bisect_right(self.heights, high)
+        ):
+            starts, max_ends, paths = self.buckets[i]
+            index = bisect_right(starts, x) - 1
+            while index >= 0 and max_ends[index] >= x:
+                if paths[index].is_in(x, y_range):
+                    return paths[index]
+                index -= 1
+        return None
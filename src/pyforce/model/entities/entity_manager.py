@@ -7,14 +7,34 @@ import pymunk
 from pymunk import ShapeFilter, Vec2d, Shape
 from math import cos, sin, radians
 import math
-import random
 import weakref
+from collections.abc import Iterable
 
 from pyforce.model.entities.player import Player
-from pyforce.constants import EnemyName, StateName, EnemyAction, Direction
-from pyforce.structures import Where, BasicBulletInfo
-from pyforce.model.entities.enemies import Enemy, PatrolPath
-from pyforce.model.weaponry import Weapon, Ammo, Bullet
+from pyforce.model.entities.entity_registry import EntityRegistry
+from pyforce.constants import (
+    ActivityTier,
+    AmmoMode,
+    EnemyName,
+    StateName,
+    EnemyAction,
+    Direction,
+    NavLinkType,
+)
+from pyforce.structures import (
+    Where,
+    BasicBulletInfo,
+    CollisionEvents,
+    LineOfSight,
+    Platform,
+)
+from pyforce.model.entities.enemies import (
+    AIScheduler,
+    Enemy,
+    PatrolPath,
+    PatrolPathIndex,
+)
+from pyforce.model.weaponry import Weapon, Ammo, Bullet, BulletPool, BulletStore
 
 from loguru import logger
 
@@ -26,12 +46,20 @@ class EntityManager:
     Attributes:
         settings (dict): Dictionary containing game settings.
         sim (pymunk.Space): The physics simulation space.
+        registry (EntityRegistry): Hands out the IDs of the player, enemies and bullets and finds them by ID.
         player (Player): The player entity instance.
         enemies (set[Enemy]): A set of active enemy entities.
         weapons (dict): A mapping of weapon names to Weapon instances.
         ammo (dict): A mapping of ammo names to Ammo instances.
         bullets_dict (dict): A dictionary mapping Bullet instances to their physics shapes.
+        bullet_pool (BulletPool): Recycles removed bullets for later shots.
+        bullet_store (BulletStore): Columns with the collision flags and positions of the live bullets, checked for expiry.
         patrol_paths (list[PatrolPath]): A list of available patrol paths in the level.
+        patrol_path_index (PatrolPathIndex): Finds the patrol path an enemy stands on.
+        ai_scheduler (AIScheduler): Picks the enemies which make a new decision in each step.
+        query_filter (pymunk.ShapeFilter): Filter of the line-of-sight and gap raycasts.
+        bullet_query_filter (pymunk.ShapeFilter): Filter of the segment queries of swept and hitscan bullets.
+        player_platform (Platform | None): The platform the player last stood on, enemies route to it.
     """
 
     def __init__(self, settings: dict, sim: pymunk.Space, model):
@@ -47,7 +75,8 @@ class EntityManager:
         self.model = weakref.proxy(model)
         self.settings = settings
         self.sim = sim
-        self.player = Player(settings, self)
+        self.registry = EntityRegistry()
+        self.player = self._create_player()
         self.enemies = self._load_enemies()
         self.enemies_killed = 0
 
@@ -60,31 +89,61 @@ class EntityManager:
             f"Weapons ({len(self.weapons)}) and ammunition ({len(self.ammo)}) loaded successfully"
         )
 
+        self.steps = 0  # number of model steps, used to schedule enemy decisions
+        self.ai_scheduler = AIScheduler(settings)
+        self.query_filter = self._get_query_filter()
+        self.bullet_query_filter = self._get_bullet_query_filter()
+        self.player_platform: Platform | None = None
         self.bullets_dict: dict[Bullet, Shape] = {}  # dict Bullet: Shape
+        self.bullet_pool = BulletPool(settings)
+        self.bullet_store = BulletStore()
         self.patrol_paths = self._load_patrol_paths()  # list of PatrolPaths
+        self.patrol_path_index = PatrolPathIndex(self.patrol_paths)
 
         logger.info(f"Patrol paths ({len(self.patrol_paths)}) loaded successfully")
 
     def spawn_random_enemy(self):
-        enemy_name = random.choice([EnemyName.GOBLIN, EnemyName.SKELETON])
+        enemy_name = self.model.rng.choice([EnemyName.GOBLIN, EnemyName.SKELETON])
         pos = self._get_rand_pos()
+        enemy = self._create_enemy(EnemyName(enemy_name), pos)
+        self.enemies.add(enemy)
+        self.sim.add(enemy.shape, enemy.feet, enemy.body)
+        self.model.index_enemy(enemy)
+        logger.info(f"Spawned {enemy_name} at {pos}")
+
+    def _create_player(self) -> Player:
+        """
+        Creates the player and registers it.
+
+        :return: A Player instance.
+        """
+        ent_id = self.registry.allocate()
+        player = Player(self.settings, self, ent_id)
+        self.registry.bind(ent_id, player)
+        return player
+
+    def _create_enemy(self, name: EnemyName, pos) -> Enemy:
+        """
+        Creates an enemy and registers it.
+
+        :param name: The name/type of the enemy.
+        :param pos: Initial position of the enemy.
+        :return: An Enemy instance.
+        """
+        ent_id = self.registry.allocate()
         enemy = Enemy(
-            name=EnemyName(enemy_name),
+            name=name,
             settings=self.settings,
             pos=pos,
-            ent_id=self._get_next_enemy_id(),
+            ent_id=ent_id,
             entity_manager=self,
         )
-        self.enemies.add(enemy)
-        self.sim.add(enemy.shape, enemy.feet, enemy.body)
-        logger.info(f"Spawned {enemy_name} at {pos}")
-
-    def _get_next_enemy_id(self):
-        return max([ent.ent_id for ent in self.enemies] + [1]) + 1  # player's id is 1
+        self.registry.bind(ent_id, enemy)
+        return enemy
 
     def _get_rand_pos(self) -> Vec2d:
-        path = random.choice(self.patrol_paths)
-        x = path.get_random_x()
+        path = self.model.rng.choice(self.patrol_paths)
+        x = path.get_random_x(self.model.rng)
         y = path.height + self.settings["enemy_spawning"]["y_offset"]
         return Vec2d(x, y)
 
@@ -121,14 +180,7 @@ class EntityManager:
             ent_settings = self.settings["enemy_info"][enemy_type]
             for pos in ent_settings["start_positions"]:
                 pos = (pos[0], pos[1])
-                enemy = Enemy(
-                    name=EnemyName(enemy_type),
-                    settings=self.settings,
-                    pos=pos,
-                    ent_id=len(enemies) + 2,  # player's id is 1
-                    entity_manager=self,
-                )
-                enemies.add(enemy)
+                enemies.add(self._create_enemy(EnemyName(enemy_type), pos))
 
         return enemies
 
@@ -170,6 +222,7 @@ class EntityManager:
                 bullet_mass=settings["ammo"][name]["bullet_mass"],
                 bullet_radius=settings["ammo"][name]["bullet_radius"],
                 bullet_name=settings["ammo"][name]["bullet_name"],
+                mode=AmmoMode(settings["ammo"][name]["mode"]),
             )
             ammo[name] = amm
         return ammo
@@ -192,24 +245,22 @@ class EntityManager:
 
         self.player.arm_deg = angle
 
-    def update_ground_contact(self, entities_touching_ground: list):
+    def update_ground_contact(self, ground_contacts: dict[int, int]):
         """
         Updates the ground contact status for all entities.
 
-        :param entities_touching_ground: A list of physics shape IDs that are currently touching the ground.
+        :param ground_contacts: Number of shapes the feet of an entity stand on, by the feet's physics shape ID.
         :return: None
         """
         for entity in self.get_entities():
-            identifier = getattr(entity.feet, "id", None)
-
-            if identifier in entities_touching_ground:
-                entity.state_manager.state.set_on_ground(True)
-            else:
-                entity.state_manager.state.set_on_ground(False)
+            entity.state_manager.state.set_on_ground(
+                ground_contacts.get(entity.feet.id, 0) > 0
+            )
 
     def update_timers(self):
         """
-        Increments internal timers for animations, weapon rate-of-fire, and bullet lifespan.
+        Increments internal timers for animations and weapon rate-of-fire.
+        The age of bullets is derived from the step they were fired in.
 
         :return: None
         """
@@ -221,8 +272,17 @@ class EntityManager:
         for weapon in self.weapons.values():
             weapon.append_time()
 
-        for bullet, shape in self.bullets_dict.items():
-            bullet.timer += 1
+    def store_previous_positions(self):
+        """
+        Remembers the current positions of entities and bullets before the model is stepped,
+        so the view can interpolate between the previous and the current step.
+
+        :return: None
+        """
+        for entity in self.get_entities():
+            entity.previous_position = entity.get_position()
+
+        self.bullet_store.store_previous_positions()
 
     def update_entity_states(self):
         """
@@ -270,10 +330,70 @@ class EntityManager:
         :param sim: The physics simulation space.
         :return: None
         """
+        self.steps += 1
+        self._update_player_platform()
+
+        awake = []
         for enemy in self.enemies:
+            if self._update_activity(enemy) != ActivityTier.ASLEEP:
+                awake.append(enemy)
+
+        # the others keep following their last decision until it's their turn again
+        for enemy in self.ai_scheduler.select(awake, self.player, self.steps):
             self._update_single_enemy(enemy, sim)
+
+        for enemy in awake:
             self._apply_enemy_action(enemy, sim)
 
+    def _update_activity(self, enemy: Enemy) -> ActivityTier:
+        """
+        Moves the enemy to the activity tier matching its distance from the player.
+        An enemy falling asleep stops walking, so pymunk puts its body to sleep once it has been
+        idle for the space's sleep_time_threshold. An enemy leaving the tier has its body woken up.
+
+        :param enemy: The enemy entity.
+        :return: The enemy's ActivityTier.
+        """
+        activity = self._get_activity_tier(enemy)
+
+        body = enemy.body
+        if activity == ActivityTier.ASLEEP:
+            if enemy.activity != ActivityTier.ASLEEP:
+                body.velocity = (0, body.velocity.y)
+        elif body.is_sleeping:
+            body.activate()
+
+        enemy.activity = activity
+        return activity
+
+    def _get_activity_tier(self, enemy: Enemy) -> ActivityTier:
+        """
+        Determines the activity tier of an enemy. Enemies on screen or near it are active,
+        the ones within the sleep distance are dormant and the rest are asleep.
+
+        :param enemy: The enemy entity.
+        :return: An ActivityTier.
+        """
+        settings = self.settings["activity"]
+        if not settings["enabled"] or enemy.get_state() == StateName.DEATH:
+            return ActivityTier.ACTIVE
+
+        if enemy.wake_timer > 0:
+            enemy.wake_timer -= 1
+            return ActivityTier.ACTIVE
+
+        offset = enemy.get_position() - self.player.get_position()
+        margin = settings["active_margin"]
+        if (
+            abs(offset.x) <= self.settings["screen"]["size_x"] / 2 + margin
+            and abs(offset.y) <= self.settings["screen"]["size_y"] / 2 + margin
+        ):
+            return ActivityTier.ACTIVE
+
+        if offset.length <= settings["sleep_distance"]:
+            return ActivityTier.DORMANT
+        return ActivityTier.ASLEEP
+
     def _update_single_enemy(self, enemy: Enemy, sim: pymunk.Space):
         """
         Updates the action of a single enemy based on player proximity and patrol paths.
@@ -289,7 +409,7 @@ class EntityManager:
             self._resolve_enemy_hits(enemy)
         elif self._check_for_aggro(enemy, sim):
             enemy.change_action(EnemyAction.AGGRO)
-        elif enemy.update_patrol_state(self.patrol_paths):
+        elif enemy.update_patrol_state(self.patrol_path_index):
             # update patrol state returns false if an enemy is not on a path
             enemy.change_action(EnemyAction.PATROL)
         else:
@@ -324,16 +444,15 @@ class EntityManager:
         """
         if self.player.is_dying():
             return False
-        player_pos = self.player.get_position()
-        enemy_pos = enemy.get_position()
         attack_dist = self.settings["enemy_info"][enemy.name.value]["attack_distance"]
-        return (player_pos - enemy_pos).length <= attack_dist and self._check_for_aggro(
-            enemy, self.sim
-        )
+        if self._get_distance_squared(enemy) > attack_dist**2:
+            return False
+        return self._check_for_aggro(enemy, self.sim)
 
     def _check_for_aggro(self, enemy, sim):
         """
-        Performs a line-of-sight check to see if the enemy should become aggressive.
+        Checks if the enemy should become aggressive: the player has to be within its sight range
+        and visible. The cheap distance test runs first, the raycast only when it passes.
 
         :param enemy: The enemy entity.
         :param sim: The physics simulation space.
@@ -342,35 +461,62 @@ class EntityManager:
         if self.player.is_dying():
             return False
 
-        query_filter = self._get_query_filter()
+        sight = self.settings["enemy_info"][enemy.name.value]["sight"]
+        if self._get_distance_squared(enemy) >= sight**2:
+            return False
+        return self._has_line_of_sight(enemy, sim)
 
-        radius = self.settings["physics"]["segment_query_radius"]
-        info = sim.segment_query_first(
-            enemy.get_position(),
-            self.player.get_position(),
-            radius=radius,
-            shape_filter=query_filter,
-        )
-        shape = info.shape
-        if getattr(shape, "id", None) == self.settings["player_info"][
-            "id"
-        ] and self._in_distance(enemy, shape, self.settings):
-            return True
-        return False
+    def _get_distance_squared(self, enemy) -> float:
+        """
+        Calculates the squared distance between an enemy and the player.
 
-    @staticmethod
-    def _in_distance(enemy, shape, settings):
+        :param enemy: The enemy entity.
+        :return: The squared distance.
+        """
+        return enemy.get_position().get_distance_squared(self.player.get_position())
+
+    def _has_line_of_sight(self, enemy, sim) -> bool:
         """
-        Checks if the player (represented by shape) is within the enemy's sight range.
+        Performs a line-of-sight raycast from the enemy to the player. The last result of the enemy
+        is reused in the same step, and in later steps while neither the enemy nor the player
+        has moved further than the cache's threshold.
 
         :param enemy: The enemy entity.
-        :param shape: The player's physics shape.
-        :param settings: Dictionary containing game settings.
-        :return: True if within distance, False otherwise.
+        :param sim: The physics simulation space.
+        :return: True if nothing blocks the enemy's view of the player, False otherwise.
         """
-        return (enemy.get_position() - shape.body.position).length < settings[
-            "enemy_info"
-        ][enemy.name.value]["sight"]
+        enemy_pos = enemy.get_position()
+        player_pos = self.player.get_position()
+
+        settings = self.settings["physics"]["line_of_sight_cache"]
+        cached = enemy.line_of_sight
+        if cached is not None and (
+            cached.step == self.steps
+            or (
+                settings["enabled"]
+                and self.steps - cached.step <= settings["max_age"]
+                and enemy_pos.get_distance_squared(cached.enemy_pos)
+                <= settings["move_threshold"] ** 2
+                and player_pos.get_distance_squared(cached.player_pos)
+                <= settings["move_threshold"] ** 2
+            )
+        ):
+            return cached.visible
+
+        radius = self.settings["physics"]["segment_query_radius"]
+        info = sim.segment_query_first(
+            enemy_pos,
+            player_pos,
+            radius=radius,
+            shape_filter=self.query_filter,
+        )
+        # the spatial hash broadphase can miss the player at the end of long segments
+        visible = (
+            info is not None and getattr(info.shape, "id", None) == self.player.ent_id
+        )
+
+        enemy.line_of_sight = LineOfSight(self.steps, enemy_pos, player_pos, visible)
+        return visible
 
     def _apply_enemy_action(self, enemy: Enemy, sim):
         """
@@ -386,13 +532,66 @@ class EntityManager:
 
         move_dir = enemy.get_movement_direction()
         if current_action in [EnemyAction.AGGRO, EnemyAction.ATTACK]:
-            move_dir = self._get_direction_to_entity(
-                enemy.get_position()[0], self.player.get_position()[0]
-            )
-            self._jump_if_gap(enemy, sim)
+            move_dir = self._follow_route(enemy)
+            if move_dir is None:
+                # on the player's platform, or off the navigation graph
+                move_dir = self._get_direction_to_entity(
+                    enemy.get_position()[0], self.player.get_position()[0]
+                )
+                self._jump_if_gap(enemy, sim)
 
         enemy.state_manager.apply_horizontal_velocity(move_dir)
 
+    def _update_player_platform(self):
+        """
+        Remembers the platform the player stands on. It is kept while the player is in the air.
+
+        :return: None
+        """
+        navigation = self.model.navigation
+        if navigation is None or not self.player.state_manager.state.is_on_ground:
+            return
+
+        platform = navigation.locate_entity(self.player)
+        if platform is not None:
+            self.player_platform = platform
+
+    def _follow_route(self, enemy: Enemy) -> Direction | None:
+        """
+        Moves a chasing enemy along the shortest route to the player's platform. On the ground the enemy
+        walks to the takeoff point of the route's next link and jumps there if needed, in the air it
+        steers towards the landing point of the link it took.
+
+        :param enemy: The enemy entity.
+        :return: The Direction to move in, or None if the enemy has no route to follow.
+        """
+        navigation = self.model.navigation
+        if navigation is None or self.player_platform is None:
+            return None
+
+        on_ground = enemy.state_manager.state.is_on_ground
+        if on_ground:
+            platform = navigation.locate_entity(enemy)
+            enemy.route_link = None
+            if platform is not None:
+                enemy.route_link = navigation.get_next_link(
+                    platform.id, self.player_platform.id
+                )
+
+        link = enemy.route_link
+        if link is None:
+            return None
+
+        x = enemy.get_position().x
+        if not on_ground:
+            return self._get_direction_to_entity(x, link.landing_x)
+        if abs(x - link.takeoff_x) > self.settings["navigation"]["takeoff_distance"]:
+            return self._get_direction_to_entity(x, link.takeoff_x)
+
+        if link.type == NavLinkType.JUMP:
+            enemy.state_manager.apply_vertical_push()
+        return self._get_direction_to_entity(link.takeoff_x, link.landing_x)
+
     def _jump_if_gap(self, enemy, sim):
         """
         Makes the enemy jump if it detects a gap or obstacle in its movement direction.
@@ -401,21 +600,39 @@ class EntityManager:
         :param sim: The physics simulation space.
         :return: None
         """
-        query_filter = self._get_query_filter()
+        # inverted means the point is on the left
+        inv = enemy.get_movement_direction() == Direction.LEFT
+        gap_point = self._calc_gap_point(enemy.get_position(), inv)
+        if not self._hits_ground(enemy.get_position(), gap_point, sim):
+            enemy.state_manager.apply_vertical_push()
+
+    def _hits_ground(self, start: Vec2d, end: Vec2d, sim) -> bool:
+        """
+        Checks if a gap detection ray hits anything. The precomputed platform edges are used
+        when available. They only contain the static map geometry, so the player, whom chasing
+        enemies often run into, is tested on its own, the same way the physics engine would.
+
+        :param start: The start point of the ray.
+        :param end: The end point of the ray.
+        :param sim: The physics simulation space.
+        :return: True if the ray hits something, False if there is a gap.
+        """
         radius = self.settings["physics"]["segment_query_radius"]
-        for inv in [True, False]:
-            # inverted means the point is on the right
-            gap_point = self._calc_gap_point(enemy.get_position(), inv)
-            info = sim.segment_query_first(
-                enemy.get_position(),
-                gap_point,
-                radius=radius,
-                shape_filter=query_filter,
+
+        platform_edges = self.model.physics.platform_edges
+        if platform_edges is not None:
+            if platform_edges.intersects(start, end):
+                return True
+            return any(
+                shape.bb.intersects_segment(start, end)
+                and shape.segment_query(start, end, radius) is not None
+                for shape in [self.player.shape, self.player.feet]
             )
 
-            jump_dir = Direction.LEFT if inv else Direction.RIGHT
-            if info is None and jump_dir == enemy.get_movement_direction():
-                enemy.state_manager.apply_vertical_push()
+        info = sim.segment_query_first(
+            start, end, radius=radius, shape_filter=self.query_filter
+        )
+        return info is not None
 
     def _calc_gap_point(self, ent_pos: Vec2d, is_inverted):
         """
@@ -453,6 +670,17 @@ class EntityManager:
         query_filter = ShapeFilter(mask=mask)
         return query_filter
 
+    def _get_bullet_query_filter(self):
+        """
+        Creates a physics query filter for bullets moved by segment queries.
+
+        :return: A pymunk.ShapeFilter instance.
+        """
+        category = self.settings["physics"]["collision_categories"]["player_bullet"]
+        mask = self.settings["physics"]["collision_masks"]["player_bullet"]
+        # simulated bullets collide with each other, a segment must not stop at one
+        return ShapeFilter(categories=category, mask=mask & ~category)
+
     @staticmethod
     def _get_direction_to_entity(x1, x2):
         """
@@ -487,15 +715,26 @@ class EntityManager:
         pos = self.player.get_position()
         return pos[0], pos[1]
 
-    def get_where_array(self) -> list[Where]:
+    def advance_animations(self):
         """
-        Generates a list of Where objects for all entities, used for rendering.
+        Advances the animations of all entities by one model step.
 
-        :return: A list of Where dataclasses.
+        :return: None
+        """
+        self.player.state_manager.advance_animation()
+        for enemy in self.enemies:
+            enemy.state_manager.advance_animation()
+
+    def get_where_array(self, enemies: Iterable[Enemy]) -> list[Where]:
+        """
+        Generates a list of Where objects for the player and the given enemies, used for rendering.
+
+        :param enemies: The enemies to include, e.g., the ones in view.
+        :return: A list of Where dataclasses, the player's first.
         """
         where = [self.player.state_manager.get_where()]
 
-        for enemy in self.enemies:
+        for enemy in enemies:
             where.append(enemy.state_manager.get_where())
 
         return where
@@ -515,18 +754,74 @@ class EntityManager:
 
         :return: None
         """
-        to_be_removed = []
+        expired = self.bullet_store.pop_expired(
+            self.steps, self.settings["physics"]["timeout"]["bullet"]
+        )
+        for bullet in expired:
+            self._remove_bullet(bullet, self.sim)
 
-        for bullet, shape in self.bullets_dict.items():
-            if bullet.timer >= self.settings["physics"]["timeout"]["bullet"]:
-                to_be_removed.append((bullet, shape))
-            elif (bullet.start_pos - shape.body.position).length >= bullet.reach:
-                to_be_removed.append((bullet, shape))
-            elif bullet.has_collided:
-                to_be_removed.append((bullet, shape))
+    def sweep_bullets(self, events: CollisionEvents, dt: float):
+        """
+        Moves the bullets of swept ammo, which have no body in the physics simulation, by one step
+        and records the entities they hit.
 
-        for bullet, shape in to_be_removed:
-            self._remove_bullet(bullet, shape.body.space)
+        :param events: The CollisionEvents the physics engine records the current step's hits in.
+        :param dt: Duration of the step.
+        :return: None
+        """
+        for bullet in self.bullets_dict:
+            if bullet.ammo.mode != AmmoMode.SWEPT or self.bullet_store.has_collided(
+                bullet
+            ):
+                continue
+            body = bullet.body
+            body.velocity += self.sim.gravity * dt
+            self._trace_bullet(bullet, body.position + body.velocity * dt, events)
+
+    def fire_hitscan(self, bullet: Bullet, events: CollisionEvents):
+        """
+        Resolves the shot of a hitscan bullet up to its reach.
+
+        :param bullet: The Bullet instance just fired.
+        :param events: The CollisionEvents the physics engine records hits in.
+        :return: None
+        """
+        direction = bullet.body.velocity.normalized()
+        end = bullet.start_pos + direction * bullet.reach
+        if not self._trace_bullet(bullet, end, events):
+            # the shot is over, remove the bullet
+            self.bullet_store.mark_collided(bullet)
+
+    def _trace_bullet(self, bullet: Bullet, end: Vec2d, events: CollisionEvents):
+        """
+        Moves a bullet along a segment up to the first shape in its way. An enemy hit is recorded
+        like one from the collision callbacks, any other shape stops the bullet.
+
+        :param bullet: The Bullet instance.
+        :param end: The position the bullet moves to if nothing is in the way.
+        :param events: The CollisionEvents to record a hit in.
+        :return: True if an enemy was hit, False otherwise.
+        """
+        body = bullet.body
+        info = self.sim.segment_query_first(
+            body.position,
+            end,
+            radius=bullet.shape.radius,
+            shape_filter=self.bullet_query_filter,
+        )
+        if info is None:
+            body.position = end
+            return False
+
+        body.position = info.point
+        enemy_type = self.settings["physics"]["collision_types"]["enemy"]
+        if info.shape.collision_type == enemy_type:
+            # handle_hits marks the bullet as collided
+            events.hits.append((info.shape.id, bullet.id))
+            return True
+
+        self.bullet_store.mark_collided(bullet)
+        return False
 
     def get_bullet(self):
         """
@@ -548,9 +843,11 @@ class EntityManager:
             max_deviation = (
                 1 - accuracy
             ) * 90  # maximum bullet spread angle from arm deg
-            deviation = random.uniform(-max_deviation, max_deviation)
+            deviation = self.model.rng.uniform(-max_deviation, max_deviation)
             angle = self.player.arm_deg + deviation
-            bullet = Bullet(info=info, arm_deg=angle, ammo=ammo, settings=self.settings)
+            bullet = self.bullet_pool.acquire(info, angle, ammo)
+            self.registry.bind(bullet.id, bullet)
+            self.bullet_store.add(bullet, self.steps)
             bullets.append(bullet)
             self.bullets_dict[bullet] = bullet.shape
         return bullets
@@ -564,7 +861,7 @@ class EntityManager:
         :return: A BasicBulletInfo dataclass.
         """
         info = BasicBulletInfo(
-            self._get_next_bullet_id(),
+            self.registry.allocate(),
             self.player.get_gun_position(),
             weapon.reach,
             ammo.damage,
@@ -572,40 +869,43 @@ class EntityManager:
         )
         return info
 
-    def handle_kills(self, entities_to_kill: list):
+    def handle_kills(self, entities_to_kill: list[int]):
         """
         Processes a list of entities to be killed (e.g., from environmental hazards).
 
-        :param entities_to_kill: A list of entities to remove.
+        :param entities_to_kill: A list of IDs of the entities to kill.
         :return: None
         """
-        # used to kill entities that touch water
-        ents_to_remove = []
-        for ent in entities_to_kill:
-            try:
-                if ent.name == "player" and self._check_debug():
-                    continue
-                if self._kill_entity(ent, self.sim):
-                    ents_to_remove.append(ent)
-            except ReferenceError:
+        # used to kill entities that touch water, the death started here is finished by remove_killed
+        for ent_id in entities_to_kill:
+            ent = self.registry.get(ent_id)
+            if ent is None:  # removed since the collision
                 continue
-
-        for ent in ents_to_remove:
-            entities_to_kill.remove(ent)
+            if ent.name == "player" and self._check_debug():
+                continue
+            logger.info(f"Entity {ent.name} killed by collision with water.")
+            self._kill_entity(ent, self.sim)
 
     def handle_hits(self, entities_hit: list, sim):
         """
         Processes bullet collisions with entities.
 
-        :param entities_hit: A list of (entity, bullet) tuples representing collisions.
+        :param entities_hit: A list of (entity ID, bullet ID) tuples representing collisions.
         :param sim: The physics simulation space.
         :return: None
         """
-        for entity, bullet in entities_hit:
-            if bullet.has_collided:
+        for entity_id, bullet_id in entities_hit:
+            entity = self.registry.get(entity_id)
+            bullet = self.registry.get(bullet_id)
+            if (
+                entity is None
+                or bullet is None
+                or self.bullet_store.has_collided(bullet)
+            ):
                 continue
-            bullet.has_collided = True
+            self.bullet_store.mark_collided(bullet)
             entity.take_damage(bullet.damage)
+            entity.wake(self.settings["activity"]["hit_wake_steps"])
             # self._remove_bullet(bullet, sim)
 
             self.model.effects.add_particles(
@@ -635,8 +935,11 @@ class EntityManager:
         """
         shape = self.bullets_dict.get(bullet, None)
 
-        sim.remove(shape, shape.body)
+        if shape.space is not None:  # swept and hitscan bullets are never added
+            sim.remove(shape, shape.body)
         self.bullets_dict.pop(bullet)
+        self.registry.release(bullet.id)
+        self.bullet_pool.release(bullet)
 
     def remove_killed(self, sim: pymunk.Space):
         """
@@ -685,14 +988,6 @@ class EntityManager:
         entity.kill()
         return True
 
-    def _get_next_bullet_id(self):
-        """
-        Generates a unique ID for a new bullet.
-
-        :return: A unique integer ID.
-        """
-        return max([bullet.id for bullet in self.bullets_dict.keys()] + [0]) + 1
-
     def remove_entity(self, entity):
         """
         Removes an entity's physics components from the simulation and updates entity records.
@@ -708,3 +1003,4 @@ class EntityManager:
             self.player = None
         else:
             self.enemies.discard(entity)
+        self.registry.release(entity.ent_id)
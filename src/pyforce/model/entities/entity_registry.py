@@ -0,0 +1,93 @@
+"""
+This module contains the EntityRegistry class which hands out the IDs of entities and bullets and finds them by ID.
+"""
+
+# the lower bits of an ID are the slot, the upper ones the generation of the slot
+INDEX_BITS = 20
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityRegistry:
+    """
+    The EntityRegistry class stores the player, enemies and bullets in reusable slots. An ID combines a slot
+    with the slot's generation, which changes when the slot is released, so an ID of a removed object
+    never finds the object reusing its slot. Physics shapes carry the ID of their owner,
+    collision callbacks resolve it through the registry.
+
+    Attributes:
+        slots (list): The registered objects, None for free slots.
+        generations (list[int]): The current generation of every slot.
+        free (list[int]): Indices of the free slots.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+
+        :return: None
+        """
+        self.slots: list = []
+        self.generations: list[int] = []
+        self.free: list[int] = []
+
+    def allocate(self) -> int:
+        """
+        Reserves a slot for an object which needs its ID while being created.
+
+        :return: The ID of the slot, pass it to bind once the object exists.
+        """
+        if self.free:
+            index = self.free.pop()
+        else:
+            index = len(self.slots)
+            if index > INDEX_MASK:
+                raise OverflowError("No free slots left in the entity registry")
+            self.slots.append(None)
+            self.generations.append(1)  # IDs are never 0
+        return (self.generations[index] << INDEX_BITS) | index
+
+    def bind(self, ent_id: int, obj):
+        """
+        Stores an object in the slot reserved by allocate.
+
+        :param ent_id: The ID returned by allocate.
+        :param obj: The object to store.
+        :return: None
+        """
+        self.slots[ent_id & INDEX_MASK] = obj
+
+    def get(self, ent_id: int | None):
+        """
+        Finds an object by its ID.
+
+        :param ent_id: The ID of the object.
+        :return: The object, or None if it was released or the ID is unknown.
+        """
+        if ent_id is None:
+            return None
+        index = ent_id & INDEX_MASK
+        if index >= len(self.slots) or self.generations[index] != ent_id >> INDEX_BITS:
+            return None
+        return self.slots[index]
+
+    def release(self, ent_id: int):
+        """
+        Removes an object, its ID becomes stale. Releasing a stale ID does nothing.
+
+        :param ent_id: The ID of the object.
+        :return: None
+        """
+        if self.get(ent_id) is None:
+            return
+        index = ent_id & INDEX_MASK
+        self.slots[index] = None
+        self.generations[index] += 1
+        self.free.append(index)
+
+    def __len__(self):
+        """
+        Counts the registered objects.
+
+        :return: The number of objects.
+        """
+        return len(self.slots) - len(self.free)
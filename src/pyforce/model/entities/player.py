@@ -18,23 +18,26 @@ class Player:
         name (str): The name identifier for the player ("player").
         settings (dict): Dictionary containing game settings.
         entity_manager (EntityManager): Reference to the entity manager.
+        ent_id (int): ID of the player in the EntityRegistry.
         health (int): Current health of the player.
         max_health (int): Maximum health of the player.
         body (pymunk.Body): Physics body of the player.
         shape (pymunk.Poly): Physics shape of the player.
         feet (pymunk.Shape): Physics shape for the player's feet (collision detection).
+        previous_position (Vec2d): Position before the last model step, used for render interpolation.
         state_manager (StateManager): Manages the player's animation and movement state.
         arm_deg (float): The current rotation angle of the player's arm.
         gun_held (str): The name of the currently held gun.
         ammo_used (str): The type of ammo currently used.
     """
 
-    def __init__(self, settings: dict, entity_manager):
+    def __init__(self, settings: dict, entity_manager, ent_id: int):
         """
         Initializes the Player instance with settings and a reference to the entity manager.
 
         :param settings: Dictionary containing game settings.
         :param entity_manager: The EntityManager instance.
+        :param ent_id: ID of the player in the EntityRegistry.
         :return: None
         """
         self.name = "player"
@@ -43,9 +46,11 @@ class Player:
         self.health = self.settings["player_info"]["health"]
         self.max_health = self.health
 
+        self.ent_id = ent_id
         self.body, self.shape, self.feet = prepare_collision_box(
-            self.name, settings, self
+            self.name, settings, ent_id
         )
+        self.previous_position = self.body.position
         self.state_manager = StateManager(self)
 
         self.arm_deg = 0  # 0 means pointing down, turns counter-clockwise
@@ -2,13 +2,19 @@
 This module contains the Model class which acts as the main data and logic coordinator for the game.
 """
 
+import random
+from collections.abc import Iterable
+
 from pyforce.model.physics import PhysicsEngine
+from pyforce.model.navigation import NavigationGraph
+from pyforce.model.spatial import SpatialGrid
 from loguru import logger
-from pyforce.structures import Where, DebugElements, RenderInfo
-from pyforce.constants import Difficulty, GameMode, Direction
+from pyforce.structures import Where, DebugElements, RenderInfo, BulletRenderInfo
+from pyforce.constants import AmmoMode, Difficulty, GameMode, Direction
 from pyforce.model.effects import EffectsManager
 from pyforce.model.pickups import PickupManager
 from pyforce.model.entities import EntityManager
+from pyforce.profiling import FrameProfiler
 
 
 class Model:
@@ -18,29 +24,82 @@ class Model:
     Attributes:
         settings (dict): Dictionary containing game settings.
         physics (PhysicsEngine): The physics engine managing the simulation.
+        navigation (NavigationGraph | None): Routes between the map's platforms, None if disabled.
         entities (EntityManager): Manages all game entities (player, enemies, bullets).
-        where_array (list[Where]): Current rendering information for all entities.
+        spatial_index (SpatialGrid): Positions of enemies, pickups and particles, rebuilt every update.
+        where_array (list[Where]): Current rendering information for the player and the enemies in view.
         debug_elements (DebugElements): Information used for debug rendering.
+        profiler (FrameProfiler): Times the stages of update.
+        seed (int): Seed of the random number generator, stored with replays.
+        rng (random.Random): The only source of randomness used by the game logic.
     """
 
-    def __init__(self, settings: dict, player_stats):
+    def __init__(
+        self,
+        settings: dict,
+        player_stats,
+        profiler: FrameProfiler | None = None,
+        seed: int | None = None,
+    ):
         """
         Initializes the Model with settings, physics engine, and entity manager.
 
         :param settings: Dictionary containing game settings.
+        :param profiler: Optional FrameProfiler, a disabled one is created if None.
+        :param seed: Seed of the random number generator, a random one is picked if None.
         :return: None
         """
         logger.info("Initializing model...")
 
         self.settings = settings
         self.player_stats = player_stats
+        if profiler is None:
+            profiler = FrameProfiler(
+                self.settings["debug"]["profiler"]["buffer_size"], enabled=False
+            )
+        self.profiler = profiler
 
         self.physics = PhysicsEngine(self.settings)
+        self.navigation = None
+        if self.settings["navigation"]["enabled"]:
+            self.navigation = NavigationGraph(
+                self.settings, self.physics.collision_rects
+            )
+        self._start_game(seed)
+
+    def reset(self, player_stats, seed: int | None = None):
+        """
+        Starts a new game in place. Entities, effects and pickups are created again,
+        the physics space and the navigation graph keep their static map geometry.
+
+        :param player_stats: The PlayerStats of the new game.
+        :param seed: Seed of the random number generator, a random one is picked if None.
+        :return: None
+        """
+        logger.info("Resetting model...")
+
+        self.player_stats = player_stats
+        self.physics.reset()
+        self._start_game(seed)
+
+    def _start_game(self, seed: int | None):
+        """
+        Creates the game state: the random number generator, entities, effects and pickups.
+
+        :param seed: Seed of the random number generator, a random one is picked if None.
+        :return: None
+        """
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+
+        self.spatial_index = SpatialGrid(self.settings["spatial_index"]["cell_size"])
+
         self.entities = EntityManager(self.settings, self.physics.sim, self)
-        self.effects = EffectsManager(self.settings)
+        self.effects = EffectsManager(self.settings, self.rng)
         self.pickups = PickupManager(self.settings, self)
 
         self.insert_ents_to_sim()
+        self._update_spatial_index()
 
         self.where_array = self._create_where()
         self.debug_elements = self._add_debug()
@@ -54,10 +113,10 @@ class Model:
         info = RenderInfo(
             player_pos=self.entities.get_player_pos(),
             where_array=self.get_where_array(),
-            bullets_dict=self.get_bullets_dict(),
+            bullets=self._get_visible_bullets(),
             debug_elements=self.debug_elements,
-            effects=self.effects.get_effects(),
-            pickups=self.pickups.get_pickups(),
+            effects=self.effects.get_effects(self._get_visible_particles()),
+            pickups=self._get_visible("pickup", self.pickups.get_pickups()),
         )
         return info
 
@@ -78,10 +137,11 @@ class Model:
         """
         self.entities.apply_difficulty(difficulty)
 
-    def game_ended(self, game_mode: GameMode):
+    def game_ended(self, game_mode: GameMode | None):
         """
         Checks if the game is still ongoing (player is alive).
 
+        :param game_mode: The GameMode being played, None if no mode was chosen.
         :return: True if the player exists, False otherwise.
         """
         if game_mode == GameMode.SPEEDRUN and len(self.entities.enemies) == 0:
@@ -104,13 +164,33 @@ class Model:
         :param mouse_pos: The current position of the mouse.
         :return: None
         """
+        profiler = self.profiler
+        profiler.begin()
+
+        self.entities.store_previous_positions()
         self._update_entities(mouse_pos)
+        profiler.mark("update.entities")
         self._update_effects()
+        profiler.mark("update.effects")
         self._update_pickups()
-        self._update_where_array()
+        profiler.mark("update.pickups")
         self.physics.sim.step(self.settings["physics"]["time_step"])
+        self.entities.sweep_bullets(
+            self.physics.events, self.settings["physics"]["time_step"]
+        )
+        self.entities.bullet_store.sync_positions()
+        profiler.mark("update.physics")
+        # after the step and before its users, so every query sees current positions
+        self._update_spatial_index()
+        profiler.mark("update.spatial_index")
+        self._update_where_array()
+        profiler.mark("update.where_array")
         self._update_damage()
+        profiler.mark("update.damage")
         self._spawn()
+        profiler.mark("update.spawn")
+
+        profiler.end("update")
 
     def _spawn(self):
         """
@@ -128,16 +208,118 @@ class Model:
 
         :return: None
         """
-        self.entities.handle_hits(self.physics.entities_hit, self.physics.sim)
-        self.entities.handle_kills(self.physics.entities_to_kill)
+        events = self.physics.drain_events()
+        self.entities.handle_hits(events.hits, self.physics.sim)
+        self.entities.handle_kills(events.kills)
 
     def _update_where_array(self):
         """
-        Updates the rendering information for all entities.
+        Advances the animations of all entities and updates the rendering information
+        of the player and the enemies in view.
+
+        :return: None
+        """
+        self.entities.advance_animations()
+        self.where_array = self.entities.get_where_array(self._get_visible_enemies())
+
+    def index_enemy(self, enemy):
+        """
+        Adds an enemy to the spatial index, used for enemies spawned between two rebuilds.
 
+        :param enemy: The Enemy instance.
         :return: None
         """
-        self.where_array = self.entities.get_where_array()
+        if not self.settings["spatial_index"]["enabled"]:
+            return
+        bb = enemy.shape.cache_bb()
+        # pymunk's bottom is the smaller Y, which is the top on screen
+        self.spatial_index.insert("enemy", enemy, bb.left, bb.bottom, bb.right, bb.top)
+
+    def _update_spatial_index(self):
+        """
+        Rebuilds the spatial index from the current positions of enemies, pickups and particles.
+        Bullets are culled by the BulletStore from its position columns.
+
+        :return: None
+        """
+        index = self.spatial_index
+        index.clear()
+        if not self.settings["spatial_index"]["enabled"]:
+            return
+
+        for enemy in self.entities.enemies:
+            self.index_enemy(enemy)
+        for pickup in self.pickups.get_pickups():
+            index.insert_point("pickup", pickup, pickup.pos.x, pickup.pos.y)
+        # bursts of particles are spawned on screen, so indexing them rarely pays off
+        if self.settings["spatial_index"]["index_particles"]:
+            for particle in self.effects.particles:
+                index.insert_point("particle", particle, particle.pos.x, particle.pos.y)
+
+    def _get_view_rect(self) -> tuple[float, float, float, float]:
+        """
+        Calculates the part of the map the camera shows, widened by a margin for sprites
+        larger than their position and for movement until the next update.
+
+        :return: A (left, top, right, bottom) tuple.
+        """
+        x, y = self.entities.get_player_pos()
+        half_x = self.settings["screen"]["size_x"] / 2
+        half_y = self.settings["screen"]["size_y"] / 2
+        # the camera follows the player but stops at the map's borders
+        x = max(half_x, min(x, self.settings["map"]["size_x"] - half_x))
+        y = max(half_y, min(y, self.settings["map"]["size_y"] - half_y))
+
+        margin = self.settings["spatial_index"]["view_margin"]
+        return (
+            x - half_x - margin,
+            y - half_y - margin,
+            x + half_x + margin,
+            y + half_y + margin,
+        )
+
+    def _get_visible(self, kind: str, objects: list) -> list:
+        """
+        Retrieves the objects of a kind in view.
+
+        :param kind: The kind of objects in the spatial index, e.g., 'pickup'.
+        :param objects: All objects of the kind, returned if the spatial index is disabled.
+        :return: A list of objects.
+        """
+        if not self.settings["spatial_index"]["enabled"]:
+            return objects
+        return self.spatial_index.query_rect(kind, *self._get_view_rect())
+
+    def _get_visible_enemies(self) -> Iterable:
+        """
+        Retrieves the enemies in view, all of them if the spatial index is disabled.
+
+        :return: An iterable of Enemy instances.
+        """
+        if not self.settings["spatial_index"]["enabled"]:
+            return self.entities.enemies
+        return self.spatial_index.query_rect("enemy", *self._get_view_rect())
+
+    def _get_visible_particles(self) -> list:
+        """
+        Retrieves the particles in view, all of them if they aren't indexed.
+
+        :return: A list of Particle instances.
+        """
+        if not self.settings["spatial_index"]["index_particles"]:
+            return self.effects.particles
+        return self._get_visible("particle", self.effects.particles)
+
+    def _get_visible_bullets(self) -> BulletRenderInfo:
+        """
+        Retrieves the names and positions of the bullets in view, all of them if the spatial index is disabled.
+
+        :return: A BulletRenderInfo instance.
+        """
+        view_rect = None
+        if self.settings["spatial_index"]["enabled"]:
+            view_rect = self._get_view_rect()
+        return self.entities.bullet_store.get_render_info(view_rect)
 
     def _update_effects(self):
         """
@@ -158,7 +340,7 @@ class Model:
     def _update_entities(self, mouse_pos):
         self.entities.update_entity_states()
         self.entities.update_timers()
-        self.entities.update_ground_contact(self.physics.entities_touching_ground)
+        self.entities.update_ground_contact(self.physics.ground_contacts)
         self.entities.update_enemy_action(self.physics.sim)
         self.entities.update_player_aim(mouse_pos)
         self.entities.update_bullets()
@@ -226,7 +408,8 @@ class Model:
 
         :return: A list of Where objects.
         """
-        return self.entities.get_where_array()
+        self.entities.advance_animations()
+        return self.entities.get_where_array(self._get_visible_enemies())
 
     def insert_ents_to_sim(self):
         """
@@ -253,7 +436,8 @@ class Model:
 
     def player_shoot(self):
         """
-        Triggers the player's shooting action and adds the bullet to the simulation.
+        Triggers the player's shooting action. Simulated bullets are added to the physics simulation,
+        hitscan ones resolve their hit right away.
 
         :return: None
         """
@@ -269,7 +453,30 @@ class Model:
             if body is None or shape is None or bullet is None:
                 continue
 
-            self.physics.sim.add(body, shape)
+            if bullet.ammo.mode == AmmoMode.PHYSICS:
+                self.physics.sim.add(body, shape)
+            elif bullet.ammo.mode == AmmoMode.HITSCAN:
+                self.entities.fire_hitscan(bullet, self.physics.events)
+
+    def apply_actions(self, actions):
+        """
+        Applies the key binding actions resolved for one frame to the player.
+
+        :param actions: A collection of action names (e.g., 'move_left', 'shoot').
+        :return: None
+        """
+        if "switch_weapon" in actions:
+            self.player_switch_weapon()
+        if "move_left" in actions:
+            self.move_player(Direction.LEFT)
+        if "move_right" in actions:
+            self.move_player(Direction.RIGHT)
+        if "jump" in actions:
+            self.move_player(Direction.UP)
+        if "shoot" in actions:
+            self.player_shoot()
+        if "pickup" in actions:
+            self.player_pickup()
 
     def player_switch_weapon(self):
         current = self.entities.player.gun_held
@@ -0,0 +1,3 @@
+from .navigation_graph import NavigationGraph
+
+__all__ = ["NavigationGraph"]
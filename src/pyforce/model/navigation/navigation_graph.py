@@ -0,0 +1,373 @@
+"""
+This module contains the NavigationGraph class which lets enemies find routes between the platforms of the map.
+"""
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+
+from loguru import logger
+
+from pyforce.constants import NavLinkType
+from pyforce.structures import CollisionRect, NavLink, Platform
+
+
+class NavigationGraph:
+    """
+    The NavigationGraph class is built once from the map's collision rectangles. Its nodes are the surfaces
+    enemies can stand on and its edges the walks, jumps and drops between them. The shortest routes
+    to a platform are computed the first time an enemy chases the player there and are shared
+    by all enemies afterwards, the geometry never changes so they never go stale.
+
+    Attributes:
+        settings (dict): Dictionary containing game settings.
+        platforms (list[Platform]): All platforms, indexed by their ID.
+        links (list[NavLink]): All links between the platforms.
+        path_platforms (dict[tuple, int]): Maps the ID of a patrol path to the platform it lies on.
+    """
+
+    def __init__(self, settings: dict, rects: list[CollisionRect]):
+        """
+        Builds the platforms and links from the map's collision rectangles and the patrol paths.
+
+        :param settings: Dictionary containing game settings.
+        :param rects: The rectangles of the map's collision object layer.
+        :return: None
+        """
+        self.settings = settings
+        rects = [rect for rect in rects if rect.width > 1 and rect.height > 1]
+
+        self.platforms = self._find_platforms(rects)
+
+        # platforms grouped by height, for locating entities by bisection
+        surfaces: dict[float, list[Platform]] = {}
+        for platform in sorted(self.platforms, key=lambda p: (p.height, p.left)):
+            surfaces.setdefault(platform.height, []).append(platform)
+        self._heights = sorted(surfaces)
+        self._surfaces = [surfaces[height] for height in self._heights]
+
+        self.links = self._find_links(rects)
+        self.path_platforms = self._match_patrol_paths()
+
+        self._incoming: list[list[NavLink]] = [[] for _ in self.platforms]
+        for link in self.links:
+            self._incoming[link.target].append(link)
+
+        self._routes: dict[int, dict[int, NavLink]] = {}
+
+        logger.info(
+            f"Navigation graph built with {len(self.platforms)} platforms "
+            f"and {len(self.links)} links"
+        )
+
+    def locate(self, x: float, y: float) -> Platform | None:
+        """
+        Finds the platform under a point, e.g., the bottom of an entity's feet.
+
+        :param x: The X coordinate.
+        :param y: The Y coordinate.
+        :return: The Platform, or None if the point isn't on any.
+        """
+        tolerance = self.settings["navigation"]["locate_tolerance"]
+        start = bisect_left(self._heights, y - tolerance)
+        end = bisect_right(self._heights, y + tolerance)
+        for surfaces in self._surfaces[start:end]:
+            for platform in surfaces:
+                if platform.left <= x <= platform.right:
+                    return platform
+        return None
+
+    def locate_entity(self, entity) -> Platform | None:
+        """
+        Finds the platform an entity stands on. The platform of an enemy's patrol path is tried first,
+        the enemy may have left the path since it was assigned.
+
+        :param entity: The player or an enemy.
+        :return: The Platform, or None if the entity isn't on any.
+        """
+        x = entity.get_position().x
+        # pymunk's top is the larger Y, which is the bottom of the feet on screen
+        y = entity.feet.bb.top
+
+        patrol_path = getattr(entity, "patrol_path", None)
+        if patrol_path is not None and patrol_path.id in self.path_platforms:
+            platform = self.platforms[self.path_platforms[patrol_path.id]]
+            tolerance = self.settings["navigation"]["locate_tolerance"]
+            if (
+                platform.left <= x <= platform.right
+                and abs(platform.height - y) <= tolerance
+            ):
+                return platform
+
+        return self.locate(x, y)
+
+    def get_next_link(self, source: int, target: int) -> NavLink | None:
+        """
+        Retrieves the first link of the shortest route between two platforms.
+
+        :param source: ID of the platform the route starts on.
+        :param target: ID of the platform the route leads to.
+        :return: The NavLink to take, or None if the platforms are the same or not connected.
+        """
+        routes = self._routes.get(target)
+        if routes is None:
+            routes = self._find_routes(target)
+            self._routes[target] = routes
+        return routes.get(source)
+
+    def _find_routes(self, target: int) -> dict[int, NavLink]:
+        """
+        Runs Dijkstra's algorithm backwards from the target platform. The cost of a route is the length
+        of its links plus the walks on the platforms in between.
+
+        :param target: ID of the platform the routes lead to.
+        :return: A dictionary mapping platform IDs to the first link of their route.
+        """
+        routes = {}
+        costs = {target: 0.0}
+        # the X coordinate where the route leaves the platform, the target has none
+        exits: dict[int, float | None] = {target: None}
+        done = set()
+
+        queue = [(0.0, target)]
+        while queue:
+            cost, platform = heapq.heappop(queue)
+            if platform in done:
+                continue
+            done.add(platform)
+
+            for link in self._incoming[platform]:
+                exit_x = exits[platform]
+                walk = 0 if exit_x is None else abs(exit_x - link.landing_x)
+                new_cost = cost + walk + link.cost
+                if new_cost < costs.get(link.source, math.inf):
+                    costs[link.source] = new_cost
+                    exits[link.source] = link.takeoff_x
+                    routes[link.source] = link
+                    heapq.heappush(queue, (new_cost, link.source))
+
+        return routes
+
+    def _find_platforms(self, rects: list[CollisionRect]) -> list[Platform]:
+        """
+        Finds the walkable surfaces: the tops of solid rectangles, without the parts covered by
+        another rectangle and without the ones too narrow to stand on.
+
+        :param rects: The rectangles of the map's collision object layer.
+        :return: A list of Platform instances.
+        """
+        min_width = self.settings["navigation"]["min_platform_width"]
+
+        surfaces: dict[float, list[tuple[float, float]]] = {}
+        for rect in rects:
+            if rect.type in ["water", "explosive"]:
+                continue
+            intervals = [(rect.x, rect.x + rect.width)]
+            for other in rects:
+                if other.y < rect.y <= other.y + other.height:
+                    intervals = _subtract(intervals, other.x, other.x + other.width)
+            surfaces.setdefault(rect.y, []).extend(intervals)
+
+        platforms: list[Platform] = []
+        for height in sorted(surfaces):
+            for left, right in _merge(surfaces[height]):
+                if right - left >= min_width:
+                    platforms.append(Platform(len(platforms), left, right, height))
+        return platforms
+
+    def _find_links(self, rects: list[CollisionRect]) -> list[NavLink]:
+        """
+        Connects the platforms. From both ends of a platform an enemy can walk onto a touching platform
+        of about the same height, drop onto the first surface below the edge or jump across a gap
+        to a platform within its jump range. Long falls are left to drops, which find the first surface
+        below the edge instead of jumping through it.
+
+        :param rects: The rectangles of the map's collision object layer.
+        :return: A list of NavLink instances.
+        """
+        settings = self.settings["navigation"]
+        margin = settings["edge_margin"]
+
+        links = []
+        for source in self.platforms:
+            for edge, step in [(source.left, -1), (source.right, 1)]:
+                drop = self._find_drop(rects, source, edge, step)
+                if drop is not None:
+                    links.append(drop)
+
+                for target in self.platforms:
+                    if target is source:
+                        continue
+                    # the gap between the platforms in the direction of the edge
+                    gap = (target.left - edge) if step > 0 else (edge - target.right)
+                    rise = source.height - target.height
+
+                    if (
+                        0 <= gap <= settings["walk_step"]
+                        and abs(rise) <= settings["walk_step"]
+                    ):
+                        links.append(
+                            self._create_link(
+                                NavLinkType.WALK,
+                                source,
+                                target,
+                                edge,
+                                edge + step * gap,
+                            )
+                        )
+                    elif (
+                        0 <= gap <= settings["max_jump_distance"]
+                        and -settings["max_fall_height"]
+                        <= rise
+                        <= settings["max_jump_height"]
+                    ):
+                        links.append(
+                            self._create_link(
+                                NavLinkType.JUMP,
+                                source,
+                                target,
+                                edge - step * margin,
+                                edge + step * (gap + margin),
+                            )
+                        )
+
+            links.extend(self._find_climbs(source))
+
+        # a climb next to a touching platform is also found as a jump over the gap
+        return list(dict.fromkeys(links))
+
+    def _find_drop(
+        self, rects: list[CollisionRect], source: Platform, edge: float, step: int
+    ) -> NavLink | None:
+        """
+        Finds the surface an enemy walking off an edge lands on.
+
+        :param rects: The rectangles of the map's collision object layer.
+        :param source: The platform the enemy walks off.
+        :param edge: X coordinate of the edge.
+        :param step: 1 for the right edge, -1 for the left one.
+        :return: A DROP NavLink, or None if the enemy would land in water or off the graph.
+        """
+        x = edge + step
+        below = [
+            rect
+            for rect in rects
+            if rect.x <= x <= rect.x + rect.width and rect.y > source.height
+        ]
+        if not below:
+            return None
+
+        first = min(below, key=lambda rect: rect.y)
+        target = self.locate(x, first.y) if first.type != "water" else None
+        if target is None or target is source:
+            return None
+        return self._create_link(NavLinkType.DROP, source, target, edge, x)
+
+    def _find_climbs(self, source: Platform) -> list[NavLink]:
+        """
+        Finds the higher platforms above the source an enemy can jump onto from beside their ends.
+
+        :param source: The platform the enemy jumps from.
+        :return: A list of JUMP NavLink instances.
+        """
+        settings = self.settings["navigation"]
+        margin = settings["edge_margin"]
+
+        climbs = []
+        for target in self.platforms:
+            rise = source.height - target.height
+            if not 0 < rise <= settings["max_jump_height"]:
+                continue
+            for edge, step in [(target.left, -1), (target.right, 1)]:
+                # take off next to the target's end, still on the source platform
+                takeoff = edge + step * margin
+                if source.left <= takeoff <= source.right:
+                    climbs.append(
+                        self._create_link(
+                            NavLinkType.JUMP,
+                            source,
+                            target,
+                            takeoff,
+                            edge - step * margin,
+                        )
+                    )
+        return climbs
+
+    @staticmethod
+    def _create_link(
+        link_type: NavLinkType,
+        source: Platform,
+        target: Platform,
+        takeoff_x: float,
+        landing_x: float,
+    ) -> NavLink:
+        """
+        Creates a link, its cost is the distance between the takeoff and the landing point.
+
+        :param link_type: The NavLinkType of the move.
+        :param source: The platform the link starts on.
+        :param target: The platform the link ends on.
+        :param takeoff_x: X coordinate where the move starts.
+        :param landing_x: X coordinate where the move ends.
+        :return: A NavLink instance.
+        """
+        cost = math.hypot(landing_x - takeoff_x, target.height - source.height)
+        return NavLink(link_type, source.id, target.id, takeoff_x, landing_x, cost)
+
+    def _match_patrol_paths(self) -> dict[tuple, int]:
+        """
+        Assigns every patrol path to the highest platform below it that overlaps its range.
+
+        :return: A dictionary mapping patrol path IDs to platform IDs.
+        """
+        path_platforms = {}
+        for path in self.settings["patrol_paths"]:
+            start, end = path["x_range"]
+            candidates = [
+                platform
+                for platform in self.platforms
+                if platform.height >= path["height"]
+                and platform.left < end
+                and platform.right > start
+            ]
+            if candidates:
+                platform = min(candidates, key=lambda p: p.height)
+                path_platforms[(start, end, path["height"])] = platform.id
+        return path_platforms
+
+
+def _subtract(intervals, start: float, end: float) -> list[tuple[float, float]]:
+    """
+    Removes a range from a list of intervals.
+
+    :param intervals: A list of (start, end) tuples.
+    :param start: Start of the range to remove.
+    :param end: End of the range to remove.
+    :return: A list of (start, end) tuples.
+    """
+    result = []
+    for left, right in intervals:
+        if end <= left or start >= right:
+            result.append((left, right))
+            continue
+        if left < start:
+            result.append((left, start))
+        if end < right:
+            result.append((end, right))
+    return result
+
+
+def _merge(intervals) -> list[tuple[float, float]]:
+    """
+    Merges touching or overlapping intervals.
+
+    :param intervals: A list of (start, end) tuples.
+    :return: A sorted list of (start, end) tuples.
+    """
+    merged: list[tuple[float, float]] = []
+    for left, right in sorted(intervals):
+        if merged and left <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], right))
+        else:
+            merged.append((left, right))
+    return merged
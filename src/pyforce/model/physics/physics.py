@@ -3,24 +3,29 @@ This module contains the PhysicsEngine class which manages the physical simulati
 """
 
 import pymunk
-import pytmx
-import os
 from loguru import logger
 from pymunk import ShapeFilter
-from pyforce.model.entities import Player
-from pyforce.model.entities.enemies import Enemy
+from pyforce.maps import PlatformEdges, load_collision_rects, merge_rects
+from pyforce.structures import CollisionEvents, CollisionRect
 
 
 class PhysicsEngine:
     """
     The PhysicsEngine class handles the pymunk physics simulation, map collisions, and collision callbacks.
 
+    Bullet hits and water kills are events, buffered per step and handed over by drain_events.
+    Ground contacts are persistent state instead: ground_contacts and the enemy contacts counted as
+    ground follow the begin and separate callbacks across steps, are never drained and only reset clears them.
+
     Attributes:
         settings (dict): Dictionary containing game settings.
         sim (pymunk.Space): The pymunk physics simulation space.
-        entities_touching_ground (list[int]): List of entity IDs currently touching a platform.
-        entities_hit (list): List of (entity, bullet) tuples representing recent hits.
-        entities_to_kill (list): List of entities marked for removal (e.g., from falling into water).
+        ground_contacts (dict[int, int]): Number of shapes the feet of an entity stand on, by the feet's ID.
+        events (CollisionEvents): Buffer the collision callbacks of the current step write to.
+        collision_rects (list[CollisionRect]): The map rectangles added to the static body,
+            after merging when it's enabled.
+        platform_edges (PlatformEdges | None): Edges of the map geometry seen by line-of-sight
+            raycasts, None if gap checks use the physics engine.
     """
 
     def __init__(self, settings: dict):
@@ -37,13 +42,42 @@ class PhysicsEngine:
         self._prepare_space()
         self._set_collision_handlers()
 
-        # stores entity ids touching the ground
-        self.entities_touching_ground: list[Player | Enemy] = []
+        # a foot spanning two tiles touches both, it only leaves the ground when it separates from the last
+        self.ground_contacts: dict[int, int] = {}
+        # the player's feet touching an enemy only count as ground when landing on top of it
+        self._counted_enemy_contacts: set[tuple[pymunk.Shape, pymunk.Shape]] = set()
+
+        # double buffer, callbacks fill one while the model resolves the other
+        self.events = CollisionEvents()
+        self._drained_events = CollisionEvents()
+
+    def drain_events(self) -> CollisionEvents:
+        """
+        Hands over the events recorded since the previous call and starts an empty buffer.
+        The returned events stay valid until the next call. Ground contacts are not events and aren't drained.
+
+        :return: A CollisionEvents instance.
+        """
+        events = self.events
+        self._drained_events.clear()
+        self.events, self._drained_events = self._drained_events, events
+        return events
+
+    def reset(self):
+        """
+        Removes every dynamic body from the simulation and clears the collision records.
+        The static map geometry and the collision handlers are kept.
+
+        :return: None
+        """
+        for body in list(self.sim.bodies):
+            if body.body_type != pymunk.Body.STATIC:
+                self.sim.remove(body, *body.shapes)
 
-        self.entities_hit: list[
-            Enemy
-        ] = []  # list to store all entities hit by bullets, emptied after hit is resolved
-        self.entities_to_kill: list[Enemy] = []
+        self.ground_contacts.clear()
+        self._counted_enemy_contacts.clear()
+        self.events.clear()
+        self._drained_events.clear()
 
     def _set_collision_handlers(self):
         """
@@ -82,7 +116,7 @@ class PhysicsEngine:
             self.settings["physics"]["collision_types"]["player_feet"],
             self.settings["physics"]["collision_types"]["enemy"],
             begin=self._should_touch_ground,
-            separate=self._entity_leaving_ground,
+            separate=self._should_leave_ground,
         )
 
     def _should_touch_ground(self, arbiter, space, data):
@@ -94,8 +128,22 @@ class PhysicsEngine:
         """
         normal = arbiter.normal
         if normal.y > 0:  # normal is down (y-axis is inverted)
+            self._counted_enemy_contacts.add(arbiter.shapes)
             self._entity_touching_ground(arbiter, space, data)
 
+    def _should_leave_ground(self, arbiter, space, data):
+        """
+        Collision callback: Records the player leaving an enemy, if touching it counted as standing on ground.
+
+        :param arbiter: The pymunk Arbiter instance.
+        :param space: The pymunk Space.
+        :param data: Arbitrary data passed to the callback.
+        :return: None
+        """
+        if arbiter.shapes in self._counted_enemy_contacts:
+            self._counted_enemy_contacts.discard(arbiter.shapes)
+            self._entity_leaving_ground(arbiter, space, data)
+
     def _add_to_kill_list(self, arbiter, space, data):
         """
         Collision callback: Marks an entity for death when it touches water.
@@ -105,10 +153,9 @@ class PhysicsEngine:
         :param data: Arbitrary data passed to the callback.
         :return: True to allow the collision to be processed.
         """
-        entity = getattr(arbiter.shapes[0], "entity", None)
-        if entity is not None:
-            self.entities_to_kill.append(entity)
-            logger.info(f"Entity {entity.name} killed by collision with water.")
+        identifier = getattr(arbiter.shapes[0], "id", None)
+        if identifier is not None:
+            self.events.kills.append(identifier)
 
         return True
 
@@ -121,13 +168,12 @@ class PhysicsEngine:
         :param data: Arbitrary data passed to the callback.
         :return: True to allow the collision to be processed.
         """
-        bullet = getattr(arbiter.shapes[0], "bullet", None)
-        entity = getattr(
-            arbiter.shapes[1], "entity", None
-        )  # a bullet is the first shape in the arbiter
+        # a bullet is the first shape in the arbiter
+        bullet_id = getattr(arbiter.shapes[0], "id", None)
+        entity_id = getattr(arbiter.shapes[1], "id", None)
 
-        if entity is not None and bullet is not None:
-            self.entities_hit.append((entity, bullet))
+        if entity_id is not None and bullet_id is not None:
+            self.events.hits.append((entity_id, bullet_id))
 
         return True
 
@@ -144,8 +190,7 @@ class PhysicsEngine:
         if identifier is None:
             return True
 
-        if identifier not in self.entities_touching_ground:
-            self.entities_touching_ground.append(identifier)
+        self.ground_contacts[identifier] = self.ground_contacts.get(identifier, 0) + 1
         return True
 
     def _entity_leaving_ground(self, arbiter, space, data):
@@ -161,9 +206,11 @@ class PhysicsEngine:
         if identifier is None:
             return True
 
-        identifier = arbiter.shapes[0].id
-        if identifier in self.entities_touching_ground:
-            self.entities_touching_ground.remove(identifier)
+        contacts = self.ground_contacts.get(identifier, 0) - 1
+        if contacts > 0:
+            self.ground_contacts[identifier] = contacts
+        else:
+            self.ground_contacts.pop(identifier, None)
         return True
 
     def _prepare_space(self):
@@ -176,20 +223,64 @@ class PhysicsEngine:
         self._add_map()
         self.sim.collision_bias = self.settings["physics"]["collision_bias"]
         self.sim.collision_slop = self.settings["physics"]["collision_slop"]
+        if self.settings["activity"]["enabled"]:
+            # far away enemies are put to sleep, which pymunk only allows with a finite threshold
+            self.sim.sleep_time_threshold = self.settings["activity"][
+                "sleep_time_threshold"
+            ]
 
         logger.info("Physics engine platform collision shapes added.")
 
+        if self.settings["physics"]["spatial_hash"]["enabled"]:
+            self._use_spatial_hash()
+
+    def _use_spatial_hash(self):
+        """
+        Replaces the default bounding box tree broadphase with a spatial hash.
+        Unset parameters are derived: the cell size from the map's tile size, and the
+        number of cells from the number of shapes the space is expected to hold.
+
+        :return: None
+        """
+        spatial_hash = self.settings["physics"]["spatial_hash"]
+
+        dimension = spatial_hash["dimension"]
+        if dimension is None:
+            dimension = self.settings["map"]["tile_size"]
+
+        count = spatial_hash["count"]
+        if count is None:
+            max_enemies = max(
+                difficulty["max_enemies_on_map"]
+                for difficulty in self.settings["difficulty_changes"].values()
+            )
+            max_bullets = max(
+                weapon["multishot"] for weapon in self.settings["weapons"].values()
+            )
+            # every entity has a body and feet shape, pymunk suggests ~10 cells per shape
+            shapes = len(self.sim.shapes) + 2 * (max_enemies + 1) + max_bullets
+            count = spatial_hash["cells_per_shape"] * shapes
+
+        self.sim.use_spatial_hash(dimension, count)
+        logger.info(f"Using spatial hash broadphase ({dimension=}, {count=})")
+
     def _add_map(self):
         """
         Loads map collision objects from the TMX file.
 
         :return: None
         """
-        object_layer = self._get_object_layer()
-
-        for obj in object_layer:
-            if obj.width > 1 and obj.height > 1:
-                self._add_collision_obj(obj)
+        rects = [
+            obj
+            for obj in self._get_collision_rects()
+            if obj.width > 1 and obj.height > 1
+        ]
+        if self.settings["physics"]["merge_collision_rects"]:
+            rects = merge_rects(rects)
+        self.collision_rects: list[CollisionRect] = rects
+
+        for obj in rects:
+            self._add_collision_obj(obj)
 
         walls = self.settings["physics"]["walls"]
         radius = walls["radius"]
@@ -205,61 +296,71 @@ class PhysicsEngine:
             segment.elasticity = elasticity
             self.sim.add(segment)
 
+        self.platform_edges = None
+        if self.settings["physics"]["raycast_options"]["edge_index"]:
+            self.platform_edges = self._build_platform_edges()
+
+    def _build_platform_edges(self):
+        """
+        Indexes the edges of the static shapes which line-of-sight raycasts can hit.
+        Chipmunk only tests a raycast against shapes whose bounding box the bare segment touches,
+        and a map rectangle fills its bounding box, so the bounding boxes answer the same queries.
+
+        :return: A PlatformEdges instance.
+        """
+        mask = self.settings["physics"]["collision_masks"]["line_of_sight"]
+
+        boxes = []
+        for shape in self.sim.static_body.shapes:
+            if shape.filter.categories & mask:
+                # pymunk's bottom is the smaller Y, which is the top on screen
+                bb = shape.cache_bb()
+                boxes.append((bb.left, bb.bottom, bb.right, bb.top))
+
+        logger.info(f"Indexed the edges of {len(boxes)} static shapes")
+        return PlatformEdges(boxes)
+
     def _add_collision_obj(self, obj):
         """
         Creates and adds a single collision shape to the simulation.
 
-        :param obj: The Tiled map object.
+        :param obj: The CollisionRect or Tiled map object.
         :return: None
         """
-        add = self._create_shape_body(obj, self.settings)
-        self.sim.add(add[1], add[0])
+        self.sim.add(self._create_shape(obj, self.sim.static_body, self.settings))
 
-    def _get_object_layer(self):
+    def _get_collision_rects(self):
         """
-        Retrieves the TMX object layer containing collision data.
+        Retrieves the rectangles of the TMX object layer containing collision data,
+        from the collision cache when it is up to date.
 
-        :return: A pytmx.TiledObjectGroup instance.
+        :return: A list of CollisionRect instances.
         """
         try:
-            script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            path = os.path.join(script_dir, self.settings["map"]["map_path"])
-
-            if os.name == "nt":
-                path = path.replace("/", "\\")
-
-            object_layer = pytmx.TiledMap(path).get_layer_by_name(
-                self.settings["map"]["object_layer_name"]
-            )
-            return object_layer
+            return load_collision_rects(self.settings)
         except FileNotFoundError:
             logger.error("Map file not found")
         except Exception as e:
             logger.error(f"Unexpected error loading map: {e}")
 
     @staticmethod
-    def _create_shape_body(obj, settings):
+    def _create_shape(obj, body, settings):
         """
-        Creates a static physics shape and body for a map object.
+        Creates a static physics shape for a map object. All map shapes share the space's static body,
+        so their vertices are in world coordinates.
 
-        :param obj: The Tiled map object.
+        :param obj: The CollisionRect or Tiled map object.
+        :param body: The static body to attach the shape to.
         :param settings: Dictionary containing game settings.
-        :return: A list [shape, body].
+        :return: A pymunk.Poly instance.
         """
-        body = pymunk.Body(body_type=pymunk.Body.STATIC)
-
-        h_width = obj.width / 2
-        h_height = obj.height / 2
-
-        body.position = pymunk.Vec2d(obj.x + h_width, obj.y + h_height)
-
         shape = pymunk.Poly(
             body,
             [
-                (-h_width, h_height),
-                (-h_width, -h_height),
-                (h_width, -h_height),
-                (h_width, h_height),
+                (obj.x, obj.y + obj.height),
+                (obj.x, obj.y),
+                (obj.x + obj.width, obj.y),
+                (obj.x + obj.width, obj.y + obj.height),
             ],
             radius=settings["physics"]["radius"],
         )
@@ -282,4 +383,4 @@ class PhysicsEngine:
                 mask=settings["physics"]["collision_masks"]["explosive"],
             )
 
-        return [shape, body]
+        return shape
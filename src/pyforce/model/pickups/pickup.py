@@ -5,6 +5,7 @@ from pyforce.constants import Direction
 class Pickup:
     def __init__(self, pos: Vec2d, info, callback):
         self.pos = pos
+        self.previous_pos = pos
         self.pos_range = (
             pos.y + info.movement_range[0],
             pos.y + info.movement_range[1],
@@ -25,6 +26,7 @@ class Pickup:
         if self.pos.y >= self.pos_range[1] or self.pos.y <= self.pos_range[0]:
             self._change_movement_direction()
 
+        self.previous_pos = self.pos
         movement_speed = self.info.movement_speed
         self.pos = Vec2d(
             self.pos[0], self.pos[1] + movement_speed * dt * self._get_multiplier()
@@ -12,8 +12,13 @@ class PickupManager:
         self._load_static_pickups()
 
     def activate_if_in_range(self, pos: Vec2d):
+        candidates = self.pickups
+        if self.settings["spatial_index"]["enabled"]:
+            candidates = self.model.spatial_index.query_radius(
+                "pickup", pos[0], pos[1], self.settings["pickups"]["settings"]["range"]
+            )
         pickups_to_remove = []
-        for pickup in self.pickups:
+        for pickup in candidates:
             if (pickup.pos - pos).length < self.settings["pickups"]["settings"][
                 "range"
             ]:
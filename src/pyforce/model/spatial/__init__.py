@@ -0,0 +1,3 @@
+from .spatial_grid import SpatialGrid
+
+__all__ = ["SpatialGrid"]
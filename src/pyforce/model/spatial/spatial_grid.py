@@ -0,0 +1,153 @@
+"""
+This module contains the SpatialGrid class, a uniform grid indexing the dynamic objects of the world by position.
+"""
+
+import math
+
+
+class SpatialGrid:
+    """
+    The SpatialGrid class buckets objects into square cells by their bounding box, separately for every kind
+    of object (e.g., 'enemy', 'pickup'), so neighbourhood queries only look at the cells around the queried area.
+    It is rebuilt once per model update.
+
+    Attributes:
+        cell_size (float): Width and height of a cell in pixels.
+        cells (dict[str, dict[tuple[int, int], list]]): For every kind, the entries of the occupied cells.
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Initializes an empty grid.
+
+        :param cell_size: Width and height of a cell in pixels.
+        :return: None
+        """
+        self.cell_size = cell_size
+        self.cells: dict[str, dict[tuple[int, int], list]] = {}
+
+    def clear(self):
+        """
+        Removes all objects.
+
+        :return: None
+        """
+        self.cells.clear()
+
+    def insert(self, kind: str, obj, left, top, right, bottom):
+        """
+        Adds an object to every cell its bounding box overlaps.
+
+        :param kind: The kind of the object, queries look up one kind at a time.
+        :param obj: The object to add.
+        :param left: Smallest X coordinate of the bounding box.
+        :param top: Smallest Y coordinate of the bounding box.
+        :param right: Largest X coordinate of the bounding box.
+        :param bottom: Largest Y coordinate of the bounding box.
+        :return: None
+        """
+        cells = self.cells.setdefault(kind, {})
+        entry = (obj, left, top, right, bottom)
+        for cell in self._get_cells(left, top, right, bottom):
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [entry]
+            else:
+                bucket.append(entry)
+
+    def insert_point(self, kind: str, obj, x, y):
+        """
+        Adds an object without size, e.g., a particle.
+
+        :param kind: The kind of the object.
+        :param obj: The object to add.
+        :param x: The X coordinate.
+        :param y: The Y coordinate.
+        :return: None
+        """
+        cells = self.cells.setdefault(kind, {})
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        entry = (obj, x, y, x, y)
+        bucket = cells.get(cell)
+        if bucket is None:
+            cells[cell] = [entry]
+        else:
+            bucket.append(entry)
+
+    def query_rect(self, kind: str, left, top, right, bottom) -> list:
+        """
+        Finds the objects whose bounding box overlaps a rectangle.
+
+        :param kind: The kind of objects to find.
+        :param left: Smallest X coordinate of the rectangle.
+        :param top: Smallest Y coordinate of the rectangle.
+        :param right: Largest X coordinate of the rectangle.
+        :param bottom: Largest Y coordinate of the rectangle.
+        :return: A list of objects, each at most once.
+        """
+        cells = self.cells.get(kind)
+        if not cells:
+            return []
+
+        found = []
+        seen = set()
+        for cell in self._get_cells(left, top, right, bottom):
+            for entry in cells.get(cell, ()):
+                obj, obj_left, obj_top, obj_right, obj_bottom = entry
+                if (
+                    obj_right < left
+                    or obj_left > right
+                    or obj_bottom < top
+                    or obj_top > bottom
+                ):
+                    continue
+                # an object spanning several cells is stored in each of them
+                if id(entry) in seen:
+                    continue
+                seen.add(id(entry))
+                found.append(obj)
+        return found
+
+    def query_radius(self, kind: str, x, y, radius) -> list:
+        """
+        Finds the objects whose bounding box is within a distance of a point.
+
+        :param kind: The kind of objects to find.
+        :param x: The X coordinate of the point.
+        :param y: The Y coordinate of the point.
+        :param radius: The distance.
+        :return: A list of objects, each at most once.
+        """
+        cells = self.cells.get(kind)
+        if not cells:
+            return []
+
+        found = []
+        seen = set()
+        for cell in self._get_cells(x - radius, y - radius, x + radius, y + radius):
+            for entry in cells.get(cell, ()):
+                obj, obj_left, obj_top, obj_right, obj_bottom = entry
+                # distance from the point to the closest point of the bounding box
+                dx = max(obj_left - x, 0, x - obj_right)
+                dy = max(obj_top - y, 0, y - obj_bottom)
+                if dx * dx + dy * dy > radius * radius or id(entry) in seen:
+                    continue
+                seen.add(id(entry))
+                found.append(obj)
+        return found
+
+    def _get_cells(self, left, top, right, bottom):
+        """
+        Lists the cells a rectangle overlaps.
+
+        :param left: Smallest X coordinate of the rectangle.
+        :param top: Smallest Y coordinate of the rectangle.
+        :param right: Largest X coordinate of the rectangle.
+        :param bottom: Largest Y coordinate of the rectangle.
+        :return: A generator of (column, row) tuples.
+        """
+        size = self.cell_size
+        rows = range(math.floor(top / size), math.floor(bottom / size) + 1)
+        for column in range(math.floor(left / size), math.floor(right / size) + 1):
+            for row in rows:
+                yield column, row
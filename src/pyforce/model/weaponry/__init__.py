@@ -1,9 +1,11 @@
 """
-This module initializes the weaponry package and exports the Weapon, Ammo, and Bullet classes.
+This module initializes the weaponry package and exports the Weapon, Ammo, Bullet, BulletPool and BulletStore classes.
 """
 
 from .weapon import Weapon
 from .ammo import Ammo
 from .bullet import Bullet
+from .bullet_pool import BulletPool
+from .bullet_store import BulletStore
 
-__all__ = ["Weapon", "Ammo", "Bullet"]
+__all__ = ["Weapon", "Ammo", "Bullet", "BulletPool", "BulletStore"]
@@ -2,6 +2,8 @@
 This module contains the Ammo class which defines the properties of different ammunition types.
 """
 
+from pyforce.constants import AmmoMode
+
 
 class Ammo:
     """
@@ -13,9 +15,18 @@ class Ammo:
         bullet_mass (float): The physical mass of the bullet.
         bullet_radius (float): The radius of the bullet's physical shape.
         bullet_name (str): The name or identifier of the bullet type.
+        mode (AmmoMode): Whether bullets are simulated bodies, swept segments or hitscan.
     """
 
-    def __init__(self, velocity, damage, bullet_mass, bullet_radius, bullet_name):
+    def __init__(
+        self,
+        velocity,
+        damage,
+        bullet_mass,
+        bullet_radius,
+        bullet_name,
+        mode: AmmoMode = AmmoMode.PHYSICS,
+    ):
         """
         Initializes the Ammo instance with specified properties.
 
@@ -24,6 +35,7 @@ class Ammo:
         :param bullet_mass: The mass of the bullet.
         :param bullet_radius: The radius of the bullet.
         :param bullet_name: The name of the bullet type.
+        :param mode: The AmmoMode of the bullets.
         :return: None
         """
         self.velocity = velocity
@@ -31,3 +43,4 @@ class Ammo:
         self.bullet_mass = bullet_mass
         self.bullet_radius = bullet_radius
         self.bullet_name = bullet_name
+        self.mode = mode
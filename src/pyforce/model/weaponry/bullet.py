@@ -10,16 +10,17 @@ from pyforce.structures import BasicBulletInfo
 class Bullet:
     """
     The Bullet class manages the state and physics of a single projectile.
+    Bullets are recycled by the BulletPool, reset prepares one for a new shot.
 
     Attributes:
-        id (int): Unique identifier for the bullet.
+        id (int): ID of the bullet in the EntityRegistry.
         start_pos (Vec2d): The initial position of the bullet.
         pos (Vec2d): Current position of the bullet.
         reach (float): Maximum distance the bullet can travel.
         damage (int): Damage dealt by the bullet.
         name (str): Type name of the bullet.
-        timer (int): Lifespan counter.
-        has_collided (bool): Whether the bullet has hit something.
+        row (int): Index of the bullet in the BulletStore's columns, which hold its collision flag and positions.
+        ammo (Ammo): The ammunition the body and shape were created for.
         body (pymunk.Body): Physics body of the bullet.
         shape (pymunk.Circle): Physics shape of the bullet.
     """
@@ -34,18 +35,32 @@ class Bullet:
         :param settings: Dictionary containing game settings.
         :return: None
         """
+        self.ammo = ammo
+        self.body = self._create_body_bullet(ammo)
+        self.shape = self._create_shape_bullet(ammo, settings)
+        self.reset(info, arm_deg)
+
+    def reset(self, info: BasicBulletInfo, arm_deg):
+        """
+        Prepares the bullet for a new shot: places the body at the start position
+        and replaces its velocity with the impulse of the shot.
+
+        :param info: Basic information about the bullet.
+        :param arm_deg: The angle at which the bullet is fired.
+        :return: None
+        """
         self.id = info.id
         self.start_pos = info.start_pos
         self.pos = info.start_pos
         self.reach = info.reach
         self.damage = info.damage
         self.name = info.name
-        self.timer = 0
-        self.has_collided = False
+        self.row = -1  # set when the bullet is added to the BulletStore
 
-        self.body = self._create_body_bullet(ammo)
-        self.shape = self._create_shape_bullet(ammo, settings)
-        self._apply_bullet_impulse(arm_deg, ammo)
+        self.shape.id = self.id  # used to find the bullet when it hits an entity
+        self.body.position = self.pos
+        self.body.velocity = (0, 0)
+        self._apply_bullet_impulse(arm_deg, self.ammo)
 
     def __hash__(self):
         """
@@ -66,9 +81,6 @@ class Bullet:
             return NotImplemented
         return self.id == other.id
 
-    def __del__(self):
-        del self
-
     def _create_body_bullet(self, ammo):
         """
         Creates the pymunk Body for the bullet.
@@ -76,9 +88,7 @@ class Bullet:
         :param ammo: The Ammo instance.
         :return: A pymunk.Body instance.
         """
-        body = Body(mass=ammo.bullet_mass, moment=float("inf"), body_type=Body.DYNAMIC)
-        body.position = self.pos
-        return body
+        return Body(mass=ammo.bullet_mass, moment=float("inf"), body_type=Body.DYNAMIC)
 
     def _create_shape_bullet(self, ammo, settings):
         """
@@ -94,7 +104,6 @@ class Bullet:
             categories=settings["physics"]["collision_categories"]["player_bullet"],
             mask=settings["physics"]["collision_masks"]["player_bullet"],
         )
-        shape.bullet = self
         return shape
 
     def _apply_bullet_impulse(self, angle, ammo):
@@ -0,0 +1,60 @@
+"""
+This module contains the BulletPool class which recycles bullets together with their physics body and shape.
+"""
+
+from pyforce.model.weaponry.ammo import Ammo
+from pyforce.model.weaponry.bullet import Bullet
+from pyforce.structures import BasicBulletInfo
+
+
+class BulletPool:
+    """
+    The BulletPool class keeps removed bullets for later shots instead of creating a new Bullet,
+    pymunk Body and Circle for every shot. Bullets are kept per ammo, as their body and shape
+    were created for its mass and radius. At most max_size bullets of an ammo are kept.
+
+    Attributes:
+        settings (dict): Dictionary containing game settings.
+        free (dict[Ammo, list[Bullet]]): The bullets ready to be reused, by their ammo.
+    """
+
+    def __init__(self, settings: dict):
+        """
+        Initializes an empty pool.
+
+        :param settings: Dictionary containing game settings.
+        :return: None
+        """
+        self.settings = settings
+        self.free: dict[Ammo, list[Bullet]] = {}
+
+    def acquire(self, info: BasicBulletInfo, arm_deg, ammo) -> Bullet:
+        """
+        Retrieves a bullet ready to be added to the physics simulation.
+
+        :param info: Basic information about the bullet.
+        :param arm_deg: The angle at which the bullet is fired.
+        :param ammo: The Ammo instance defining projectile properties.
+        :return: A reused or a new Bullet instance.
+        """
+        free = self.free.get(ammo)
+        if free:
+            bullet = free.pop()
+            bullet.reset(info, arm_deg)
+            return bullet
+        return Bullet(info=info, arm_deg=arm_deg, ammo=ammo, settings=self.settings)
+
+    def release(self, bullet: Bullet):
+        """
+        Takes back a bullet already removed from the physics simulation.
+
+        :param bullet: The Bullet instance.
+        :return: None
+        """
+        settings = self.settings["physics"]["bullet_pool"]
+        if not settings["enabled"]:
+            return
+
+        free = self.free.setdefault(bullet.ammo, [])
+        if len(free) < settings["max_size"]:
+            free.append(bullet)
@@ -0,0 +1,348 @@
+"""
+This module contains the BulletStore class which keeps the bookkeeping data of live bullets in columns.
+NumPy is optional, without it the columns are lists checked bullet by bullet.
+"""
+
+import importlib
+from itertools import chain
+from types import ModuleType
+from typing import Any
+
+try:
+    np: ModuleType | None = importlib.import_module("numpy")
+except ImportError:
+    np = None
+
+from pyforce.model.weaponry.bullet import Bullet
+from pyforce.structures import BulletRenderInfo
+
+
+class BulletStore:
+    """
+    The BulletStore class holds the start position, the squared reach, the spawn step, the collision flag
+    and the current and previous position of every live bullet in parallel columns, one row per bullet.
+    The rows are kept packed: a removed bullet's row is refilled from the end, so removing a bullet
+    only moves one other row. With NumPy the columns are arrays and expiry, keeping the previous
+    positions and culling the bullets to render are a few array operations per step.
+
+    The positions are copied from the physics bodies once per step, by sync_positions. Expiry
+    and rendering read them from the columns instead of from every bullet's body.
+
+    Attributes:
+        bullets (list[Bullet]): The live bullets, a bullet's row attribute is its index in the columns.
+        names (list[str]): Type names of the bullets, used to pick their sprites.
+        start_x (numpy.ndarray | list[float]): X coordinates of the bullets' start positions.
+        start_y (numpy.ndarray | list[float]): Y coordinates of the bullets' start positions.
+        reach_squared (numpy.ndarray | list[float]): Squared maximum distances the bullets can travel.
+        spawn_step (numpy.ndarray | list[int]): Model steps in which the bullets were fired.
+        collided (numpy.ndarray | list[bool]): Whether the bullets have hit something.
+        x (numpy.ndarray | list[float]): X coordinates of the bullets after the last step.
+        y (numpy.ndarray | list[float]): Y coordinates of the bullets after the last step.
+        previous_x (numpy.ndarray | list[float]): X coordinates of the bullets before the last step.
+        previous_y (numpy.ndarray | list[float]): Y coordinates of the bullets before the last step.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initializes an empty store.
+
+        :param capacity: Number of bullets the columns are allocated for, they grow when needed.
+        :return: None
+        """
+        self.bullets: list[Bullet] = []
+        self.names: list[str] = []
+        # numpy arrays when NumPy is installed, lists of the same values otherwise
+        self.start_x: Any
+        self.start_y: Any
+        self.reach_squared: Any
+        self.spawn_step: Any
+        self.collided: Any
+        self.x: Any
+        self.y: Any
+        self.previous_x: Any
+        self.previous_y: Any
+        if np is not None:
+            self.start_x = np.empty(capacity)
+            self.start_y = np.empty(capacity)
+            self.reach_squared = np.empty(capacity)
+            self.spawn_step = np.empty(capacity, dtype=np.int64)
+            self.collided = np.zeros(capacity, dtype=bool)
+            self.x = np.empty(capacity)
+            self.y = np.empty(capacity)
+            self.previous_x = np.empty(capacity)
+            self.previous_y = np.empty(capacity)
+        else:
+            self.start_x = []
+            self.start_y = []
+            self.reach_squared = []
+            self.spawn_step = []
+            self.collided = []
+            self.x = []
+            self.y = []
+            self.previous_x = []
+            self.previous_y = []
+
+    def __len__(self):
+        """
+        Counts the live bullets.
+
+        :return: The number of bullets.
+        """
+        return len(self.bullets)
+
+    def add(self, bullet: Bullet, step: int):
+        """
+        Appends a bullet which has just been fired.
+
+        :param bullet: The Bullet instance.
+        :param step: The current model step.
+        :return: None
+        """
+        row = len(self.bullets)
+        start = bullet.start_pos
+        values = (
+            start.x,
+            start.y,
+            bullet.reach**2,
+            step,
+            False,
+            start.x,
+            start.y,
+            start.x,
+            start.y,
+        )
+        if np is None:
+            for column, value in zip(self._columns(), values):
+                column.append(value)
+        else:
+            if row == len(self.start_x):
+                self._grow()
+            for column, value in zip(self._columns(), values):
+                column[row] = value
+
+        bullet.row = row
+        self.bullets.append(bullet)
+        self.names.append(bullet.name)
+
+    def mark_collided(self, bullet: Bullet):
+        """
+        Marks a bullet as having hit something, it's removed by the next pop_expired.
+
+        :param bullet: The Bullet instance.
+        :return: None
+        """
+        self.collided[bullet.row] = True
+
+    def has_collided(self, bullet: Bullet) -> bool:
+        """
+        Checks whether a bullet has hit something.
+
+        :param bullet: The Bullet instance.
+        :return: True if the bullet has collided, False otherwise.
+        """
+        return bool(self.collided[bullet.row])
+
+    def store_previous_positions(self):
+        """
+        Remembers the current positions before the model is stepped, for render interpolation.
+
+        :return: None
+        """
+        if np is None:
+            self.previous_x = self.x.copy()
+            self.previous_y = self.y.copy()
+            return
+
+        count = len(self.bullets)
+        self.previous_x[:count] = self.x[:count]
+        self.previous_y[:count] = self.y[:count]
+
+    def sync_positions(self):
+        """
+        Copies the positions of the bullets' bodies into the columns, in a single pass after the physics step.
+
+        :return: None
+        """
+        count = len(self.bullets)
+        if count == 0:
+            return
+        if np is None:
+            for row, bullet in enumerate(self.bullets):
+                position = bullet.body.position
+                self.x[row] = position.x
+                self.y[row] = position.y
+            return
+
+        positions = np.fromiter(
+            chain.from_iterable(bullet.body.position for bullet in self.bullets),
+            dtype=float,
+            count=2 * count,
+        )
+        self.x[:count] = positions[0::2]
+        self.y[:count] = positions[1::2]
+
+    def pop_expired(self, step: int, timeout: int) -> list[Bullet]:
+        """
+        Removes the bullets which have timed out, travelled their reach or hit something.
+
+        :param step: The current model step.
+        :param timeout: Number of steps a bullet lives at most.
+        :return: A list of the removed Bullet instances, in the order of their rows.
+        """
+        count = len(self.bullets)
+        if count == 0:
+            return []
+        if np is None:
+            return self._pop_expired_python(step, timeout)
+
+        dx = self.start_x[:count] - self.x[:count]
+        dy = self.start_y[:count] - self.y[:count]
+        expired = (
+            (step - self.spawn_step[:count] >= timeout)
+            | (dx * dx + dy * dy >= self.reach_squared[:count])
+            | self.collided[:count]
+        )
+        if not expired.any():
+            return []
+
+        rows = np.flatnonzero(expired)
+        removed = [self.bullets[row] for row in rows.tolist()]
+        remaining = count - len(rows)
+        # removed rows below the new end are refilled from the rows above it which stay
+        holes = rows[rows < remaining]
+        moved = np.flatnonzero(~expired[remaining:]) + remaining
+        for column in self._columns():
+            column[holes] = column[moved]
+        self._move_bullets(holes.tolist(), moved.tolist(), remaining)
+        return removed
+
+    def get_render_info(
+        self, view_rect: tuple[float, float, float, float] | None = None
+    ) -> BulletRenderInfo:
+        """
+        Gathers the positions of the bullets to render.
+
+        :param view_rect: A (left, top, right, bottom) tuple, only bullets inside it are returned. All if None.
+        :return: A BulletRenderInfo instance.
+        """
+        count = len(self.bullets)
+        if np is None:
+            rows: Any = range(count)
+            if view_rect is not None:
+                left, top, right, bottom = view_rect
+                rows = [
+                    row
+                    for row in rows
+                    if left <= self.x[row] <= right and top <= self.y[row] <= bottom
+                ]
+            return BulletRenderInfo(
+                names=[self.names[row] for row in rows],
+                previous_x=[self.previous_x[row] for row in rows],
+                previous_y=[self.previous_y[row] for row in rows],
+                x=[self.x[row] for row in rows],
+                y=[self.y[row] for row in rows],
+            )
+
+        x = self.x[:count]
+        y = self.y[:count]
+        if view_rect is None:
+            rows = np.arange(count)
+        else:
+            left, top, right, bottom = view_rect
+            rows = np.flatnonzero(
+                (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+            )
+        return BulletRenderInfo(
+            names=[self.names[row] for row in rows.tolist()],
+            previous_x=self.previous_x[rows].tolist(),
+            previous_y=self.previous_y[rows].tolist(),
+            x=x[rows].tolist(),
+            y=y[rows].tolist(),
+        )
+
+    def _pop_expired_python(self, step: int, timeout: int) -> list[Bullet]:
+        """
+        Removes the expired bullets one by one, used when NumPy isn't installed.
+
+        :param step: The current model step.
+        :param timeout: Number of steps a bullet lives at most.
+        :return: A list of the removed Bullet instances, in the order of their rows.
+        """
+        count = len(self.bullets)
+        expired = []
+        for row in range(count):
+            dx = self.start_x[row] - self.x[row]
+            dy = self.start_y[row] - self.y[row]
+            expired.append(
+                step - self.spawn_step[row] >= timeout
+                or dx * dx + dy * dy >= self.reach_squared[row]
+                or self.collided[row]
+            )
+        rows = [row for row in range(count) if expired[row]]
+        if not rows:
+            return []
+
+        removed = [self.bullets[row] for row in rows]
+        remaining = count - len(rows)
+        # removed rows below the new end are refilled from the rows above it which stay
+        holes = [row for row in rows if row < remaining]
+        moved = [row for row in range(remaining, count) if not expired[row]]
+        for column in self._columns():
+            for hole, row in zip(holes, moved):
+                column[hole] = column[row]
+            del column[remaining:]
+        self._move_bullets(holes, moved, remaining)
+        return removed
+
+    def _move_bullets(self, holes: list[int], moved: list[int], remaining: int):
+        """
+        Moves the bullets and their names into the refilled rows and drops the rows past the new end.
+
+        :param holes: The refilled rows.
+        :param moved: The rows moved into them, in the same order.
+        :param remaining: Number of bullets left.
+        :return: None
+        """
+        for hole, row in zip(holes, moved):
+            bullet = self.bullets[row]
+            bullet.row = hole
+            self.bullets[hole] = bullet
+            self.names[hole] = self.names[row]
+        del self.bullets[remaining:]
+        del self.names[remaining:]
+
+    def _columns(self) -> list:
+        """
+        Lists the columns in the order add writes them.
+
+        :return: A list of the columns.
+        """
+        return [
+            self.start_x,
+            self.start_y,
+            self.reach_squared,
+            self.spawn_step,
+            self.collided,
+            self.x,
+            self.y,
+            self.previous_x,
+            self.previous_y,
+        ]
+
+    def _grow(self):
+        """
+        Doubles the capacity of the columns, used when NumPy is installed.
+
+        :return: None
+        """
+        if np is None:
+            return
+        self.start_x = np.resize(self.start_x, 2 * len(self.start_x))
+        self.start_y = np.resize(self.start_y, 2 * len(self.start_y))
+        self.reach_squared = np.resize(self.reach_squared, 2 * len(self.reach_squared))
+        self.spawn_step = np.resize(self.spawn_step, 2 * len(self.spawn_step))
+        self.collided = np.resize(self.collided, 2 * len(self.collided))
+        self.x = np.resize(self.x, 2 * len(self.x))
+        self.y = np.resize(self.y, 2 * len(self.y))
+        self.previous_x = np.resize(self.previous_x, 2 * len(self.previous_x))
+        self.previous_y = np.resize(self.previous_y, 2 * len(self.previous_y))
@@ -0,0 +1,7 @@
+"""
+A submodule used for measuring the time spent in each stage of a frame.
+"""
+
+from .frame_profiler import FrameProfiler
+
+__all__ = ["FrameProfiler"]
@@ -0,0 +1,139 @@
+"""
+This module contains the FrameProfiler class which times the stages of model updates and rendering.
+"""
+
+from collections import deque
+from time import perf_counter
+
+
+class FrameProfiler:
+    """
+    The FrameProfiler class records how long each stage of a frame takes.
+    Stages are timed with marks: every mark stores the time elapsed since the previous mark
+    (or since begin). Samples are kept in fixed-size ring buffers, so memory use is constant.
+
+    Attributes:
+        size (int): Number of samples kept per stage.
+        enabled (bool): Whether timings are recorded. A disabled profiler costs one attribute check per call.
+        samples (dict[str, deque[float]]): Ring buffers of stage durations, in seconds.
+        frame_times (deque[float]): Ring buffer of whole frame durations, in seconds.
+    """
+
+    def __init__(self, size: int, enabled: bool = True):
+        """
+        Initializes the FrameProfiler with empty ring buffers.
+
+        :param size: Number of samples kept per stage.
+        :param enabled: Whether timings are recorded.
+        :return: None
+        """
+        self.size = size
+        self.enabled = enabled
+        self.samples: dict[str, deque[float]] = {}
+        self.frame_times: deque[float] = deque(maxlen=size)
+
+        self._start = 0.0
+        self._last_mark = 0.0
+        self._last_frame: float | None = None
+
+    def begin(self):
+        """
+        Starts timing a sequence of stages.
+
+        :return: None
+        """
+        if not self.enabled:
+            return
+        self._start = self._last_mark = perf_counter()
+
+    def mark(self, name: str):
+        """
+        Records the time elapsed since the previous mark as the duration of the given stage.
+
+        :param name: The name of the stage that just finished.
+        :return: None
+        """
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self._record(name, now - self._last_mark)
+        self._last_mark = now
+
+    def end(self, name: str):
+        """
+        Records the time elapsed since begin as the total of the given sequence.
+
+        :param name: The name of the whole sequence (e.g., 'update').
+        :return: None
+        """
+        if not self.enabled:
+            return
+        now = perf_counter()
+        self._record(name, now - self._start)
+        self._last_mark = now
+
+    def frame(self):
+        """
+        Records the duration of the frame that ended with this call.
+
+        :return: None
+        """
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self._last_frame is not None:
+            self.frame_times.append(now - self._last_frame)
+        self._last_frame = now
+
+    def average(self, name: str) -> float:
+        """
+        Calculates the rolling average duration of a stage.
+
+        :param name: The name of the stage.
+        :return: The average duration in milliseconds, 0 if there are no samples.
+        """
+        buffer = self.samples.get(name)
+        if not buffer:
+            return 0.0
+        return sum(buffer) / len(buffer) * 1000
+
+    def averages(self) -> dict[str, float]:
+        """
+        Calculates the rolling averages of all recorded stages.
+
+        :return: A dictionary mapping stage names to average durations in milliseconds.
+        """
+        return {name: self.average(name) for name in self.samples}
+
+    def fps(self) -> float:
+        """
+        Calculates the frame rate from the recorded frame durations.
+
+        :return: Frames per second, 0 if there are no samples.
+        """
+        if not self.frame_times:
+            return 0.0
+        return len(self.frame_times) / sum(self.frame_times)
+
+    def reset(self):
+        """
+        Discards all recorded samples.
+
+        :return: None
+        """
+        self.samples.clear()
+        self.frame_times.clear()
+        self._last_frame = None
+
+    def _record(self, name: str, duration: float):
+        """
+        Appends a duration to the ring buffer of a stage, creating it if needed.
+
+        :param name: The name of the stage.
+        :param duration: The duration in seconds.
+        :return: None
+        """
+        buffer = self.samples.get(name)
+        if buffer is None:
+            buffer = self.samples[name] = deque(maxlen=self.size)
+        buffer.append(duration)
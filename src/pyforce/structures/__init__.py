@@ -2,19 +2,37 @@
 A module storing dataclasses used by other modules.
 """
 
+from .batch_game import BatchGame
+from .bullet_render_info import BulletRenderInfo
+from .collision_events import CollisionEvents
+from .collision_rect import CollisionRect
 from .debug_elements import DebugElements
 from .effect import Effect
+from .frame_input import FrameInput
+from .line_of_sight import LineOfSight
+from .nav_link import NavLink
+from .platform import Platform
 from .player_stats import PlayerStats
 from .render_info import RenderInfo
+from .replay import Replay
 from .weapon_utils import BasicBulletInfo
 from .where import Where
 from .pickup_info import PickupInfo
 
 __all__ = [
+    "BatchGame",
+    "BulletRenderInfo",
+    "CollisionEvents",
+    "CollisionRect",
     "DebugElements",
     "Effect",
+    "FrameInput",
+    "LineOfSight",
+    "NavLink",
+    "Platform",
     "PlayerStats",
     "RenderInfo",
+    "Replay",
     "BasicBulletInfo",
     "Where",
     "PickupInfo",
@@ -0,0 +1,30 @@
+"""
+This module defines the BatchGame dataclass describing a single game run by the batch runner.
+"""
+
+from dataclasses import dataclass
+
+from pyforce.constants import Difficulty, GameMode
+from pyforce.structures.frame_input import FrameInput
+
+
+@dataclass(frozen=True)
+class BatchGame:
+    """
+    The BatchGame dataclass stores the configuration of one headless game.
+
+    Attributes:
+        seed (int): Seed for the random number generator used by the game.
+        difficulty (Difficulty): The difficulty to apply.
+        game_mode (GameMode): The game mode to simulate.
+        map_name (str): File name of the TMX map in the maps directory (e.g., 'map2.tmx').
+        max_frames (int | None): Maximum number of model steps, unlimited if None.
+        inputs (tuple[FrameInput, ...]): The looping input script, no input if empty.
+    """
+
+    seed: int
+    difficulty: Difficulty
+    game_mode: GameMode
+    map_name: str
+    max_frames: int | None = None
+    inputs: tuple[FrameInput, ...] = ()
@@ -0,0 +1,26 @@
+"""
+This module defines the BulletRenderInfo dataclass holding the bullets passed from the model to the renderer.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BulletRenderInfo:
+    """
+    The BulletRenderInfo dataclass holds the bullets to render in columns, the same index
+    in every list belongs to the same bullet.
+
+    Attributes:
+        names (list[str]): Type names of the bullets, used to pick their sprites.
+        previous_x (list[float]): X coordinates before the last model step.
+        previous_y (list[float]): Y coordinates before the last model step.
+        x (list[float]): X coordinates after the last model step.
+        y (list[float]): Y coordinates after the last model step.
+    """
+
+    names: list[str] = field(default_factory=list)
+    previous_x: list[float] = field(default_factory=list)
+    previous_y: list[float] = field(default_factory=list)
+    x: list[float] = field(default_factory=list)
+    y: list[float] = field(default_factory=list)
@@ -0,0 +1,28 @@
+"""
+This module defines the CollisionEvents dataclass used for passing collisions from the physics engine to the model.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CollisionEvents:
+    """
+    The CollisionEvents dataclass stores the collision events recorded during one physics step.
+
+    Attributes:
+        hits (list[tuple[int, int]]): (entity ID, bullet ID) tuples of bullets hitting entities.
+        kills (list[int]): IDs of the entities that touched water.
+    """
+
+    hits: list[tuple[int, int]] = field(default_factory=list)
+    kills: list[int] = field(default_factory=list)
+
+    def clear(self):
+        """
+        Removes all recorded events.
+
+        :return: None
+        """
+        self.hits.clear()
+        self.kills.clear()
@@ -0,0 +1,26 @@
+"""
+This module defines the CollisionRect dataclass describing one static collision object of a map.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CollisionRect:
+    """
+    The CollisionRect dataclass stores a rectangle from the map's collision object layer.
+    Its attribute names match pytmx objects, so both can be turned into physics shapes the same way.
+
+    Attributes:
+        x (float): X coordinate of the top-left corner.
+        y (float): Y coordinate of the top-left corner.
+        width (float): Width of the rectangle.
+        height (float): Height of the rectangle.
+        type (str | None): Tiled type of the object (e.g., 'terrain', 'water', 'explosive').
+    """
+
+    x: float
+    y: float
+    width: float
+    height: float
+    type: str | None = None
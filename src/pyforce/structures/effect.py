@@ -8,3 +8,4 @@ class Effect:
     size: float
     opacity: float
     color: tuple[int, int, int] | str
+    previous_pos: Vec2d | None = None
@@ -0,0 +1,19 @@
+"""
+This module defines the FrameInput dataclass used for feeding input to the model without a keyboard.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class FrameInput:
+    """
+    The FrameInput dataclass stores the input resolved for a single frame.
+
+    Attributes:
+        actions (frozenset[str]): Names of the key binding actions active in this frame (e.g., 'shoot').
+        mouse_pos (tuple[int, int]): The screen-relative mouse position passed to Model.update.
+    """
+
+    actions: frozenset[str] = field(default_factory=frozenset)
+    mouse_pos: tuple[int, int] = (0, 0)
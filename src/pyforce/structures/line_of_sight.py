@@ -0,0 +1,26 @@
+"""
+This module defines the LineOfSight dataclass holding the result of an enemy's line-of-sight raycast.
+"""
+
+from dataclasses import dataclass
+
+from pymunk import Vec2d
+
+
+@dataclass
+class LineOfSight:
+    """
+    The LineOfSight dataclass remembers whether an enemy could see the player, so the raycast
+    can be reused while neither of them has moved much.
+
+    Attributes:
+        step (int): The model step the raycast was made in.
+        enemy_pos (Vec2d): Position of the enemy during the raycast.
+        player_pos (Vec2d): Position of the player during the raycast.
+        visible (bool): Whether the player was the first shape hit by the raycast.
+    """
+
+    step: int
+    enemy_pos: Vec2d
+    player_pos: Vec2d
+    visible: bool
@@ -0,0 +1,29 @@
+"""
+This module defines the NavLink dataclass describing a move between two platforms.
+"""
+
+from dataclasses import dataclass
+
+from pyforce.constants import NavLinkType
+
+
+@dataclass(frozen=True)
+class NavLink:
+    """
+    The NavLink dataclass stores an edge of the navigation graph.
+
+    Attributes:
+        type (NavLinkType): How the enemy gets to the target platform.
+        source (int): ID of the platform the link starts on.
+        target (int): ID of the platform the link ends on.
+        takeoff_x (float): X coordinate on the source platform where the move starts.
+        landing_x (float): X coordinate on the target platform where the move ends.
+        cost (float): Length of the move, used to find the shortest routes.
+    """
+
+    type: NavLinkType
+    source: int
+    target: int
+    takeoff_x: float
+    landing_x: float
+    cost: float
@@ -0,0 +1,24 @@
+"""
+This module defines the Platform dataclass describing a walkable surface of the map.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Platform:
+    """
+    The Platform dataclass stores a horizontal surface of the map's collision geometry
+    enemies can stand on. It is a node of the navigation graph.
+
+    Attributes:
+        id (int): Index of the platform in the navigation graph.
+        left (float): X coordinate of the left end.
+        right (float): X coordinate of the right end.
+        height (float): Y coordinate of the surface.
+    """
+
+    id: int
+    left: float
+    right: float
+    height: float
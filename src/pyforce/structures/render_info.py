@@ -6,20 +6,22 @@ from pyforce.structures.where import Where
 from pyforce.structures.debug_elements import DebugElements
 from pyforce.structures.effect import Effect
 from pyforce.structures.player_stats import PlayerStats
+from pyforce.structures.bullet_render_info import BulletRenderInfo
 
 if TYPE_CHECKING:
-    from pyforce.model.weaponry import Bullet
     from pyforce.model.pickups import Pickup
-    from pymunk import Vec2d, Shape
+    from pymunk import Vec2d
 
 
 @dataclass
 class RenderInfo:
     player_pos: Vec2d
     where_array: list[Where]
-    bullets_dict: dict[Bullet, Shape]
+    bullets: BulletRenderInfo
     debug_elements: DebugElements
     effects: list[Effect]
     pickups: list[Pickup]
     game_state: GameState | None = None
     player_stats: PlayerStats | None = None
+    # interpolation factor between the previous and current model step
+    alpha: float = 1.0
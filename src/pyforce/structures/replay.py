@@ -0,0 +1,29 @@
+"""
+This module defines the Replay dataclass holding a recorded game.
+"""
+
+from dataclasses import dataclass, field
+
+from pyforce.constants import Difficulty, GameMode
+from pyforce.structures.frame_input import FrameInput
+
+
+@dataclass
+class Replay:
+    """
+    The Replay dataclass stores everything needed to play a game again with the same result:
+    the seed of the model's random number generator, the game configuration and the input of every model step.
+
+    Attributes:
+        seed (int): Seed of the model's random number generator.
+        difficulty (Difficulty): The difficulty the game was played on.
+        game_mode (GameMode): The game mode the game was played in.
+        map_name (str): File name of the TMX map in the maps directory (e.g., 'map2.tmx').
+        frames (list[FrameInput]): The input of every model step, in order.
+    """
+
+    seed: int
+    difficulty: Difficulty = Difficulty.NORMAL
+    game_mode: GameMode = GameMode.INFINITE
+    map_name: str = "map3.tmx"
+    frames: list[FrameInput] = field(default_factory=list)
@@ -22,6 +22,7 @@ class Where:
         hitbox (Rect): The pygame Rect representing the entity's physical bounds.
         health_percent (float): The current health of the entity as a percentage (0.0 to 1.0).
         is_dead (bool): Flag indicating if the entity is dead.
+        previous_position (tuple[int, int]): The position before the last model step, used for interpolation.
     """
 
     position: tuple[int, int]
@@ -35,3 +36,4 @@ class Where:
     health_percent: float
     is_dead: bool = False  # used for player
     guns_available: list[str] | None = None  # used for player
+    previous_position: tuple[int, int] | None = None
@@ -1,7 +1,6 @@
-import os
-import pytmx
 import pyscroll
 from loguru import logger
+from pyforce.maps import load_map_images
 
 
 class MapLoader:
@@ -29,13 +28,7 @@ class MapLoader:
         self.group = None
 
         try:
-            script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            path = os.path.join(script_dir, settings["map"]["map_path"])
-
-            if os.name == "nt":
-                path = path.replace("/", "\\")
-
-            tmx_data = pytmx.util_pygame.load_pygame(path)
+            tmx_data = load_map_images(settings)
             map_data = pyscroll.data.TiledMapData(tmx_data)
 
             self.map_layer = pyscroll.BufferedRenderer(map_data, size, alpha=True)
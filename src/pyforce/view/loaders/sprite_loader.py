@@ -188,7 +188,9 @@ class SpriteLoader:
         :return: The absolute path to the sprite file.
         """
         # create an absolute path to the sprite
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script_dir = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
         path = os.path.join(script_dir, sprite_location)
 
         if os.name == "nt":
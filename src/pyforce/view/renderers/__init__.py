@@ -4,6 +4,7 @@ from .entity_renderer import (
     calc_camera_pos,
     convert_abs_to_rel,
     calc_vector,
+    interpolate,
 )
 from .map_renderer import MapRenderer
 
@@ -13,5 +14,6 @@ __all__ = [
     "calc_camera_pos",
     "convert_abs_to_rel",
     "calc_vector",
+    "interpolate",
     "MapRenderer",
 ]
@@ -1,6 +1,10 @@
 import pygame
 
-from pyforce.view.renderers.entity_renderer import convert_abs_to_rel, calc_camera_pos
+from pyforce.view.renderers.entity_renderer import (
+    convert_abs_to_rel,
+    calc_camera_pos,
+    interpolate,
+)
 
 
 class EffectsRenderer:
@@ -8,11 +12,12 @@ class EffectsRenderer:
         self.settings = settings
         self.screen = screen
 
-    def render(self, effects, player_pos):
+    def render(self, effects, player_pos, alpha=1.0):
         cam_abs, cam_rel = calc_camera_pos(self.settings, player_pos)
 
         for effect in effects:
-            pos = convert_abs_to_rel(effect.pos, cam_abs, cam_rel)
+            effect_pos = interpolate(effect.previous_pos, effect.pos, alpha)
+            pos = convert_abs_to_rel(effect_pos, cam_abs, cam_rel)
             rect = pygame.Rect(pos[0], pos[1], effect.size, effect.size)
 
             surface = pygame.Surface((effect.size, effect.size))
@@ -21,11 +26,12 @@ class EffectsRenderer:
 
             self.screen.blit(surface, rect)
 
-    def render_pickups(self, pickups, sprite_loader, player_pos):
+    def render_pickups(self, pickups, sprite_loader, player_pos, alpha=1.0):
         cam_abs, cam_rel = calc_camera_pos(self.settings, player_pos)
 
         for pickup in pickups:
-            pos = convert_abs_to_rel(pickup.pos, cam_abs, cam_rel)
+            pickup_pos = interpolate(pickup.previous_pos, pickup.pos, alpha)
+            pos = convert_abs_to_rel(pickup_pos, cam_abs, cam_rel)
 
             p_type = pickup.info.type
             if p_type == "weapon":
@@ -61,6 +61,23 @@ def calc_vector(abs_camera_pos, rel_camera_pos):
     return vector
 
 
+def interpolate(previous, current, alpha):
+    """
+    Linearly interpolates between the position from the previous and the current model step.
+
+    :param previous: The position before the last model step, or None if unknown.
+    :param current: The position after the last model step.
+    :param alpha: Fraction of a model step elapsed since the last step, in the range <0, 1>.
+    :return: A tuple representing the interpolated position.
+    """
+    if previous is None:
+        return current[0], current[1]
+    return (
+        previous[0] + (current[0] - previous[0]) * alpha,
+        previous[1] + (current[1] - previous[1]) * alpha,
+    )
+
+
 def _clamp(min_val, value, max_val):
     return max(min(value, max_val), min_val)
 
@@ -71,51 +88,62 @@ class EntityRenderer:
     various game entities, including players, enemies, and bullets.
     """
 
-    def render_bullets(self, bullets_dict, sprite_loader, screen, settings, player_pos):
+    def render_bullets(
+        self, bullets, sprite_loader, screen, settings, player_pos, alpha=1.0
+    ):
         """
         Renders all active bullets.
 
-        :param bullets_dict: A dictionary mapping bullet objects to their physics shapes.
+        :param bullets: A BulletRenderInfo instance with the names and positions of the bullets.
         :param sprite_loader: The SpriteLoader instance to use for getting bullet sprites.
         :param screen: The pygame Surface to render onto.
         :param settings: Dictionary containing game settings.
         :param player_pos: The current absolute position of the player.
+        :param alpha: Interpolation factor between the previous and current model step.
         :return: None
         """
         abs_camera_pos, rel_camera_pos = calc_camera_pos(settings, player_pos)
-        for bullet, shape in bullets_dict.items():
+        for name, previous_x, previous_y, x, y in zip(
+            bullets.names, bullets.previous_x, bullets.previous_y, bullets.x, bullets.y
+        ):
             self._handle_single_bullet(
                 abs_camera_pos=abs_camera_pos,
                 rel_camera_pos=rel_camera_pos,
-                bullet=bullet,
-                pos=shape.body.position,
+                name=name,
+                pos=interpolate((previous_x, previous_y), (x, y), alpha),
                 sprite_loader=sprite_loader,
                 screen=screen,
             )
 
     @staticmethod
     def _handle_single_bullet(
-        abs_camera_pos, rel_camera_pos, bullet, pos, sprite_loader, screen
+        abs_camera_pos, rel_camera_pos, name, pos, sprite_loader, screen
     ):
         """
         Renders a single bullet.
 
         :param abs_camera_pos: The absolute position of the camera.
         :param rel_camera_pos: The relative position of the camera on the screen.
-        :param bullet: The bullet object to render.
+        :param name: Type name of the bullet.
         :param pos: The absolute position of the bullet.
         :param sprite_loader: The SpriteLoader instance.
         :param screen: The pygame Surface to render onto.
         :return: None
         """
-        sprite = sprite_loader.get_sprite(bullet.name)
+        sprite = sprite_loader.get_sprite(name)
         bullet_relative_pos = convert_abs_to_rel(
             position=pos, abs_camera_pos=abs_camera_pos, rel_camera_pos=rel_camera_pos
         )
         screen.blit(sprite.image, sprite.image.get_rect(center=bullet_relative_pos))
 
     def render(
-        self, where_array: list[Where], sprite_loader, screen, settings, player_pos
+        self,
+        where_array: list[Where],
+        sprite_loader,
+        screen,
+        settings,
+        player_pos,
+        alpha=1.0,
     ):
         """
         Renders all game entities and their health bars.
@@ -125,27 +153,33 @@ class EntityRenderer:
         :param screen: The pygame Surface to render onto.
         :param settings: Dictionary containing game settings.
         :param player_pos: The current absolute position of the player.
+        :param alpha: Interpolation factor between the previous and current model step.
         :return: None
         """
         abs_camera_pos, rel_camera_pos = calc_camera_pos(settings, player_pos)
         for where in where_array:
+            position = interpolate(where.previous_position, where.position, alpha)
             self._handle_single_entity(
                 abs_camera_pos=abs_camera_pos,
                 rel_camera_pos=rel_camera_pos,
                 where=where,
+                position=position,
                 sprite_loader=sprite_loader,
                 settings=settings,
                 screen=screen,
             )
             self._handle_health_bar(
-                where, screen, abs_camera_pos, rel_camera_pos, settings
+                position, where, screen, abs_camera_pos, rel_camera_pos, settings
             )
 
     @staticmethod
-    def _handle_health_bar(where, screen, abs_camera_pos, rel_camera_pos, settings):
+    def _handle_health_bar(
+        position, where, screen, abs_camera_pos, rel_camera_pos, settings
+    ):
         """
         Renders the health bar for a single entity.
 
+        :param position: The interpolated absolute position of the entity.
         :param where: The Where object containing entity information.
         :param screen: The pygame Surface to render onto.
         :param abs_camera_pos: The absolute position of the camera.
@@ -154,7 +188,7 @@ class EntityRenderer:
         :return: None
         """
         ent_relative_pos = convert_abs_to_rel(
-            position=where.position,
+            position=position,
             abs_camera_pos=abs_camera_pos,
             rel_camera_pos=rel_camera_pos,
         )
@@ -180,7 +214,14 @@ class EntityRenderer:
         pygame.draw.rect(screen, color, health_bar_rect_filled)
 
     def _handle_single_entity(
-        self, abs_camera_pos, rel_camera_pos, where, sprite_loader, settings, screen
+        self,
+        abs_camera_pos,
+        rel_camera_pos,
+        where,
+        position,
+        sprite_loader,
+        settings,
+        screen,
     ):
         """
         Handles the rendering process for a single entity.
@@ -188,13 +229,14 @@ class EntityRenderer:
         :param abs_camera_pos: The absolute position of the camera.
         :param rel_camera_pos: The relative position of the camera on the screen.
         :param where: The Where object containing entity information.
+        :param position: The interpolated absolute position of the entity.
         :param sprite_loader: The SpriteLoader instance.
         :param settings: Dictionary containing game settings.
         :param screen: The pygame Surface to render onto.
         :return: None
         """
         ent_relative_pos = convert_abs_to_rel(
-            position=where.position,
+            position=position,
             abs_camera_pos=abs_camera_pos,
             rel_camera_pos=rel_camera_pos,
         )
@@ -208,11 +250,17 @@ class EntityRenderer:
         if ent_sprite is None:
             return
 
+        # the hitbox is at the current position, shift it along with the interpolation
+        vector = calc_vector(abs_camera_pos, rel_camera_pos)
+        vector = (
+            vector[0] + position[0] - where.position[0],
+            vector[1] + position[1] - where.position[1],
+        )
         ent_surface, ent_rect = self._prepare_entity(
             ent_relative_pos,
             ent_sprite,
             where,
-            calc_vector(abs_camera_pos, rel_camera_pos),
+            vector,
         )
 
         if where.arm_deg is None:
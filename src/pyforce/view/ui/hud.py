@@ -68,6 +68,23 @@ class GameUI:
         self.restart_menu = self._create_submenu("Restart?")
         self._add_restart_button()
 
+    def reset(self):
+        """
+        Returns the menus to their initial state for a new game. The username is kept.
+
+        :return: None
+        """
+        self.change_game_state = None
+        self.selected_gamemode = None
+        self.selected_difficulty = None
+        self.restart = None
+        self.save_score = False
+
+        self.menu.full_reset()
+        self.menu.enable()
+        self.pause_menu.full_reset()
+        self.save_menu.enable()
+
     def start_restart_mainloop(self):
         self.restart_menu.enable()
         self.restart_menu.mainloop(self.screen)
@@ -17,8 +17,10 @@ from pyforce.view.renderers import (
     MapRenderer,
     EffectsRenderer,
     calc_camera_pos,
+    interpolate,
 )
 from pyforce.view.loaders import SpriteLoader
+from pyforce.profiling import FrameProfiler
 
 from loguru import logger
 
@@ -39,13 +41,15 @@ class View:
         sprite_loader (SpriteLoader): Manages loading and caching of sprites.
         entity_renderer (EntityRenderer): Handles rendering of game entities.
         map_renderer (MapRenderer): Handles rendering of the game map.
+        profiler (FrameProfiler): Times the stages of render and is drawn by the show_fps overlay.
     """
 
-    def __init__(self, settings: dict):
+    def __init__(self, settings: dict, profiler: FrameProfiler | None = None):
         """
         Initializes the View with the given settings.
 
         :param settings: Dictionary containing game settings.
+        :param profiler: Optional FrameProfiler, a disabled one is created if None.
         :return: None
         """
         logger.info("Initializing view...")
@@ -64,6 +68,21 @@ class View:
         self.map_renderer = MapRenderer(self.size, self.settings)
         self.effects_renderer = EffectsRenderer(self.settings, self.screen)
 
+        if profiler is None:
+            profiler = FrameProfiler(
+                self.settings["debug"]["profiler"]["buffer_size"], enabled=False
+            )
+        self.profiler = profiler
+        self.profiler_font = None
+
+    def reset(self):
+        """
+        Prepares the view for a new game. The window, sprites and the map are kept.
+
+        :return: None
+        """
+        self.ui.reset()
+
     def render(self, info: RenderInfo):
         """
         Renders the entire game scene based on the current game state.
@@ -82,35 +101,53 @@ class View:
             pygame.display.flip()
             return
 
-        self.map_renderer.render(info.player_pos, self.screen, self.sprite_loader)
+        profiler = self.profiler
+        profiler.begin()
+
+        # the camera follows the interpolated player, player's Where instance is always the first
+        player_where = info.where_array[0]
+        player_pos = interpolate(
+            player_where.previous_position, player_where.position, info.alpha
+        )
+
+        self.map_renderer.render(player_pos, self.screen, self.sprite_loader)
+        profiler.mark("render.map")
         self.entity_renderer.render(
             info.where_array,
             self.sprite_loader,
             self.screen,
             self.settings,
-            info.player_pos,
+            player_pos,
+            info.alpha,
         )
+        profiler.mark("render.entities")
         self.entity_renderer.render_bullets(
-            info.bullets_dict,
+            info.bullets,
             self.sprite_loader,
             self.screen,
             self.settings,
-            info.player_pos,
+            player_pos,
+            info.alpha,
         )
+        profiler.mark("render.bullets")
         self.ui.render_player_stats(info.player_stats)
-        self.ui.render_player_weapons(
-            info.where_array[0], self.sprite_loader
-        )  # player's Where instance is always the first
-        self.effects_renderer.render(info.effects, info.player_pos)
+        self.ui.render_player_weapons(player_where, self.sprite_loader)
+        profiler.mark("render.hud")
+        self.effects_renderer.render(info.effects, player_pos, info.alpha)
+        profiler.mark("render.effects")
         self.effects_renderer.render_pickups(
-            info.pickups, self.sprite_loader, info.player_pos
+            info.pickups, self.sprite_loader, player_pos, info.alpha
         )
+        profiler.mark("render.pickups")
 
         # DEBUG DRAWING
-        self._render_debug_info(info.player_pos, info.debug_elements)
+        self._render_debug_info(player_pos, info.debug_elements)
         # DEBUG DRAWING
+        profiler.mark("render.debug")
 
         pygame.display.flip()
+        profiler.mark("render.flip")
+        profiler.end("render")
 
     def _render_debug_info(self, player_pos, debug_elements):
         """
@@ -133,11 +170,83 @@ class View:
             self._render_patrol_paths(debug_elements.patrol_paths, vector)
 
         if self.settings["debug"]["show_fps"]:
-            pass
+            self._render_profiler()
 
         if self.settings["debug"]["show_bbs"]:
             self._render_bbs(debug_elements.bbs)
 
+    def _render_profiler(self):
+        """
+        Renders the frame rate, rolling averages of all profiled stages and a frame time graph.
+
+        :return: None
+        """
+        settings = self.settings["debug"]["profiler"]
+        if self.profiler_font is None:
+            self.profiler_font = pygame.font.Font(
+                self.ui.theme.widget_font, settings["font_size"]
+            )
+
+        lines = [f"FPS: {self.profiler.fps():.1f}"]
+        for name, average in self.profiler.averages().items():
+            lines.append(f"{name}: {average:.2f} ms")
+
+        x, y = settings["position"]
+        line_offset = settings["line_offset"]
+        width = settings["width"]
+        graph_height = settings["graph_height"]
+
+        background = pygame.Surface(
+            (width, line_offset * len(lines) + graph_height + line_offset),
+            pygame.SRCALPHA,
+        )
+        background.fill(settings["background_color"])
+        self.screen.blit(background, (x, y))
+
+        for index, line in enumerate(lines):
+            text_surf = self.profiler_font.render(line, True, settings["font_color"])
+            self.screen.blit(text_surf, (x + 4, y + line_offset * index))
+
+        self._render_frame_graph(
+            pygame.Rect((x, y + line_offset * (len(lines) + 1)), (width, graph_height)),
+            settings,
+        )
+
+    def _render_frame_graph(self, rect, settings):
+        """
+        Renders the recorded frame times as a bar graph, twice the frame budget fills the rect.
+
+        :param rect: The pygame.Rect to draw the graph in.
+        :param settings: The profiler settings.
+        :return: None
+        """
+        frame_times = self.profiler.frame_times
+        if not frame_times:
+            return
+
+        budget = settings["graph_budget_ms"] / 1000
+        bar_width = max(rect.width / self.profiler.size, 1)
+
+        for index, frame_time in enumerate(frame_times):
+            height = min(frame_time / (2 * budget), 1) * rect.height
+            color = (
+                settings["over_budget_color"]
+                if frame_time > budget
+                else settings["graph_color"]
+            )
+            bar = pygame.Rect(
+                rect.left + index * bar_width, rect.bottom - height, bar_width, height
+            )
+            pygame.draw.rect(self.screen, color, bar)
+
+        # frame budget line
+        pygame.draw.line(
+            self.screen,
+            settings["font_color"],
+            (rect.left, rect.centery),
+            (rect.right, rect.centery),
+        )
+
     def _render_bbs(self, bbs):
         """
         Renders bounding boxes for debugging.
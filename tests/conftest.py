@@ -0,0 +1,23 @@
+"""
+Shared fixtures of the test suite. The game runs without a display, like the batch runner does.
+"""
+
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from pyforce.controller.json_manager import DEFAULTS_PATH
+
+
+@pytest.fixture
+def settings() -> dict:
+    """
+    Loads a fresh copy of the packaged settings, so a test can change them freely.
+
+    :return: Dictionary containing game settings.
+    """
+    with open(DEFAULTS_PATH, "r") as f:
+        return json.load(f)
@@ -0,0 +1,51 @@
+from pymunk import Vec2d
+
+from pyforce.model.weaponry import Ammo, Bullet, BulletPool
+from pyforce.structures import BasicBulletInfo
+
+
+def _info(bullet_id: int, x: float = 0) -> BasicBulletInfo:
+    return BasicBulletInfo(bullet_id, Vec2d(x, 100), 500, 10, "bullet")
+
+
+def _ammo() -> Ammo:
+    return Ammo(2500, 10, 1, 1, "bullet")
+
+
+def test_released_bullet_is_reset_for_the_next_shot(settings):
+    pool = BulletPool(settings)
+    ammo = _ammo()
+    bullet = pool.acquire(_info(1), 90, ammo)
+    bullet.body.position = (300, 300)
+    pool.release(bullet)
+
+    reused = pool.acquire(_info(2, x=50), 45, ammo)
+    fresh = Bullet(_info(3, x=50), 45, ammo, settings)
+
+    assert reused is bullet
+    assert reused.id == reused.shape.id == 2
+    assert reused.body.position == Vec2d(50, 100)
+    assert reused.body.velocity == fresh.body.velocity
+
+
+def test_bullets_are_kept_per_ammo_up_to_the_max_size(settings):
+    settings["physics"]["bullet_pool"]["max_size"] = 2
+    pool = BulletPool(settings)
+    ammo, other_ammo = _ammo(), _ammo()
+    bullets = [pool.acquire(_info(i), 90, ammo) for i in range(3)]
+
+    for bullet in bullets:
+        pool.release(bullet)
+
+    assert pool.free[ammo] == bullets[:2]
+    assert pool.acquire(_info(4), 90, other_ammo) not in bullets
+
+
+def test_disabled_pool_keeps_nothing(settings):
+    settings["physics"]["bullet_pool"]["enabled"] = False
+    pool = BulletPool(settings)
+    ammo = _ammo()
+
+    pool.release(pool.acquire(_info(1), 90, ammo))
+
+    assert pool.free == {}
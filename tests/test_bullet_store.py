@@ -0,0 +1,109 @@
+import random
+
+import pytest
+from pymunk import Body, Vec2d
+
+from pyforce.model.weaponry import bullet_store
+from pyforce.model.weaponry.bullet_store import BulletStore
+
+
+class FakeBullet:
+    def __init__(self, bullet_id: int, start: Vec2d, reach: float):
+        self.id = bullet_id
+        self.name = f"bullet-{bullet_id % 3}"
+        self.start_pos = start
+        self.reach = reach
+        self.body = Body(1, 1)
+        self.body.position = start
+
+
+def _play(seed: int) -> list:
+    """
+    Fires, moves, hits and expires bullets at random and logs what the store reports.
+
+    :return: A list of the store's answers.
+    """
+    rng = random.Random(seed)
+    store = BulletStore(capacity=4)
+    log = []
+    next_id = 0
+    for step in range(300):
+        for _ in range(rng.randint(0, 6)):
+            start = Vec2d(rng.uniform(0, 1000), rng.uniform(0, 600))
+            store.add(FakeBullet(next_id, start, rng.uniform(50, 400)), step)
+            next_id += 1
+
+        store.store_previous_positions()
+        for bullet in store.bullets:
+            bullet.body.position += (rng.uniform(-40, 40), rng.uniform(-40, 40))
+        store.sync_positions()
+        for bullet in rng.sample(store.bullets, len(store.bullets) // 8):
+            store.mark_collided(bullet)
+
+        removed = store.pop_expired(step, timeout=40)
+        log.append([bullet.id for bullet in removed])
+        log.append(store.get_render_info((200, 100, 800, 500)))
+        log.append(store.get_render_info())
+
+        assert all(store.bullets[bullet.row] is bullet for bullet in store.bullets)
+        assert not any(store.has_collided(bullet) for bullet in store.bullets)
+    return log
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """
+    Runs a test with the NumPy columns, when NumPy is installed, and with the list fallback.
+    """
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bullet_store, "np", None)
+
+
+def test_expired_bullets_are_removed_and_rows_stay_packed(backend):
+    store = BulletStore()
+    bullets = [FakeBullet(i, Vec2d(i * 10, 0), 100) for i in range(5)]
+    for step, bullet in enumerate(bullets):
+        store.add(bullet, step)
+
+    bullets[0].body.position = (0, 100)  # travelled its reach
+    store.sync_positions()
+    store.mark_collided(bullets[2])
+    removed = store.pop_expired(step=40, timeout=40)  # the first one timed out as well
+
+    assert removed == [bullets[0], bullets[2]]
+    # the removed rows are refilled from the end, in order
+    assert store.bullets == [bullets[3], bullets[1], bullets[4]]
+    assert [bullet.row for bullet in store.bullets] == [0, 1, 2]
+    assert store.get_render_info().x == [30, 10, 40]
+
+
+def test_render_info_interpolates_from_the_previous_positions(backend):
+    store = BulletStore()
+    bullet = FakeBullet(0, Vec2d(10, 20), 100)
+    store.add(bullet, 0)
+
+    store.store_previous_positions()
+    bullet.body.position = (30, 20)
+    store.sync_positions()
+    info = store.get_render_info((0, 0, 40, 40))
+
+    assert info.names == ["bullet-0"]
+    assert (info.previous_x, info.previous_y) == ([10], [20])
+    assert (info.x, info.y) == ([30], [20])
+    assert store.get_render_info((0, 0, 25, 25)).names == []
+
+
+def test_rows_stay_consistent(backend):
+    assert len(_play(seed=7)) == 900
+
+
+def test_numpy_and_python_fallback_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    with_numpy = _play(seed=8)
+
+    monkeypatch.setattr(bullet_store, "np", None)
+    without = _play(seed=8)
+
+    assert with_numpy == without
@@ -0,0 +1,70 @@
+import pytest
+
+from pyforce.maps import collision_cache
+from pyforce.maps.collision_cache import get_cache_path, load_collision_rects
+from pyforce.structures import CollisionRect
+
+MAP = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" width="10" height="10" tilewidth="48" tileheight="48">
+ <objectgroup id="1" name="platform_collisions">
+  <object id="1" x="0" y="432" width="480" height="48"/>
+  <object id="2" type="water" x="96" y="{water_y}" width="96" height="24"/>
+ </objectgroup>
+</map>
+"""
+
+
+@pytest.fixture
+def map_settings(settings, tmp_path) -> dict:
+    """
+    Points the settings to a small map in a temporary directory.
+
+    :return: Dictionary containing game settings.
+    """
+    (tmp_path / "map.tmx").write_text(MAP.format(water_y=400))
+    settings["map"]["map_path"] = str(tmp_path / "map.tmx")
+    return settings
+
+
+def test_rects_are_cached_next_to_the_map(map_settings, monkeypatch):
+    expected = [
+        CollisionRect(0, 432, 480, 48, None),
+        CollisionRect(96, 400, 96, 24, "water"),
+    ]
+    assert load_collision_rects(map_settings) == expected
+
+    def extract(*args):
+        raise AssertionError("the map was parsed again")
+
+    monkeypatch.setattr(collision_cache, "_extract_rects", extract)
+    assert load_collision_rects(map_settings) == expected
+
+
+def test_changed_map_invalidates_the_cache(map_settings, tmp_path):
+    load_collision_rects(map_settings)
+    (tmp_path / "map.tmx").write_text(MAP.format(water_y=384))
+
+    rects = load_collision_rects(map_settings)
+
+    assert rects[1] == CollisionRect(96, 384, 96, 24, "water")
+
+
+def test_truncated_cache_is_rebuilt(map_settings, tmp_path):
+    load_collision_rects(map_settings)
+    cache_path = get_cache_path(str(tmp_path / "map.tmx"))
+    with open(cache_path, "r+b") as f:
+        f.truncate(10)
+
+    assert len(load_collision_rects(map_settings)) == 2
+
+
+@pytest.mark.parametrize("map_name", ["map.tmx", "map2.tmx", "map3.tmx"])
+def test_streamed_rects_match_pytmx(settings, map_name):
+    settings["map"]["map_path"] = f"assets/map/{map_name}"
+    settings["map"]["collision_cache"] = False
+    from_pytmx = load_collision_rects(settings)
+
+    path = collision_cache.get_map_path(settings)
+    streamed = collision_cache._stream_rects(path, settings["map"]["object_layer_name"])
+
+    assert streamed == from_pytmx
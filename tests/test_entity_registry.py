@@ -0,0 +1,51 @@
+from pyforce.model.entities import EntityRegistry
+
+
+def _register(registry: EntityRegistry, obj) -> int:
+    ent_id = registry.allocate()
+    registry.bind(ent_id, obj)
+    return ent_id
+
+
+def test_get_finds_bound_objects():
+    registry = EntityRegistry()
+    player = _register(registry, "player")
+    goblin = _register(registry, "goblin")
+
+    assert registry.get(player) == "player"
+    assert registry.get(goblin) == "goblin"
+    assert len(registry) == 2
+
+
+def test_stale_id_does_not_find_the_object_reusing_its_slot():
+    registry = EntityRegistry()
+    old_id = _register(registry, "bullet")
+    registry.release(old_id)
+
+    new_id = _register(registry, "skeleton")
+
+    assert new_id != old_id
+    assert len(registry.slots) == 1
+    assert registry.get(old_id) is None
+    assert registry.get(new_id) == "skeleton"
+
+
+def test_releasing_a_stale_id_keeps_the_current_object():
+    registry = EntityRegistry()
+    old_id = _register(registry, "bullet")
+    registry.release(old_id)
+    new_id = _register(registry, "goblin")
+
+    registry.release(old_id)
+
+    assert registry.get(new_id) == "goblin"
+    assert len(registry) == 1
+    assert registry.free == []
+
+
+def test_unknown_ids_are_not_found():
+    registry = EntityRegistry()
+    _register(registry, "player")
+
+    assert registry.get(None) is None
+    assert registry.get(12345) is None
@@ -0,0 +1,48 @@
+import pytest
+
+from pyforce.controller import fixed_step_clock
+from pyforce.controller.fixed_step_clock import FixedStepClock
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """
+    Replaces the clock's time source with a value the test sets.
+
+    :return: A one-element list holding the current time.
+    """
+    current = [100.0]
+    monkeypatch.setattr(fixed_step_clock.time, "perf_counter", lambda: current[0])
+    return current
+
+
+def test_advance_runs_the_steps_due_and_keeps_the_remainder(now):
+    clock = FixedStepClock(time_step=0.25, max_steps=5)
+
+    now[0] += 0.875
+    assert clock.advance() == 3
+    assert clock.alpha() == 0.5
+
+    now[0] += 0.125
+    assert clock.advance() == 1
+    assert clock.alpha() == 0
+
+
+def test_advance_drops_the_backlog_beyond_max_steps(now):
+    clock = FixedStepClock(time_step=0.25, max_steps=5)
+
+    now[0] += 10.0
+    assert clock.advance() == 5
+    assert clock.alpha() < 1
+
+    now[0] += 0.25
+    assert clock.advance() == 1
+
+
+def test_hold_consumes_elapsed_time(now):
+    clock = FixedStepClock(time_step=0.25, max_steps=5)
+
+    now[0] += 10.0
+    clock.hold()
+    now[0] += 0.25
+    assert clock.advance() == 1
@@ -0,0 +1,45 @@
+import copy
+
+from pyforce.benchmark.scenarios import PATROL_AND_SHOOT
+from pyforce.controller import HeadlessController, ScriptedInput
+from pyforce.structures import FrameInput
+
+
+def _run(settings: dict, seed: int, frames: int) -> HeadlessController:
+    settings["debug"]["player_immortal"] = True
+    controller = HeadlessController(
+        settings, input_source=ScriptedInput(list(PATROL_AND_SHOOT)), seed=seed
+    )
+    controller.run(frames)
+    return controller
+
+
+def test_run_stops_at_frame_limit(settings):
+    controller = _run(settings, seed=1, frames=50)
+
+    assert controller.frames == 50
+    time_step = settings["physics"]["time_step"]
+    assert controller.player_stats.time_elapsed == 50 * time_step * 1000
+
+
+def test_same_seed_and_input_give_same_game(settings):
+    first = _run(copy.deepcopy(settings), seed=3, frames=300)
+    second = _run(copy.deepcopy(settings), seed=3, frames=300)
+
+    assert (
+        first.model.entities.get_player_pos() == second.model.entities.get_player_pos()
+    )
+    assert first.model.entities.steps == second.model.entities.steps
+    assert [e.get_position() for e in first.model.entities.enemies] == [
+        e.get_position() for e in second.model.entities.enemies
+    ]
+
+
+def test_scripted_input_loops_or_falls_back_to_default():
+    move = FrameInput(frozenset({"move_right"}), (1, 2))
+    looping = ScriptedInput([move], loop=True)
+    once = ScriptedInput([move], loop=False)
+
+    assert [looping.next_frame() for _ in range(3)] == [move, move, move]
+    assert once.next_frame() == move
+    assert once.next_frame() == once.default
@@ -0,0 +1,35 @@
+import json
+
+from pyforce.controller.json_manager import JSONManager, _merge_settings
+
+
+def test_merge_settings_keeps_defaults_missing_from_the_loaded_file():
+    defaults = {
+        "screen": {"size_x": 800, "size_y": 600},
+        "profiler": {"enabled": False},
+    }
+    loaded = {"screen": {"size_x": 1024}, "username": "tester"}
+
+    merged = _merge_settings(defaults, loaded)
+
+    assert merged == {
+        "screen": {"size_x": 1024, "size_y": 600},
+        "profiler": {"enabled": False},
+        "username": "tester",
+    }
+    assert defaults["screen"]["size_x"] == 800
+
+
+def test_load_fills_in_keys_added_since_the_file_was_saved(
+    settings, tmp_path, monkeypatch
+):
+    old_settings = {key: value for key, value in settings.items() if key != "replay"}
+    old_settings["debug"] = {"show_fps": True}
+    (tmp_path / "settings.json").write_text(json.dumps(old_settings))
+    monkeypatch.chdir(tmp_path)
+
+    manager = JSONManager()
+
+    assert manager.settings["replay"] == settings["replay"]
+    assert manager.settings["debug"]["show_fps"] is True
+    assert manager.settings["debug"]["profiler"] == settings["debug"]["profiler"]
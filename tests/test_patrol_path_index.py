@@ -0,0 +1,54 @@
+import random
+
+from pyforce.model.entities.enemies import PatrolPath, PatrolPathIndex
+
+
+def _linear_scan(paths: list[PatrolPath], x, y_range) -> list[PatrolPath]:
+    return [path for path in paths if path.is_in(x, y_range)]
+
+
+def _check_against_linear_scan(paths: list[PatrolPath], rng: random.Random):
+    index = PatrolPathIndex(paths)
+    max_x = max(path.end[0] for path in paths)
+    max_height = max(path.height for path in paths)
+    for _ in range(5000):
+        x = rng.randint(-50, max_x + 50)
+        bottom = rng.randint(0, max_height + 80)
+        y_range = (bottom, bottom - rng.randint(0, 80))
+
+        found = index.find(x, y_range)
+        containing = _linear_scan(paths, x, y_range)
+
+        if containing:
+            assert found in containing
+        else:
+            assert found is None
+
+
+def test_find_matches_linear_scan_on_random_paths():
+    rng = random.Random(4)
+    paths = []
+    for _ in range(60):
+        start = rng.randint(0, 900)
+        height = rng.choice([100, 200, 300, 400, 500, rng.randint(0, 600)])
+        paths.append(PatrolPath((start, start + rng.randint(0, 400)), height, 0))
+
+    _check_against_linear_scan(paths, rng)
+
+
+def test_find_matches_linear_scan_on_the_shipped_paths(settings):
+    paths = [
+        PatrolPath(path["x_range"], path["height"], path["offset"])
+        for path in settings["patrol_paths"]
+    ]
+
+    _check_against_linear_scan(paths, random.Random(5))
+
+
+def test_overlapping_path_is_found_behind_a_shorter_one():
+    long_path = PatrolPath((0, 500), 100, 0)
+    short_path = PatrolPath((10, 20), 100, 0)
+    index = PatrolPathIndex([long_path, short_path])
+
+    assert index.find(400, (120, 80)) is long_path
+    assert index.find(400, (99, 80)) is None
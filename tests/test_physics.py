@@ -0,0 +1,45 @@
+import pymunk
+
+from pyforce.model.physics import PhysicsEngine
+
+
+def _circle(engine: PhysicsEngine, collision_type: str, identifier: int, position):
+    body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
+    body.position = position
+    shape = pymunk.Circle(body, 10)
+    shape.collision_type = engine.settings["physics"]["collision_types"][collision_type]
+    shape.id = identifier
+    engine.sim.add(body, shape)
+    return shape
+
+
+def test_drain_events_returns_each_hit_once(settings):
+    engine = PhysicsEngine(settings)
+    _circle(engine, "bullet", 7, (-500, -500))
+    _circle(engine, "enemy", 3, (-500, -500))
+
+    engine.sim.step(settings["physics"]["time_step"])
+    events = engine.drain_events()
+    assert events.hits == [(3, 7)]
+    assert events.kills == []
+
+    engine.sim.step(settings["physics"]["time_step"])
+    events = engine.drain_events()
+    assert events.hits == []
+    assert events.kills == []
+
+
+def test_ground_contacts_persist_across_drains(settings):
+    engine = PhysicsEngine(settings)
+    _circle(engine, "enemy_feet", 4, (-500, -500))
+    _circle(engine, "platform", 0, (-500, -495))
+
+    engine.sim.step(settings["physics"]["time_step"])
+    engine.drain_events()
+    engine.sim.step(settings["physics"]["time_step"])
+    engine.drain_events()
+
+    assert engine.ground_contacts == {4: 1}
+
+    engine.reset()
+    assert engine.ground_contacts == {}
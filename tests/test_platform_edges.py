@@ -0,0 +1,55 @@
+import random
+
+import pymunk
+import pytest
+
+from pyforce.maps import PlatformEdges, load_collision_rects
+
+BOXES = [(0, 100, 200, 120), (150, 110, 300, 140), (400, 0, 420, 300)]
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        ((50, 50), (50, 200), True),
+        ((50, 50), (350, 50), False),
+        ((-10, 90), (500, 90), True),
+        ((250, 50), (350, 200), True),
+        ((310, 150), (390, 150), False),
+        ((0, 50), (0, 100), True),
+        ((500, 310), (-10, 310), False),
+    ],
+)
+def test_intersects(start, end, expected):
+    assert PlatformEdges(BOXES).intersects(start, end) is expected
+
+
+def test_matches_pymunk_segment_queries_on_a_map(settings):
+    boxes = [
+        (rect.x, rect.y, rect.x + rect.width, rect.y + rect.height)
+        for rect in load_collision_rects(settings)
+    ]
+    space = pymunk.Space()
+    for left, top, right, bottom in boxes:
+        box = pymunk.Poly.create_box_bb(
+            space.static_body, pymunk.BB(left, top, right, bottom)
+        )
+        space.add(box)
+    edges = PlatformEdges(boxes)
+    rng = random.Random(2)
+
+    def random_point():
+        while True:
+            x = rng.uniform(0, settings["map"]["size_x"])
+            y = rng.uniform(0, settings["map"]["size_y"])
+            if not any(
+                left <= x <= right and top <= y <= bottom
+                for left, top, right, bottom in boxes
+            ):
+                return x, y
+
+    for _ in range(2000):
+        start = random_point()
+        end = (start[0] + rng.uniform(-600, 600), start[1] + rng.uniform(-300, 300))
+        hit = space.segment_query_first(start, end, 0, pymunk.ShapeFilter())
+        assert edges.intersects(start, end) is (hit is not None), (start, end)
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from pyforce.maps import load_collision_rects, merge_rects
+from pyforce.structures import CollisionRect
+
+
+def _covering_types(rects: list[CollisionRect], x: float, y: float) -> set:
+    return {
+        rect.type
+        for rect in rects
+        if rect.x <= x <= rect.x + rect.width and rect.y <= y <= rect.y + rect.height
+    }
+
+
+def test_grid_of_tiles_becomes_one_rect():
+    tiles = [CollisionRect(x * 48, y * 48, 48, 48) for x in range(5) for y in range(3)]
+
+    assert merge_rects(tiles) == [CollisionRect(0, 0, 240, 144)]
+
+
+def test_fractional_edges_within_epsilon_touch():
+    rects = [CollisionRect(0, 10, 24.3333, 5), CollisionRect(24.3335, 10, 10, 5)]
+
+    assert merge_rects(rects) == [CollisionRect(0, 10, 34.3335, 5)]
+
+
+def test_gaps_types_and_misaligned_rows_are_kept_apart():
+    rects = [
+        CollisionRect(0, 0, 48, 48),
+        CollisionRect(50, 0, 48, 48),
+        CollisionRect(98, 0, 48, 48, "water"),
+        CollisionRect(146, 8, 48, 48),
+    ]
+
+    assert sorted(merge_rects(rects), key=lambda rect: rect.x) == rects
+
+
+@pytest.mark.parametrize("map_name", ["map.tmx", "map2.tmx", "map3.tmx"])
+def test_merged_map_covers_the_same_area(settings, map_name):
+    settings["map"]["map_path"] = f"assets/map/{map_name}"
+    rects = load_collision_rects(settings)
+    merged = merge_rects(rects)
+    rng = random.Random(map_name)
+
+    assert len(merged) <= len(rects)
+    for _ in range(2000):
+        x = rng.uniform(0, settings["map"]["size_x"])
+        y = rng.uniform(0, settings["map"]["size_y"])
+        assert _covering_types(merged, x, y) == _covering_types(rects, x, y)
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from pyforce.benchmark.scenarios import PATROL_AND_SHOOT
+from pyforce.constants import Difficulty, GameMode
+from pyforce.controller.replay import (
+    MAX_RUN,
+    ReplayReader,
+    encode_replay,
+    load_replay,
+    play_replay,
+    save_replay,
+)
+from pyforce.structures import FrameInput, Replay
+
+
+def _frames(count: int) -> list[FrameInput]:
+    rng = random.Random(1)
+    frames = []
+    for i in range(count):
+        frame_input = PATROL_AND_SHOOT[i % len(PATROL_AND_SHOOT)]
+        if i % 97 == 0:
+            mouse_pos = (rng.randint(-100, 1000), rng.randint(0, 600))
+            frame_input = FrameInput(frame_input.actions | {"jump"}, mouse_pos)
+        frames.append(frame_input)
+    return frames
+
+
+def test_encoded_replay_decodes_to_the_same_replay():
+    replay = Replay(
+        seed=1234,
+        difficulty=Difficulty.HARD,
+        game_mode=GameMode.INFINITE,
+        map_name="map2.tmx",
+        frames=_frames(1000),
+    )
+
+    reader = ReplayReader(encode_replay(replay, keyframe_interval=64))
+
+    assert reader.to_replay() == replay
+    assert reader.frame_count == 1000
+    assert len(reader.offsets) == 16
+
+
+@pytest.mark.parametrize("start", [0, 1, 63, 64, 65, 500, 999, 1000])
+def test_frames_seeks_from_any_frame(start):
+    frames = _frames(1000)
+    reader = ReplayReader(encode_replay(Replay(seed=1, frames=frames), 64))
+
+    assert list(reader.frames(start)) == frames[start:]
+
+
+def test_run_as_long_as_the_largest_keyframe_interval():
+    frames = [FrameInput()] * (MAX_RUN + 10)
+    reader = ReplayReader(encode_replay(Replay(seed=1, frames=frames), MAX_RUN))
+
+    assert list(reader.frames()) == frames
+    assert list(reader.frames(MAX_RUN + 5)) == frames[MAX_RUN + 5 :]
+
+
+def test_reader_rejects_other_files():
+    with pytest.raises(ValueError):
+        ReplayReader(b"\x00" * 64)
+
+
+def test_saved_replay_plays_back_with_the_same_result(settings, tmp_path):
+    settings["debug"]["player_immortal"] = True
+    replay = Replay(seed=5, frames=_frames(300))
+    path = tmp_path / "replays" / "game.pfr"
+
+    save_replay(str(path), replay, keyframe_interval=60)
+    loaded = load_replay(str(path))
+    first = play_replay(loaded, settings)
+    second = play_replay(replay, settings)
+
+    assert loaded == replay
+    assert first["frames"] == second["frames"] == 300
+    assert first["killed_enemies"] == second["killed_enemies"]
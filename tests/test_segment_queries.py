@@ -0,0 +1,73 @@
+from pymunk import Vec2d
+
+from pyforce.constants import AmmoMode
+from pyforce.controller import HeadlessController
+from pyforce.model.weaponry import Ammo
+from pyforce.structures import BasicBulletInfo
+
+
+def _setup(settings):
+    model = HeadlessController(settings, seed=1).model
+    model.entities.spawn_random_enemy()
+    enemy = max(model.entities.enemies, key=lambda enemy: enemy.ent_id)
+    return model, enemy
+
+
+def _fire(model, start: Vec2d, mode: AmmoMode, reach: float = 1000):
+    """
+    Fires a bullet to the right, the way EntityManager.get_bullet adds it.
+    """
+    entities = model.entities
+    ammo = Ammo(2500, 10, 1, 1, "bullet", mode)
+    info = BasicBulletInfo(entities.registry.allocate(), start, reach, 10, "bullet")
+    bullet = entities.bullet_pool.acquire(info, 90, ammo)
+    entities.registry.bind(bullet.id, bullet)
+    entities.bullet_store.add(bullet, entities.steps)
+    entities.bullets_dict[bullet] = bullet.shape
+    return bullet
+
+
+def test_hitscan_hit_is_recorded_and_resolved_once(settings):
+    model, enemy = _setup(settings)
+    entities = model.entities
+    bullet = _fire(model, enemy.body.position - (60, 0), AmmoMode.HITSCAN)
+    health = enemy.health
+
+    entities.fire_hitscan(bullet, model.physics.events)
+    hits = model.physics.drain_events().hits
+    entities.handle_hits(hits + hits, model.physics.sim)
+
+    assert hits == [(enemy.ent_id, bullet.id)]
+    assert enemy.health == health - 10
+    assert entities.bullet_store.has_collided(bullet)
+
+    entities.update_bullets()
+    assert bullet not in entities.bullets_dict
+    assert entities.registry.get(bullet.id) is None
+    assert len(entities.bullet_store) == 0
+
+
+def test_hitscan_miss_is_removed_without_a_hit(settings):
+    model, enemy = _setup(settings)
+    entities = model.entities
+    bullet = _fire(model, enemy.body.position + (60, -200), AmmoMode.HITSCAN, reach=10)
+
+    entities.fire_hitscan(bullet, model.physics.events)
+
+    assert model.physics.drain_events().hits == []
+    assert entities.bullet_store.has_collided(bullet)
+    assert bullet.body.position == bullet.start_pos + (10, 0)
+
+
+def test_swept_bullet_hits_the_enemy_in_its_path(settings):
+    model, enemy = _setup(settings)
+    entities = model.entities
+    bullet = _fire(model, enemy.body.position - (100, 0), AmmoMode.SWEPT)
+    time_step = settings["physics"]["time_step"]
+
+    # 40 px per step, the enemy's body is reached by the segment of the second step
+    entities.sweep_bullets(model.physics.events, time_step)
+    entities.sweep_bullets(model.physics.events, time_step)
+
+    assert model.physics.drain_events().hits == [(enemy.ent_id, bullet.id)]
+    assert bullet.body.position.x < enemy.body.position.x
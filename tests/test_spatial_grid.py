@@ -0,0 +1,94 @@
+import random
+
+from pyforce.controller import HeadlessController
+from pyforce.model.spatial import SpatialGrid
+
+
+def _random_boxes(rng: random.Random, count: int) -> list[tuple]:
+    boxes = []
+    for i in range(count):
+        left, top = rng.uniform(-200, 2000), rng.uniform(-200, 1000)
+        width, height = rng.choice([0, rng.uniform(0, 300)]), rng.uniform(0, 100)
+        boxes.append((i, left, top, left + width, top + height))
+    return boxes
+
+
+def _overlaps(box, left, top, right, bottom) -> bool:
+    _, box_left, box_top, box_right, box_bottom = box
+    return not (
+        box_right < left or box_left > right or box_bottom < top or box_top > bottom
+    )
+
+
+def _distance_squared(box, x, y) -> float:
+    _, left, top, right, bottom = box
+    dx = max(left - x, 0, x - right)
+    dy = max(top - y, 0, y - bottom)
+    return dx * dx + dy * dy
+
+
+def test_queries_match_a_linear_scan():
+    rng = random.Random(6)
+    boxes = _random_boxes(rng, 300)
+    grid = SpatialGrid(cell_size=128)
+    for box in boxes:
+        grid.insert("enemy", *box)
+
+    for _ in range(300):
+        left, top = rng.uniform(-300, 2000), rng.uniform(-300, 1000)
+        rect = (left, top, left + rng.uniform(0, 900), top + rng.uniform(0, 500))
+        found = grid.query_rect("enemy", *rect)
+        assert len(found) == len(set(found))
+        assert set(found) == {box[0] for box in boxes if _overlaps(box, *rect)}
+
+        x, y, radius = rng.uniform(0, 1800), rng.uniform(0, 800), rng.uniform(0, 400)
+        found = grid.query_radius("enemy", x, y, radius)
+        assert len(found) == len(set(found))
+        assert set(found) == {
+            box[0] for box in boxes if _distance_squared(box, x, y) <= radius**2
+        }
+
+
+def test_kinds_and_clear():
+    grid = SpatialGrid(cell_size=64)
+    grid.insert_point("pickup", "medkit", 10, 10)
+    grid.insert("enemy", "goblin", 0, 0, 20, 20)
+
+    assert grid.query_rect("pickup", 0, 0, 100, 100) == ["medkit"]
+    assert grid.query_radius("enemy", 30, 10, 10) == ["goblin"]
+    assert grid.query_rect("particle", 0, 0, 100, 100) == []
+
+    grid.clear()
+    assert grid.query_rect("enemy", 0, 0, 100, 100) == []
+
+
+def test_spawned_enemy_is_indexed_before_the_next_rebuild(settings):
+    model = HeadlessController(settings, seed=2).model
+    model.update((0, 0))
+
+    model.entities.spawn_random_enemy()
+
+    for enemy in model.entities.enemies:
+        bb = enemy.shape.cache_bb()
+        assert enemy in model.spatial_index.query_rect(
+            "enemy", bb.left, bb.bottom, bb.right, bb.top
+        )
+
+
+def test_where_array_holds_the_player_and_the_enemies_in_view(settings):
+    model = HeadlessController(settings, seed=2).model
+    for _ in range(30):
+        model.entities.spawn_random_enemy()
+    model.update((0, 0))
+
+    left, top, right, bottom = model._get_view_rect()
+    in_view = 0
+    for enemy in model.entities.enemies:
+        bb = enemy.shape.cache_bb()
+        if not (
+            bb.right < left or bb.left > right or bb.top < top or bb.bottom > bottom
+        ):
+            in_view += 1
+
+    assert 0 < in_view < len(model.entities.enemies)
+    assert len(model.where_array) == 1 + in_view